@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Literal
 
 from src.utils.azure_document_intelligence import classify_document
+from src.utils.document_intelligence_gateway import DocumentSource
 
 
 @dataclass
@@ -13,8 +14,8 @@ class DocumentClassification:
 
 
 class DocumentClassifierAgent:
-    async def classify(self, document_bytes: bytes) -> DocumentClassification:
-        response = await classify_document(document_bytes)
+    async def classify(self, document: DocumentSource) -> DocumentClassification:
+        response = await classify_document(document)
         prediction = response.get("prediction", {})
         doc_type = prediction.get("label", "datasheet")
         confidence = float(prediction.get("confidence", 0.5))
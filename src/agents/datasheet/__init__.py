@@ -1,7 +1,11 @@
+import asyncio
 import json
 from pathlib import Path
 from typing import Any, Dict
 
+from src.utils.spooled_document import SpooledDocument
+from src.utils.stages import stage
+
 from .vision_agent.agent import VisionExtractionAgent
 from .validation_agent.agent import ValidationAgent
 from .schema_agent.agent import SchemaComplianceAgent
@@ -9,6 +13,10 @@ from .aggregator_agent.agent import AggregatorAgent
 from .graph_agent.agent import GraphIngestionAgent
 
 
+def _write_json(path: Path, data: Any) -> None:
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+
+
 class DataSheetAgentPipeline:
     def __init__(self) -> None:
         self.vision = VisionExtractionAgent()
@@ -17,19 +25,23 @@ class DataSheetAgentPipeline:
         # self.aggregator = AggregatorAgent()
         self.graph = GraphIngestionAgent()
 
-    async def run(self, document_bytes: bytes, workdir: Path, asset_type: str, database: str | None = None) -> Dict[str, Any]:
-        pdf_path = workdir / "input.pdf"
-        pdf_path.write_bytes(document_bytes)
+    async def run(self, document: SpooledDocument, workdir: Path, asset_type: str, database: str | None = None) -> Dict[str, Any]:
+        pdf_path = document.path
 
         outputs_dir = Path("outputs")
         outputs_dir.mkdir(exist_ok=True)
         base_name = pdf_path.stem
 
-        pages = await self.vision.run(pdf_path, asset_type)
+        async with stage("vision"):
+            pages = await self.vision.run(pdf_path, asset_type)
         (outputs_dir / f"{base_name}_vision.json").write_text(json.dumps(pages, indent=2, ensure_ascii=False))
 
-        validated = await self.validator.run(pages)
-        (outputs_dir / f"{base_name}_validated.json").write_text(json.dumps(validated, indent=2, ensure_ascii=False))
+        async with stage("validate"):
+            validated = await self.validator.run(pages)
+        # Written alongside graph ingestion rather than before it.
+        validated_dump = asyncio.create_task(
+            asyncio.to_thread(_write_json, outputs_dir / f"{base_name}_validated.json", validated)
+        )
 
         # schema_aligned = await self.schema.run(asset_type, validated)
         # (outputs_dir / f"{base_name}_schema.json").write_text(json.dumps(schema_aligned, indent=2, ensure_ascii=False))
@@ -37,5 +49,9 @@ class DataSheetAgentPipeline:
         # adm = await self.aggregator.run(schema_aligned)
         # (outputs_dir / f"{base_name}_adm.json").write_text(json.dumps(adm, indent=2, ensure_ascii=False))
 
-        graph_result = await self.graph.run(validated, database)
+        async with stage("graph"):
+            graph_result = await self.graph.run(
+                validated, database, document_id=document.filename
+            )
+        await validated_dump
         return {"adm": validated, "graph": graph_result}
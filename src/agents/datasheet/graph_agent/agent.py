@@ -1,9 +1,10 @@
 """Graph ingestion agent for datasheet ADM."""
 
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 
-from src.utils.neo4j_client import ingest_adm
+from src.config.settings import get_settings
+from src.utils.neo4j_client import ingest_graph_batches, ingest_graph_diff
 
 CATEGORIES = [
     "metadata",
@@ -38,95 +39,198 @@ CATEGORIES = [
 ]
 
 
+CATEGORY_ORDER = {category: index for index, category in enumerate(CATEGORIES)}
+
+GraphBatch = Dict[str, List[Dict[str, Any]]]
+# Node rows of a category: (id suffix, node fields, relationship type).
+CategoryRows = Tuple[Any, List[Tuple[str, Dict[str, Any], str]]]
+
+
 def _serialize(value: Any) -> Any:
     if value is None or isinstance(value, (str, int, float, bool)):
         return value
     return json.dumps(value, ensure_ascii=False)
 
 
+def _asset_tag(doc: Dict[str, Any], doc_index: int) -> str:
+    metadata = doc.get("metadata") or {}
+    return (
+        metadata.get("tag")
+        or metadata.get("document_number")
+        or metadata.get("equipment_name")
+        or f"datasheet-{doc_index}"
+    )
+
+
+def _document_id(doc: Dict[str, Any]) -> str | None:
+    metadata = doc.get("metadata") or {}
+    return metadata.get("document_number") or metadata.get("uuid")
+
+
+def _category_rows(data: Any) -> CategoryRows:
+    """Serialize a category once: its own value and its child nodes."""
+    children = []
+    if isinstance(data, dict):
+        children = [
+            (
+                f"{key}",
+                {"label": "Detail", "key": key, "value": _serialize(value)},
+                "HAS_DETAIL",
+            )
+            for key, value in data.items()
+        ]
+    elif isinstance(data, list):
+        children = [
+            (
+                f"item-{list_idx}",
+                {"label": "Entry", "data": _serialize(entry)},
+                "HAS_ENTRY",
+            )
+            for list_idx, entry in enumerate(data)
+        ]
+    return _serialize(data), children
+
+
+def _equipment_category_rows(
+    doc: Dict[str, Any],
+    own: Dict[str, Any],
+    category: str,
+    shared_rows: Dict[str, CategoryRows],
+) -> CategoryRows | None:
+    """Rows of `category` for one equipment: its own data, else the document's."""
+    data = own.get(category)
+    if data is not None:
+        return _category_rows(data) if data else None
+    if not doc.get(category):
+        return None
+    if category not in shared_rows:
+        shared_rows[category] = _category_rows(doc[category])
+    return shared_rows[category]
+
+
 class GraphIngestionAgent:
-    async def run(self, adm: Any, database: str | None = None) -> Dict[str, Any]:
-        graph_payload = self._build_graph_payload(adm)
-        return await ingest_adm(graph_payload, database)
+    async def run(
+        self,
+        adm: Any,
+        database: str | None = None,
+        diff: bool | None = None,
+        dry_run: bool = False,
+        document_id: str | None = None,
+    ) -> Dict[str, Any]:
+        """Ingest `adm`; `diff` (default ``NEO4J_DIFF_INGEST``) writes only changes.
 
-    def _build_graph_payload(self, adm: Any) -> Dict[str, Any]:
-        nodes: List[Dict[str, Any]] = []
-        relationships: List[Dict[str, Any]] = []
-        visited_ids = set()
+        `dry_run` implies `diff` and returns what would change without writing.
+        `document_id` names the source data sheet for the diff scope.
+        """
+        settings = get_settings()
+        batches = self.iter_graph_batches(adm, settings.neo4j_batch_size)
+        if dry_run or (settings.neo4j_diff_ingest if diff is None else diff):
+            scope = self.graph_scope(adm, document_id)
+            return await ingest_graph_diff(batches, scope, database, dry_run=dry_run)
+        return await ingest_graph_batches(batches, database)
+
+    def graph_scope(self, adm: Any, document_id: str | None = None) -> str:
+        """Diff-ingestion scope: the source documents and the asset ids they hang off.
 
+        Two data sheets for the same asset get separate manifests, so
+        re-ingesting one never deletes the other's nodes. Without `document_id`
+        each document's ``metadata.document_number`` (or ``uuid``) is used.
+        """
         documents = adm if isinstance(adm, list) else [adm]
+        keys = set()
         for doc_index, doc in enumerate(documents):
             if not isinstance(doc, dict):
                 continue
-            metadata = doc.get("metadata") or {}
-            asset_tag = (
-                metadata.get("tag")
-                or metadata.get("document_number")
-                or metadata.get("equipment_name")
-                or f"datasheet-{doc_index}"
-            )
-            asset_id = f"asset::{asset_tag}"
-            if asset_id not in visited_ids:
-                asset_node = {"id": asset_id, "label": "Asset", **metadata}
-                nodes.append(asset_node)
-                visited_ids.add(asset_id)
-
-            equipments = doc.get("equipments") or [{}]
-            for idx, equipment in enumerate(equipments):
-                equipment = equipment or {}
-                eq_name = equipment.get("equipment_name") or f"{asset_tag}-equipment-{idx}"
-                eq_id = f"equipment::{eq_name}"
-                if eq_id not in visited_ids:
-                    eq_node = {"id": eq_id, "label": "Equipment", **equipment}
-                    nodes.append(eq_node)
-                    visited_ids.add(eq_id)
-                relationships.append({"start": asset_id, "end": eq_id, "type": "HAS_EQUIPMENT"})
-
-                for category in CATEGORIES:
-                    data = equipment.get(category) if isinstance(equipment, dict) else None
-                    if data is None:
-                        data = doc.get(category)
-                    if not data:
-                        continue
-
-                    category_id = f"{eq_id}::{category}"
-                    if category_id not in visited_ids:
-                        category_node = {
-                            "id": category_id,
-                            "label": "Category",
-                            "category": category,
-                            "data": _serialize(data),
-                        }
-                        nodes.append(category_node)
-                        visited_ids.add(category_id)
-                    relationships.append({"start": eq_id, "end": category_id, "type": "HAS_CATEGORY"})
-
-                    if isinstance(data, dict):
-                        for key, value in data.items():
-                            detail_id = f"{category_id}::{key}"
-                            if detail_id in visited_ids:
-                                continue
-                            detail_node = {
-                                "id": detail_id,
-                                "label": "Detail",
-                                "key": key,
-                                "value": _serialize(value),
-                            }
-                            nodes.append(detail_node)
-                            visited_ids.add(detail_id)
-                            relationships.append({"start": category_id, "end": detail_id, "type": "HAS_DETAIL"})
-                    elif isinstance(data, list):
-                        for list_idx, entry in enumerate(data):
-                            entry_id = f"{category_id}::item-{list_idx}"
-                            if entry_id in visited_ids:
-                                continue
-                            entry_node = {
-                                "id": entry_id,
-                                "label": "Entry",
-                                "data": _serialize(entry),
-                            }
-                            nodes.append(entry_node)
-                            visited_ids.add(entry_id)
-                            relationships.append({"start": category_id, "end": entry_id, "type": "HAS_ENTRY"})
+            key = f"asset::{_asset_tag(doc, doc_index)}"
+            source = document_id or _document_id(doc)
+            keys.add(f"document::{source}/{key}" if source else key)
+        return "datasheet-graph::" + "|".join(sorted(keys))
+
+    def iter_graph_batches(
+        self, adm: Any, batch_size: int = 500
+    ) -> Iterator[GraphBatch]:
+        """Yield the graph payload in batches of about `batch_size` rows.
 
+        Nodes always come before the relationships that reference them, so
+        batches can be written as they are produced.
+        """
+        batch: GraphBatch = {"nodes": [], "relationships": []}
+        rows = 0
+        for kind, row in self._walk(adm):
+            batch[kind].append(row)
+            rows += 1
+            if rows >= batch_size:
+                yield batch
+                batch = {"nodes": [], "relationships": []}
+                rows = 0
+        if rows:
+            yield batch
+
+    def _build_graph_payload(self, adm: Any) -> GraphBatch:
+        nodes: List[Dict[str, Any]] = []
+        relationships: List[Dict[str, Any]] = []
+        for kind, row in self._walk(adm):
+            (nodes if kind == "nodes" else relationships).append(row)
         return {"nodes": nodes, "relationships": relationships}
+
+    def _walk(self, adm: Any) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        visited_ids: set = set()
+        documents = adm if isinstance(adm, list) else [adm]
+        for doc_index, doc in enumerate(documents):
+            if isinstance(doc, dict):
+                yield from self._walk_document(doc, doc_index, visited_ids)
+
+    def _walk_document(
+        self, doc: Dict[str, Any], doc_index: int, visited_ids: set
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        metadata = doc.get("metadata") or {}
+        asset_tag = _asset_tag(doc, doc_index)
+        asset_id = f"asset::{asset_tag}"
+        if asset_id not in visited_ids:
+            yield "nodes", {"id": asset_id, "label": "Asset", **metadata}
+            visited_ids.add(asset_id)
+
+        # Document-level categories apply to every equipment that lacks its
+        # own; they are serialized on first use and shared after that.
+        shared = {category for category in doc if category in CATEGORY_ORDER}
+        shared_rows: Dict[str, CategoryRows] = {}
+
+        equipments = doc.get("equipments") or [{}]
+        for idx, equipment in enumerate(equipments):
+            equipment = equipment or {}
+            eq_name = equipment.get("equipment_name") or f"{asset_tag}-equipment-{idx}"
+            eq_id = f"equipment::{eq_name}"
+            if eq_id not in visited_ids:
+                yield "nodes", {"id": eq_id, "label": "Equipment", **equipment}
+                visited_ids.add(eq_id)
+            yield "relationships", {"start": asset_id, "end": eq_id, "type": "HAS_EQUIPMENT"}
+
+            own = equipment if isinstance(equipment, dict) else {}
+            present = shared.union(key for key in own if key in CATEGORY_ORDER)
+            for category in sorted(present, key=CATEGORY_ORDER.__getitem__):
+                rows = _equipment_category_rows(doc, own, category, shared_rows)
+                if rows is not None:
+                    yield from self._walk_category(eq_id, category, rows, visited_ids)
+
+    def _walk_category(
+        self, eq_id: str, category: str, rows: CategoryRows, visited_ids: set
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        serialized, children = rows
+        category_id = f"{eq_id}::{category}"
+        if category_id not in visited_ids:
+            yield "nodes", {
+                "id": category_id,
+                "label": "Category",
+                "category": category,
+                "data": serialized,
+            }
+            visited_ids.add(category_id)
+        yield "relationships", {"start": eq_id, "end": category_id, "type": "HAS_CATEGORY"}
+
+        for suffix, fields, rel_type in children:
+            child_id = f"{category_id}::{suffix}"
+            if child_id in visited_ids:
+                continue
+            yield "nodes", {"id": child_id, **fields}
+            visited_ids.add(child_id)
+            yield "relationships", {"start": category_id, "end": child_id, "type": rel_type}
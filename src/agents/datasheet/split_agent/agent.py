@@ -1,11 +1,37 @@
-"""Splits PDFs into page-level PNGs."""
+"""Splits PDFs into page-level images."""
 
+import asyncio
 from pathlib import Path
-from typing import List
+from typing import AsyncIterator, List, Optional
 
-from src.utils.pdf import pdf_to_images
+from src.utils.pdf import spooled_pdf
+from src.utils.rasterizer import PageRasterizer, get_rasterizer
+from src.utils.spooled_document import SpooledDocument
 
 
 class PdfSplitterAgent:
-    async def run(self, document_bytes: bytes, workdir: Path) -> List[Path]:
-        return pdf_to_images(document_bytes, workdir)
+    def __init__(self, rasterizer: Optional[PageRasterizer] = None) -> None:
+        self.rasterizer = rasterizer or get_rasterizer()
+
+    async def stream(
+        self, document: SpooledDocument | bytes, workdir: Path
+    ) -> AsyncIterator[Path]:
+        """Yield page image paths as pages finish rendering."""
+        await asyncio.to_thread(workdir.mkdir, parents=True, exist_ok=True)
+        if isinstance(document, SpooledDocument):
+            async for image_path in self._stream_path(document.path, workdir):
+                yield image_path
+            return
+        with spooled_pdf(document) as pdf_path:
+            async for image_path in self._stream_path(pdf_path, workdir):
+                yield image_path
+
+    async def _stream_path(self, pdf_path: Path, workdir: Path) -> AsyncIterator[Path]:
+        async for page in self.rasterizer.stream_pages(pdf_path):
+            image_path = workdir / f"page-{page.index+1}.{page.image_format}"
+            await asyncio.to_thread(image_path.write_bytes, page.data)
+            yield image_path
+
+    async def run(self, document: SpooledDocument | bytes, workdir: Path) -> List[Path]:
+        image_paths = [path async for path in self.stream(document, workdir)]
+        return sorted(image_paths, key=lambda path: int(path.stem.split("-")[1]))
@@ -0,0 +1,107 @@
+"""Batch submission endpoints: many documents per request, run in the background."""
+
+import asyncio
+import json
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+
+from src.orchestrator.batch import BatchJob, BatchQueueFull, BatchScheduler
+from src.utils.spooled_document import SpooledDocument
+
+
+def _is_zip(upload: UploadFile) -> bool:
+    return (upload.filename or "").lower().endswith(".zip") or (
+        upload.content_type in ("application/zip", "application/x-zip-compressed")
+    )
+
+
+def _spool_upload(job: BatchJob, upload: UploadFile) -> None:
+    """Write an upload (or each PDF inside an uploaded zip) into the job."""
+    if not _is_zip(upload):
+        document = job.add_document(upload.filename or "document.pdf")
+        document.spooled = SpooledDocument.from_file(
+            upload.file, document.path, document.filename
+        )
+        return
+    try:
+        archive = zipfile.ZipFile(upload.file)
+    except zipfile.BadZipFile as exc:
+        raise HTTPException(
+            status_code=400, detail=f"{upload.filename} is not a valid zip"
+        ) from exc
+    with archive:
+        for member in archive.infolist():
+            if member.is_dir() or not member.filename.lower().endswith(".pdf"):
+                continue
+            document = job.add_document(Path(member.filename).name)
+            with archive.open(member) as source:
+                document.spooled = SpooledDocument.from_file(
+                    source, document.path, document.filename
+                )
+
+
+async def _submit_batch(
+    scheduler: BatchScheduler,
+    default_payload: Optional[Dict[str, Any]],
+    files: List[UploadFile],
+    payload: Optional[str],
+) -> Dict[str, Any]:
+    try:
+        job_payload = json.loads(payload) if payload else {}
+    except json.JSONDecodeError as exc:
+        raise HTTPException(
+            status_code=400, detail="payload must be valid JSON"
+        ) from exc
+    job = scheduler.new_job(job_payload or dict(default_payload or {}))
+    try:
+        for upload in files:
+            # Uploads are already spooled by Starlette; copy them off the loop.
+            await asyncio.to_thread(_spool_upload, job, upload)
+        if not job.documents:
+            raise HTTPException(status_code=400, detail="no PDF documents found")
+        await scheduler.submit(job)
+    except BatchQueueFull as exc:
+        scheduler.discard(job)
+        raise HTTPException(status_code=429, detail=str(exc)) from exc
+    except Exception:
+        scheduler.discard(job)
+        raise
+    return {
+        "job_id": job.job_id,
+        "documents": [
+            {"document_id": doc.document_id, "filename": doc.filename}
+            for doc in job.documents.values()
+        ],
+    }
+
+
+def _job_or_404(scheduler: BatchScheduler, job_id: str) -> BatchJob:
+    job = scheduler.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"unknown batch {job_id}")
+    return job
+
+
+def create_batch_router(
+    scheduler: BatchScheduler, default_payload: Optional[Dict[str, Any]] = None
+) -> APIRouter:
+    router = APIRouter(prefix="/batches", tags=["batches"])
+
+    @router.post("", status_code=202)
+    async def submit_batch(
+        files: List[UploadFile] = File(...), payload: Optional[str] = Form(None)
+    ):
+        return await _submit_batch(scheduler, default_payload, files, payload)
+
+    @router.get("/{job_id}")
+    async def batch_status(job_id: str):
+        return _job_or_404(scheduler, job_id).progress()
+
+    @router.get("/{job_id}/results")
+    async def batch_results(job_id: str):
+        return _job_or_404(scheduler, job_id).results()
+
+    return router
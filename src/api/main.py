@@ -12,7 +12,11 @@ from src.agents.classifier import DocumentClassifierAgent
 # from src.agents.control_narrative import ControlNarrativeAgent
 from src.agents.datasheet import DataSheetAgentPipeline
 from src.agents.datasheet.graph_agent.agent import GraphIngestionAgent
+from src.api.batches import create_batch_router
+from src.config.settings import get_settings
+from src.orchestrator.batch import BatchScheduler
 from src.orchestrator.langgraph_flow import AgentOrchestrator
+from src.utils.spooled_document import SpooledDocument
 
 app = FastAPI(title="SmartDocs Agentic Platform")
 
@@ -27,6 +31,23 @@ DEFAULT_PAYLOAD = {
     "asset_type": "pumps",
     "database": "neo4j",
 }
+settings = get_settings()
+batch_scheduler = BatchScheduler(
+    orchestrator,
+    workers=settings.batch_workers,
+    stage_limits={
+        "classify": settings.batch_classify_concurrency,
+        "vision": settings.batch_vision_concurrency,
+        "graph": settings.batch_graph_concurrency,
+    },
+    max_queued_documents=settings.batch_max_queued_documents,
+)
+app.include_router(create_batch_router(batch_scheduler, DEFAULT_PAYLOAD))
+
+
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    await batch_scheduler.close()
 
 
 @app.get("/health")
@@ -36,8 +57,9 @@ async def health() -> Dict[str, str]:
 
 @app.post("/classify_doc")
 async def classify_doc(file: UploadFile = File(...)):
-    document_bytes = await file.read()
-    classification = await classifier_agent.classify(document_bytes)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        document = await SpooledDocument.from_upload(file, Path(tmpdir) / "input.pdf")
+        classification = await classifier_agent.classify(document)
     return classification.__dict__
 
 
@@ -55,10 +77,10 @@ async def classify_doc(file: UploadFile = File(...)):
 async def datasheet(
     file: UploadFile = File(...), asset_type: str = "generic", database: str | None = None
 ):
-    document_bytes = await file.read()
     with tempfile.TemporaryDirectory() as tmpdir:
+        document = await SpooledDocument.from_upload(file, Path(tmpdir) / "input.pdf")
         result = await Datasheet_pipeline.run(
-            document_bytes=document_bytes,
+            document=document,
             workdir=Path(tmpdir),
             asset_type=asset_type,
             database=database,
@@ -67,8 +89,16 @@ async def datasheet(
 
 
 @app.post("/ingest_to_graph")
-async def ingest_to_graph(adm: Any = Body(...), database: str | None = None):
-    return await graph_agent.run(adm, database)
+async def ingest_to_graph(
+    adm: Any = Body(...),
+    database: str | None = None,
+    diff: bool | None = None,
+    dry_run: bool = False,
+    document_id: str | None = None,
+):
+    return await graph_agent.run(
+        adm, database, diff=diff, dry_run=dry_run, document_id=document_id
+    )
 
 
 def _ensure_dict(payload: Dict[str, Any] | str | None) -> Dict[str, Any]:
@@ -86,10 +116,10 @@ def _ensure_dict(payload: Dict[str, Any] | str | None) -> Dict[str, Any]:
 async def orchestrate(
     file: UploadFile = File(...), payload: Dict[str, Any] | str | None = Body(default=None)
 ):
-    document_bytes = await file.read()
     payload = _ensure_dict(payload)
     if not payload:
         payload = DEFAULT_PAYLOAD.copy()
     with tempfile.TemporaryDirectory() as tmpdir:
-        result = await orchestrator.run(document_bytes, payload, Path(tmpdir))
+        document = await SpooledDocument.from_upload(file, Path(tmpdir) / "input.pdf")
+        result = await orchestrator.run(document, payload, Path(tmpdir))
     return result
@@ -0,0 +1 @@
+"""Ad-hoc performance benchmarks, run with ``python -m src.benchmarks.<name>``."""
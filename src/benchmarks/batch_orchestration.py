@@ -0,0 +1,190 @@
+"""Synthetic load for the batch orchestration endpoint.
+
+Runs ``--docs`` documents through a stand-in orchestrator whose classify,
+vision and graph stages call local stand-in services. Each service has a
+fixed capacity and rejects calls above it, and the caller retries after
+``--retry-seconds``, the way the external APIs throttle. The documents are
+run two ways, both against in-process FastAPI apps:
+
+- ``inline``: one request per document, each run in its request coroutine
+  (the ``/orchestrate`` pattern);
+- ``batch``: one ``POST /batches`` request, then polling the status
+  endpoint until the job completes.
+
+The script reports throughput, p50/p95 document latency and rejected
+service calls for each::
+
+    python -m src.benchmarks.batch_orchestration --docs 30 --workers 8
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+from fastapi import FastAPI, File, UploadFile
+
+from src.api.batches import create_batch_router
+from src.orchestrator.batch import BatchScheduler
+from src.utils.spooled_document import SpooledDocument
+from src.utils.stages import stage
+
+
+PDF_BYTES = b"%PDF-1.4 " + bytes(2048)
+
+
+class Overloaded(RuntimeError):
+    pass
+
+
+class CapacityService:
+    """An external service that handles `capacity` calls at a time."""
+
+    def __init__(self, capacity: int, seconds: float) -> None:
+        self.capacity = capacity
+        self.seconds = seconds
+        self.active = 0
+        self.rejected = 0
+
+    async def call(self) -> None:
+        if self.active >= self.capacity:
+            self.rejected += 1
+            raise Overloaded()
+        self.active += 1
+        try:
+            await asyncio.sleep(self.seconds)
+        finally:
+            self.active -= 1
+
+
+class StandInOrchestrator:
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.retry_seconds = args.retry_seconds
+        self.services = {
+            "classify": CapacityService(args.classify_capacity, 0.3),
+            "vision": CapacityService(args.vision_capacity, args.vision_seconds),
+            "graph": CapacityService(args.graph_capacity, 0.2),
+        }
+
+    async def _call(self, name: str) -> None:
+        while True:
+            try:
+                return await self.services[name].call()
+            except Overloaded:
+                await asyncio.sleep(self.retry_seconds)
+
+    async def run(
+        self, document: SpooledDocument, payload: Dict[str, Any], temp_dir: Path
+    ) -> Dict[str, Any]:
+        async with stage("classify"):
+            await self._call("classify")
+        async with stage("vision"):
+            await self._call("vision")
+        async with stage("validate"):
+            await asyncio.sleep(0.01)
+        async with stage("graph"):
+            await self._call("graph")
+        return {"bytes": document.size}
+
+
+def documents(count: int) -> List[tuple]:
+    return [
+        ("files", (f"doc{number:03d}.pdf", PDF_BYTES, "application/pdf"))
+        for number in range(count)
+    ]
+
+
+async def run_inline(args: argparse.Namespace) -> tuple:
+    runner = StandInOrchestrator(args)
+    app = FastAPI()
+
+    @app.post("/orchestrate")
+    async def orchestrate(file: UploadFile = File(...)):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            document = await SpooledDocument.from_upload(
+                file, Path(tmpdir) / "input.pdf"
+            )
+            return await runner.run(document, {}, Path(tmpdir))
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://app") as client:
+
+        async def one(upload) -> float:
+            started = time.monotonic()
+            response = await client.post(
+                "/orchestrate", files={"file": upload[1]}, timeout=None
+            )
+            response.raise_for_status()
+            return time.monotonic() - started
+
+        started = time.monotonic()
+        latencies = await asyncio.gather(*(one(doc) for doc in documents(args.docs)))
+    return latencies, time.monotonic() - started, runner
+
+
+async def run_batch(args: argparse.Namespace) -> tuple:
+    runner = StandInOrchestrator(args)
+    scheduler = BatchScheduler(
+        runner,
+        workers=args.workers,
+        stage_limits={
+            "classify": args.classify_capacity,
+            "vision": args.vision_capacity,
+            "graph": args.graph_capacity,
+        },
+    )
+    app = FastAPI()
+    app.include_router(create_batch_router(scheduler))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://app") as client:
+        started_wall = time.time()
+        started = time.monotonic()
+        response = await client.post("/batches", files=documents(args.docs))
+        response.raise_for_status()
+        job_id = response.json()["job_id"]
+        while True:
+            status = (await client.get(f"/batches/{job_id}")).json()
+            if status["status"] == "completed":
+                break
+            await asyncio.sleep(0.1)
+        elapsed = time.monotonic() - started
+    await scheduler.close()
+    failed = status["counts"]["failed"]
+    if failed:
+        raise RuntimeError(f"{failed} documents failed")
+    latencies = [doc["finished_at"] - started_wall for doc in status["documents"]]
+    return latencies, elapsed, runner
+
+
+def report(label: str, latencies: List[float], elapsed: float, runner) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * len(ordered))) - 1)]
+    rejected = {name: svc.rejected for name, svc in runner.services.items()}
+    print(
+        f"{label:>6}: {len(latencies) / elapsed:6.2f} docs/s"
+        f"  p50 {statistics.median(ordered):6.2f}s  p95 {p95:6.2f}s"
+        f"  rejected calls {rejected}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--classify-capacity", type=int, default=8)
+    parser.add_argument("--vision-capacity", type=int, default=4)
+    parser.add_argument("--vision-seconds", type=float, default=2.0)
+    parser.add_argument("--graph-capacity", type=int, default=2)
+    parser.add_argument("--retry-seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    report("inline", *asyncio.run(run_inline(args)))
+    report("batch", *asyncio.run(run_batch(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Remote classification calls with and without the classification cache.
+
+Starts the stub in ``fake_document_intelligence.py`` and classifies
+``--docs`` synthetic PDFs plus one the stub rejects as corrupt, each
+submitted ``--copies`` times at once, the way re-submissions and
+re-processing arrive. Runs it four times:
+
+- ``uncached``: straight through the gateway (its in-memory cache off);
+- ``cold``: through ``src/utils/classification_cache.py`` on an empty
+  SQLite file, so only single-flight de-duplication helps;
+- ``restart``: a new cache on the same SQLite file, as after a restart;
+- ``expired``: again after ``--negative-ttl`` seconds, when only the
+  corrupt document is retried.
+
+Reports wall time and requests reaching the stub for each and checks that
+the cached results match the uncached ones::
+
+    python -m src.benchmarks.classification_cache --docs 10 --copies 5
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from src.benchmarks.document_intelligence_gateway import (
+    CLASSIFIER_ID,
+    KEY,
+    synthetic_pdf,
+)
+from src.benchmarks.fake_document_intelligence import serve_in_thread
+from src.utils.classification_cache import ClassificationCache, SQLiteCacheBackend
+from src.utils.document_intelligence_gateway import (
+    DocumentIntelligenceGateway,
+    document_hash,
+)
+
+
+async def classify_all(
+    endpoint: str, submissions: List[bytes], cache: Optional[ClassificationCache]
+) -> list:
+    gateway = DocumentIntelligenceGateway(
+        endpoint, KEY, cache_size=0, polling_interval=0.2
+    )
+
+    async def one(document: bytes):
+        if cache is None:
+            return await gateway.classify(document, CLASSIFIER_ID)
+        return await cache.get_or_classify(
+            document_hash(document),
+            CLASSIFIER_ID,
+            lambda: gateway.classify(document, CLASSIFIER_ID),
+        )
+
+    try:
+        return await asyncio.gather(
+            *(one(document) for document in submissions), return_exceptions=True
+        )
+    finally:
+        await gateway.aclose()
+
+
+def summarize(results: list) -> list:
+    return [
+        (
+            type(result).__name__
+            if isinstance(result, Exception)
+            else result["documents"][0]["docType"]
+        )
+        for result in results
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=10)
+    parser.add_argument("--copies", type=int, default=5)
+    parser.add_argument("--seconds", type=float, default=1.0)
+    parser.add_argument("--negative-ttl", type=float, default=3.0)
+    args = parser.parse_args()
+
+    endpoint, app = serve_in_thread(args.seconds)
+    documents = [synthetic_pdf(number) for number in range(args.docs)]
+    corrupt = synthetic_pdf(-1)
+    app.state.failing.add(document_hash(corrupt))
+    submissions = [
+        document for document in documents + [corrupt] for _ in range(args.copies)
+    ]
+    print(
+        f"{len(submissions)} submissions: {args.docs} documents and 1 corrupt,"
+        f" {args.copies} copies each"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "classification_cache.sqlite3"
+        expected = None
+        for label in ("uncached", "cold", "restart", "expired"):
+            if label == "expired":
+                time.sleep(args.negative_ttl)
+            cache = None
+            if label != "uncached":
+                cache = ClassificationCache(
+                    [SQLiteCacheBackend(cache_path)], negative_ttl=args.negative_ttl
+                )
+            app.state.requests.clear()
+            started = time.monotonic()
+            results = asyncio.run(classify_all(endpoint, submissions, cache))
+            elapsed = time.monotonic() - started
+            labels = summarize(results)
+            if expected is None:
+                expected = labels
+            good = len(documents) * args.copies
+            if labels[:good] != expected[:good]:
+                raise AssertionError(f"{label}: document types differ from uncached")
+            failures = sorted(set(labels[good:]))
+            print(
+                f"{label:>8}: {elapsed:6.2f}s"
+                f"  remote requests {app.state.requests['classify']:3d}"
+                f"  corrupt document -> {', '.join(failures)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Compare nested-loop and hash-indexed connection deduplication and pairing.
+
+Runs on synthetic edge lists; the quadratic baselines are only timed up to
+``--baseline-limit`` edges, and where both run their outputs are compared::
+
+    python -m src.benchmarks.connection_index --edges 10000 100000
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+from src.utils.connection_index import (
+    SOURCE_DESTINATION_KEY,
+    dedupe,
+    pair_opposite_replicas,
+)
+
+
+def synthetic_edges(count: int, seed: int = 7) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    assets = max(count // 4, 2)
+    edges = []
+    for _ in range(count):
+        source, destination = rng.randrange(assets), rng.randrange(assets)
+        edges.append(
+            {
+                "source_equipment_tag": f"T-{source}",
+                "destination_equipment_tag": f"T-{destination}",
+                "source_asset_name": f"Asset {source}",
+                "destination_asset_name": f"Asset {destination}",
+                "connection_type": rng.choice(("IN_LET", "OUT_LET")),
+            }
+        )
+    # Re-append a slice so there are duplicates and replicas to find.
+    return edges + edges[: count // 10]
+
+
+def baseline_dedupe(edges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    kept: List[Dict[str, Any]] = []
+    for edge in edges:
+        if not any(
+            all(edge[field] == other[field] for field in SOURCE_DESTINATION_KEY)
+            for other in kept
+        ):
+            kept.append(edge)
+    return kept
+
+
+def baseline_pairing(edges: List[Dict[str, Any]]) -> List[bool]:
+    flags: List[Any] = [None] * len(edges)
+    for i, edge_i in enumerate(edges):
+        if flags[i] is True:
+            continue
+        for j, edge_j in enumerate(edges):
+            if (
+                edge_i["destination_asset_name"] == edge_j["destination_asset_name"]
+                and edge_i["source_asset_name"] == edge_j["source_asset_name"]
+                and edge_i["connection_type"] != edge_j["connection_type"]
+                and flags[j] is not True
+                and i != j
+            ):
+                flags[i] = flags[j] = True
+                break
+        if flags[i] is not True:
+            flags[i] = False
+    return flags
+
+
+def _timed(func: Callable[[], Any]) -> tuple:
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--edges", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--baseline-limit", type=int, default=10_000)
+    args = parser.parse_args()
+
+    for count in args.edges:
+        edges = synthetic_edges(count)
+        deduped, dedupe_seconds = _timed(lambda: dedupe(edges, SOURCE_DESTINATION_KEY))
+        paired, pairing_seconds = _timed(lambda: pair_opposite_replicas(edges))
+        print(
+            f"{len(edges):>8} edges  indexed: dedupe {dedupe_seconds:8.3f}s"
+            f"  pairing {pairing_seconds:8.3f}s"
+        )
+        if count > args.baseline_limit:
+            continue
+        expected_dedupe, baseline_dedupe_seconds = _timed(
+            lambda: baseline_dedupe(edges)
+        )
+        expected_pairs, baseline_pairing_seconds = _timed(
+            lambda: baseline_pairing(edges)
+        )
+        same = deduped == expected_dedupe and paired == expected_pairs
+        print(
+            f"{len(edges):>8} edges nested-loop: dedupe {baseline_dedupe_seconds:8.3f}s"
+            f"  pairing {baseline_pairing_seconds:8.3f}s  outputs match: {same}"
+        )
+
+
+if __name__ == "__main__":
+    main()
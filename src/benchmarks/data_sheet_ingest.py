@@ -0,0 +1,168 @@
+"""Compare per-item and bulk data sheet ADM ingestion against a local Neo4j.
+
+Builds a synthetic ADM (200 nozzles, subparts and an auxiliary node list
+interleaved over three equipments of two types), ingests it with both paths
+of `src.knowledge_graph_data_ingestion.ingest_data_sheet` into an empty
+database and again on top of that, and checks that both paths leave the
+same graph behind each time::
+
+    docker run --rm -p 7687:7687 -e NEO4J_AUTH=neo4j/benchmark neo4j:4.4
+    NEO4J_URI=bolt://localhost:7687 NEO4J_USERNAME=neo4j NEO4J_PASSWORD=benchmark \\
+        python -m src.benchmarks.data_sheet_ingest --nozzles 200 --wipe
+
+Every run deletes all nodes in the target database, so it refuses to start
+unless it is given a dedicated ``--database`` or ``--wipe`` to confirm that
+the default database is disposable.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import Counter
+from typing import Any, Dict
+
+from src.knowledge_graph_data_ingestion.ingest_data_sheet import ingest_data_sheet
+from src.utils.neo4j_connector import Neo4jConnection
+
+PLANT_ID = "bench-plant"
+VOLATILE_PROPERTIES = {"admIngestionStartingTimestamp", "admIngestionEndingTimestamp"}
+DEFAULT_DATABASES = ("neo4j", "system")
+
+
+def synthetic_adm(
+    nozzles: int, subparts: int, impellers: int, equipments: int
+) -> Dict[str, Any]:
+    """Nozzles, subparts and impellers interleaved round-robin over equipments.
+
+    Equipments alternate between two types, so the data sheet edges carry
+    several distinct (equipmentTypeName, equipmentUuid) keys in mixed order.
+    """
+    equipment_rows = [
+        {
+            "uuid": f"bench-eq-{eq}",
+            "equipmentTypeName": "PUMP" if eq % 2 == 0 else "MOTOR",
+            "tag": f"P-00{eq}",
+        }
+        for eq in range(equipments)
+    ]
+
+    def owner(idx: int) -> Dict[str, str]:
+        equipment = equipment_rows[idx % equipments]
+        return {
+            "equipmentUuid": equipment["uuid"],
+            "equipmentTypeName": equipment["equipmentTypeName"],
+        }
+
+    return {
+        "metaData": {"uuid": "bench-ds-1", "equipmentTag": "P-001", "title": "Bench"},
+        "equipments": equipment_rows,
+        "subparts": [
+            {"uuid": f"bench-sp-{idx}", **owner(idx), "name": f"Subpart {idx}"}
+            for idx in range(subparts)
+        ],
+        "nozzles": [
+            {
+                "uuid": f"bench-nz-{idx}",
+                **owner(idx),
+                "subpartUuid": f"bench-sp-{idx % subparts}",
+                "nozzleTag": f"N{idx}",
+                "size": f"{2 + idx % 6} in",
+            }
+            for idx in range(nozzles)
+        ],
+        "impeller": [
+            {
+                "uuid": f"bench-imp-{idx}",
+                **owner(idx),
+                "subpartTypeName": "CASING" if idx % 2 else None,
+                "diameter": f"{200 + idx} mm",
+            }
+            for idx in range(impellers)
+        ],
+    }
+
+
+def _reset(conn: Neo4jConnection) -> None:
+    with conn.driver.session(database=conn.database_name) as session:
+        session.run("MATCH (n) DETACH DELETE n").consume()
+
+
+def _graph_shape(conn: Neo4jConnection) -> Counter:
+    """Multiset of nodes and edges, keyed by labels/type and properties."""
+
+    def _props(props: Dict[str, Any]) -> str:
+        kept = {k: v for k, v in props.items() if k not in VOLATILE_PROPERTIES}
+        return json.dumps(kept, sort_keys=True, default=str)
+
+    def _key(var: str) -> str:
+        fields = ("uuid", "nozzleUuid", "subpartUuid", "equipmentUuid")
+        return f"coalesce({', '.join(f'{var}.{field}' for field in fields)})"
+
+    with conn.driver.session(database=conn.database_name) as session:
+        nodes = session.run(
+            "MATCH (n) RETURN labels(n) AS labels, properties(n) AS props"
+        ).data()
+        edges = session.run(
+            f"MATCH (a)-[r]->(b) RETURN {_key('a')} AS source, type(r) AS type, "
+            f"properties(r) AS props, {_key('b')} AS target"
+        ).data()
+    shape = Counter(f"{sorted(row['labels'])} {_props(row['props'])}" for row in nodes)
+    shape.update(
+        f"{row['source']} -{row['type']} {_props(row['props'])}-> {row['target']}"
+        for row in edges
+    )
+    return shape
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nozzles", type=int, default=200)
+    parser.add_argument("--subparts", type=int, default=10)
+    parser.add_argument("--impellers", type=int, default=20)
+    parser.add_argument("--equipments", type=int, default=3)
+    parser.add_argument("--database", default="neo4j")
+    parser.add_argument(
+        "--wipe",
+        action="store_true",
+        help="allow deleting every node in the default database",
+    )
+    args = parser.parse_args()
+    if args.database in DEFAULT_DATABASES and not args.wipe:
+        parser.error(
+            "this benchmark deletes every node in the target database; pass a "
+            "throwaway --database, or --wipe if the default one is disposable"
+        )
+
+    adm = synthetic_adm(args.nozzles, args.subparts, args.impellers, args.equipments)
+    conn = Neo4jConnection(args.database)
+    conn.connect()
+    shapes = {}
+    for label, bulk in (("per-item", False), ("bulk", True)):
+        for ingestion in ("fresh", "re-ingest"):
+            if ingestion == "fresh":
+                _reset(conn)
+            started = time.perf_counter()
+            await ingest_data_sheet(adm, args.database, PLANT_ID, bulk=bulk)
+            elapsed = time.perf_counter() - started
+            shapes[label, ingestion] = shape = _graph_shape(conn)
+            print(
+                f"{label:>8} {ingestion:>9}: {elapsed:8.2f}s  "
+                f"{args.nozzles / elapsed:10.1f} nozzles/sec  "
+                f"{sum(shape.values())} nodes+edges"
+            )
+    _reset(conn)
+    conn.close()
+    for ingestion in ("fresh", "re-ingest"):
+        per_item, bulk = shapes["per-item", ingestion], shapes["bulk", ingestion]
+        diff = (per_item - bulk) + (bulk - per_item)
+        print(
+            f"graph shape ({ingestion}):",
+            "identical" if not diff else f"{len(diff)} differences",
+        )
+        for line in list(diff)[:20]:
+            print("  ", line)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
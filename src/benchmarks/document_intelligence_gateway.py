@@ -0,0 +1,113 @@
+"""Batch Document Intelligence throughput: sync pollers vs. the async gateway.
+
+Starts the stub in ``fake_document_intelligence.py`` and runs layout analysis
+plus classification for ``--docs`` synthetic PDFs, first the way the data
+sheet pipeline used to (a new sync client per call, blocking
+``poller.result()``, one document after another) and then through
+``src/utils/document_intelligence_gateway.py`` concurrently from one event
+loop, a second time to show layout cache hits (classification results are
+cached by ``src/utils/classification_cache.py`` instead). Checks that both
+paths return the same layout and document types::
+
+    python -m src.benchmarks.document_intelligence_gateway --docs 50
+"""
+
+import argparse
+import asyncio
+import time
+from io import BytesIO
+from typing import List
+
+import fitz  # pymupdf
+from azure.ai.documentintelligence import DocumentIntelligenceClient
+from azure.ai.formrecognizer import DocumentAnalysisClient
+from azure.core.credentials import AzureKeyCredential
+
+from src.benchmarks.fake_document_intelligence import serve_in_thread
+from src.utils.document_intelligence_gateway import DocumentIntelligenceGateway
+
+KEY = "stub-key"
+CLASSIFIER_ID = "datasheet-classifier"
+
+
+def synthetic_pdf(number: int) -> bytes:
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), f"Datasheet {number}", fontsize=12)
+    content = doc.tobytes()
+    doc.close()
+    return content
+
+
+def sequential(endpoint: str, documents: List[bytes]) -> list:
+    results = []
+    for document in documents:
+        client = DocumentAnalysisClient(endpoint, AzureKeyCredential(KEY))
+        layout = client.begin_analyze_document(
+            "prebuilt-layout", document=BytesIO(document)
+        ).result()
+        classifier = DocumentIntelligenceClient(endpoint, AzureKeyCredential(KEY))
+        classified = classifier.begin_classify_document(
+            classifier_id=CLASSIFIER_ID, body=BytesIO(document)
+        ).result()
+        results.append((layout.to_dict(), classified.documents[0].get("docType")))
+    return results
+
+
+async def gateway_batch(
+    gateway: DocumentIntelligenceGateway, documents: List[bytes]
+) -> list:
+    async def one(document: bytes):
+        layout, classified = await asyncio.gather(
+            gateway.analyze(document),
+            gateway.classify(document, CLASSIFIER_ID),
+        )
+        return layout, classified["documents"][0].get("docType")
+
+    return await asyncio.gather(*(one(document) for document in documents))
+
+
+async def run_gateway(gateway, documents) -> tuple:
+    timings = []
+    results = None
+    for _ in range(2):
+        started = time.perf_counter()
+        results = await gateway_batch(gateway, documents)
+        timings.append(time.perf_counter() - started)
+    await gateway.aclose()
+    return results, timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=1.0)
+    parser.add_argument("--max-concurrency", type=int, default=16)
+    parser.add_argument("--skip-sequential", action="store_true")
+    args = parser.parse_args()
+
+    endpoint, app = serve_in_thread(args.seconds)
+    documents = [synthetic_pdf(number) for number in range(args.docs)]
+
+    expected = None
+    if not args.skip_sequential:
+        started = time.perf_counter()
+        expected = sequential(endpoint, documents)
+        print(f"sync pollers, sequential: {time.perf_counter() - started:7.2f}s")
+
+    gateway = DocumentIntelligenceGateway(
+        endpoint, KEY, max_concurrency=args.max_concurrency, cache_size=2 * args.docs
+    )
+    before = dict(app.state.requests)
+    results, (cold, warm) = asyncio.run(run_gateway(gateway, documents))
+    calls = {
+        name: count - before.get(name, 0) for name, count in app.state.requests.items()
+    }
+    print(f"gateway, concurrent:      {cold:7.2f}s")
+    print(f"gateway, cached repeat:   {warm:7.2f}s")
+    print(f"service calls by the gateway over both runs: {calls}")
+    if expected is not None:
+        print(f"results identical: {list(results) == expected}")
+
+
+if __name__ == "__main__":
+    main()
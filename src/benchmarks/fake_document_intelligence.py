@@ -0,0 +1,202 @@
+"""Local stand-in for Azure Document Intelligence.
+
+Implements the long-running-operation routes the SDKs use for prebuilt
+layout analysis (``azure-ai-formrecognizer``) and custom classification
+(``azure-ai-documentintelligence``), plus a plain POST route for the custom
+model endpoint. Each operation reports ``running`` for ``--seconds`` and
+then ``succeeded`` with a small result derived from the document's hash.
+Documents whose SHA-256 is in ``app.state.failing`` are rejected with 400::
+
+    python -m src.benchmarks.fake_document_intelligence --port 8086
+    AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT=http://127.0.0.1:8086
+
+`serve_in_thread()` starts it on a free port for benchmarks.
+"""
+
+import argparse
+import hashlib
+import itertools
+import socket
+import threading
+import time
+from collections import Counter
+from typing import Optional, Tuple
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+DOC_TYPES = (
+    "drum_pressure_vessel_data_sheet",
+    "heat_exchanger_shell_and_tube_data_sheet",
+    "pump_data_sheet",
+)
+TIMESTAMP = "2024-01-01T00:00:00Z"
+
+
+def _layout(digest: str, model_id: str) -> dict:
+    return {
+        "apiVersion": "2023-07-31",
+        "modelId": model_id,
+        "content": f"TAG {digest[:8]}",
+        "pages": [
+            {
+                "pageNumber": 1,
+                "width": 8.5,
+                "height": 11,
+                "unit": "inch",
+                "spans": [{"offset": 0, "length": 12}],
+                "lines": [
+                    {
+                        "content": f"TAG {digest[:8]}",
+                        "polygon": [1, 1, 3, 1, 3, 1.2, 1, 1.2],
+                        "spans": [{"offset": 0, "length": 12}],
+                    }
+                ],
+            }
+        ],
+        "tables": [
+            {
+                "rowCount": 1,
+                "columnCount": 2,
+                "cells": [
+                    {"rowIndex": 0, "columnIndex": 0, "content": "TAG"},
+                    {"rowIndex": 0, "columnIndex": 1, "content": digest[:8]},
+                ],
+            }
+        ],
+    }
+
+
+def _classification(digest: str, classifier_id: str) -> dict:
+    return {
+        "apiVersion": "2024-11-30",
+        "modelId": classifier_id,
+        "content": "",
+        "pages": [],
+        "documents": [
+            {
+                "docType": DOC_TYPES[int(digest, 16) % len(DOC_TYPES)],
+                "confidence": 0.99,
+                "spans": [],
+            }
+        ],
+    }
+
+
+def _rejected(app: FastAPI, digest: str) -> Optional[JSONResponse]:
+    if digest not in app.state.failing:
+        return None
+    return JSONResponse(
+        {"error": {"code": "InvalidContent", "message": "Corrupt document"}},
+        status_code=400,
+    )
+
+
+def _accept(request: Request, prefix: str, result: dict) -> JSONResponse:
+    state = request.app.state
+    operation_id = str(next(state.ids))
+    state.operations[operation_id] = (time.monotonic() + state.seconds, result)
+    base = str(request.base_url).rstrip("/")
+    return JSONResponse(
+        {},
+        status_code=202,
+        headers={
+            "Operation-Location": (
+                f"{base}/{prefix}/analyzeResults/{operation_id}"
+                f"?api-version={request.query_params.get('api-version', '')}"
+            ),
+        },
+    )
+
+
+def _status(request: Request, operation_id: str) -> dict:
+    ready_at, result = request.app.state.operations[operation_id]
+    if time.monotonic() < ready_at:
+        return {"status": "running", "createdDateTime": TIMESTAMP}
+    return {
+        "status": "succeeded",
+        "createdDateTime": TIMESTAMP,
+        "lastUpdatedDateTime": TIMESTAMP,
+        "analyzeResult": result,
+    }
+
+
+async def _analyze(model_id: str, request: Request):
+    request.app.state.requests["analyze"] += 1
+    digest = hashlib.sha256(await request.body()).hexdigest()
+    return _accept(
+        request,
+        f"formrecognizer/documentModels/{model_id}",
+        _layout(digest, model_id),
+    )
+
+
+async def _classify(classifier_id: str, request: Request):
+    request.app.state.requests["classify"] += 1
+    digest = hashlib.sha256(await request.body()).hexdigest()
+    return _rejected(request.app, digest) or _accept(
+        request,
+        f"documentintelligence/documentClassifiers/{classifier_id}",
+        _classification(digest, classifier_id),
+    )
+
+
+async def _operation_status(op: str, request: Request):
+    return _status(request, op)
+
+
+async def _custom(request: Request):
+    request.app.state.requests["post"] += 1
+    digest = hashlib.sha256(await request.body()).hexdigest()
+    prediction = {"label": "datasheet", "confidence": 0.9, "id": digest}
+    return _rejected(request.app, digest) or {"prediction": prediction}
+
+
+def create_app(seconds: float = 1.0) -> FastAPI:
+    app = FastAPI()
+    app.state.seconds = seconds
+    app.state.operations = {}
+    app.state.ids = itertools.count(1)
+    app.state.requests = Counter()
+    app.state.failing = set()
+
+    layout = "/formrecognizer/documentModels/{model_id}"
+    classifier = "/documentintelligence/documentClassifiers/{classifier_id}"
+    app.post(f"{layout}:analyze")(_analyze)
+    app.get(f"{layout}/analyzeResults/{{op}}")(_operation_status)
+    app.post(f"{classifier}:analyze")(_classify)
+    app.get(f"{classifier}/analyzeResults/{{op}}")(_operation_status)
+    app.post("/custom/classify")(_custom)
+    return app
+
+
+def serve_in_thread(seconds: float = 1.0) -> Tuple[str, FastAPI]:
+    """Start the stub on a free local port; returns its endpoint and app."""
+    import uvicorn
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    app = create_app(seconds)
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}", app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8086)
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+    uvicorn.run(create_app(args.seconds), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
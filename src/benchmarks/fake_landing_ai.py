@@ -0,0 +1,102 @@
+"""Local stand-in for the Landing AI Agentic Document Analysis API.
+
+Submissions get ``202 Accepted`` with a ``Location`` job URL that reports
+``processing`` until the job's simulated run time has passed, then
+``success`` with an ``extracted_schema`` describing the pages it received.
+Run time is ``--base-seconds`` plus ``--page-seconds`` per page. Serve it
+over HTTP and point ``LANDING_AI_BASE_URL`` at it::
+
+    python -m src.benchmarks.fake_landing_ai --port 8085
+    LANDING_AI_BASE_URL=http://127.0.0.1:8085/v1/tools/agentic-document-analysis
+
+or mount `create_app()` in-process with ``httpx.ASGITransport``.
+"""
+
+import argparse
+import itertools
+import json
+import time
+from dataclasses import dataclass
+from typing import Dict
+
+import fitz  # pymupdf
+from fastapi import FastAPI, File, Form, Request, UploadFile
+from fastapi.responses import JSONResponse
+
+ROUTE = "/v1/tools/agentic-document-analysis"
+
+
+@dataclass
+class FakeJob:
+    name: str
+    pages: int
+    fields: list
+    ready_at: float
+    polls: int = 0
+
+
+def create_app(base_seconds: float = 2.0, page_seconds: float = 0.2) -> FastAPI:
+    app = FastAPI()
+    jobs: Dict[str, FakeJob] = {}
+    ids = itertools.count(1)
+    app.state.jobs = jobs
+
+    @app.post(ROUTE)
+    async def submit(
+        request: Request,
+        pdf: UploadFile = File(...),
+        fields_schema: str = Form(...),
+    ):
+        content = await pdf.read()
+        with fitz.open(stream=content, filetype="pdf") as doc:
+            pages = doc.page_count
+        job_id = str(next(ids))
+        jobs[job_id] = FakeJob(
+            name=pdf.filename,
+            pages=pages,
+            fields=sorted(json.loads(fields_schema).get("properties", {})),
+            ready_at=time.monotonic() + base_seconds + page_seconds * pages,
+        )
+        location = f"{str(request.base_url).rstrip('/')}{ROUTE}/jobs/{job_id}"
+        return JSONResponse(
+            {"status": "processing", "job_id": job_id},
+            status_code=202,
+            headers={"Location": location},
+        )
+
+    @app.get(ROUTE + "/jobs/{job_id}")
+    async def status(job_id: str):
+        job = jobs[job_id]
+        job.polls += 1
+        if time.monotonic() < job.ready_at:
+            return {"status": "processing"}
+        return {
+            "status": "success",
+            "data": {
+                "extracted_schema": {
+                    "document": {"name": job.name, "fields": job.fields},
+                    "pages": [{"page": number} for number in range(job.pages)],
+                },
+                "logs": [f"{job.name}: {job.pages} pages"],
+            },
+        }
+
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8085)
+    parser.add_argument("--base-seconds", type=float, default=2.0)
+    parser.add_argument("--page-seconds", type=float, default=0.2)
+    args = parser.parse_args()
+    uvicorn.run(
+        create_app(args.base_seconds, args.page_seconds), host=args.host, port=args.port
+    )
+
+
+if __name__ == "__main__":
+    main()
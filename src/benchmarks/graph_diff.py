@@ -0,0 +1,353 @@
+"""Statements and rows written by full versus diff (incremental) ingestion.
+
+Ingests a synthetic ADM through both graph ingestion paths:
+
+- ``graph``: ``GraphIngestionAgent`` payloads (``--equipments`` equipments
+  from ``src/benchmarks/graph_payload.py``) via ``ingest_graph_batches``
+  (full) and ``ingest_graph_diff`` (diff) in ``src/utils/neo4j_client.py``;
+- ``data-sheet``: a data sheet ADM with ``--equipments`` equipments, their
+  nozzles, subparts and auxiliary nodes via ``ingest_data_sheet`` in
+  ``src/core/knowledge_graph_data_ingestion/ingest_data_sheet.py``.
+
+For each path it runs a full ingest, a first diff ingest, an unchanged
+re-ingest, a re-ingest with ``--changes`` values edited, one with an
+equipment removed, and a dry run of another edit. Neo4j is replaced by a
+stand-in that counts statements and UNWIND rows and keeps the fingerprint
+manifest, so it needs no database.
+
+The graph path is also checked across two scopes. A second data sheet for the
+same asset shares the asset node and one equipment subtree with the first.
+The first sheet is then re-ingested without that equipment. For this check
+the stand-in also keeps the nodes and edges the diff statements write,
+withdraw and delete, and every node and edge of the second sheet must
+survive::
+
+    python -m src.benchmarks.graph_diff --equipments 50 --changes 3
+"""
+
+import argparse
+import asyncio
+import copy
+import importlib
+import re
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List
+
+from src.agents.datasheet.graph_agent.agent import GraphIngestionAgent
+from src.benchmarks.graph_payload import synthetic_adm
+from src.utils import neo4j_client
+from src.utils.graph_diff import MANIFEST_LABEL
+
+# The package re-exports the function under the module's name.
+data_sheet = importlib.import_module(
+    "src.core.knowledge_graph_data_ingestion.ingest_data_sheet"
+)
+
+PLANT_ID = "bench-plant"
+
+
+class _Counters:
+    nodes_created = 0
+    relationships_created = 0
+
+
+class StandInGraph:
+    """Counts statements and rows; stores manifests so diffs see earlier runs."""
+
+    def __init__(self) -> None:
+        self.manifests: Dict[str, str] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.rows = 0
+        self._record = None
+
+    # Session, transaction and result in one object.
+    def run(self, query: str, **params):
+        self.statements += 1
+        self.rows += sum(
+            len(value) for key, value in params.items() if key in ("rows", "uuids")
+        )
+        self._record = None
+        if MANIFEST_LABEL in query and "RETURN m.fingerprints" in query:
+            fingerprints = self.manifests.get(params["scope"])
+            self._record = {"fingerprints": fingerprints} if fingerprints else None
+        elif MANIFEST_LABEL in query and "MERGE" in query:
+            self.manifests[params["scope"]] = params["fingerprints"]
+        return self
+
+    def single(self):
+        return self._record
+
+    def consume(self):
+        return self
+
+    counters = _Counters()
+
+    def commit(self) -> None:
+        pass
+
+    @contextmanager
+    def begin_transaction(self):
+        yield self
+
+    def write_transaction(self, function, *args):
+        return function(self, *args)
+
+
+class SharedGraph(StandInGraph):
+    """Stand-in that also keeps graph-path nodes and edges with their scopes."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.nodes: Dict[str, set] = {}
+        self.edges: Dict[tuple, set] = {}
+
+    def run(self, query: str, **params):
+        super().run(query, **params)
+        rows = params.get("rows") or []
+        scope = params.get("scope")
+        if "MERGE (n:" in query:
+            for row in rows:
+                self.nodes.setdefault(row["id"], set()).add(scope)
+        elif "MERGE (s)-[r:" in query:
+            self._merge_edges(query, rows, scope)
+        elif "row.keep" in query:
+            for row in rows:
+                self._withdraw_edges(row["id"], query, params, row["keep"])
+        elif "DELETE r" in query:
+            for node_id in rows:
+                self._withdraw_edges(node_id, query, params, None)
+        elif "DETACH DELETE n" in query:
+            for node_id in rows:
+                self._withdraw_node(node_id, scope, "ingestScopes" not in query)
+        return self
+
+    def _merge_edges(self, query: str, rows, scope) -> None:
+        rel_type = re.search(r"MERGE \(s\)-\[r:`(\w+)`\]", query).group(1)
+        for row in rows:
+            edge = (row["start"], rel_type, row["end"])
+            self.edges.setdefault(edge, set()).add(scope)
+
+    def _withdraw_edges(self, start: str, query: str, params, keep) -> None:
+        tagged = "ingestScopes" in query
+        for edge, scopes in list(self.edges.items()):
+            owned = params.get("scope") in scopes or not tagged
+            if edge[0] != start or edge[1] not in params["types"] or not owned:
+                continue
+            if keep is not None and [edge[1], edge[2]] in keep:
+                continue
+            scopes.discard(params.get("scope"))
+            if not scopes or not tagged:
+                del self.edges[edge]
+
+    def _withdraw_node(self, node_id: str, scope, unconditional: bool) -> None:
+        scopes = self.nodes.get(node_id, set())
+        scopes.discard(scope)
+        if scopes and not unconditional:
+            return
+        self.nodes.pop(node_id, None)
+        for edge in list(self.edges):
+            if node_id in (edge[0], edge[2]):
+                del self.edges[edge]
+
+
+def synthetic_data_sheet(equipments: int) -> Dict[str, Any]:
+    equipment_rows, nozzles, subparts, conditions = [], [], [], []
+    for eq in range(equipments):
+        equipment_uuid = f"eq-{eq}"
+        equipment_rows.append(
+            {"uuid": equipment_uuid, "equipmentTypeName": "Pump", "rating": eq}
+        )
+        for idx in range(4):
+            subpart_uuid = f"sp-{eq}-{idx}"
+            subparts.append(
+                {
+                    "uuid": subpart_uuid,
+                    "equipmentUuid": equipment_uuid,
+                    "equipmentTypeName": "Pump",
+                    "material": "316L",
+                }
+            )
+            nozzles.append(
+                {
+                    "uuid": f"nz-{eq}-{idx}",
+                    "equipmentUuid": equipment_uuid,
+                    "equipmentTypeName": "Pump",
+                    "subpartUuid": subpart_uuid,
+                    "size": f"{idx + 1} in",
+                }
+            )
+            conditions.append(
+                {
+                    "uuid": f"dc-{eq}-{idx}",
+                    "equipmentUuid": equipment_uuid,
+                    "equipmentTypeName": "Pump",
+                    "pressure": idx * 10,
+                }
+            )
+    return {
+        "metaData": {"uuid": "ds-bench", "equipmentTag": "BENCH-P-001"},
+        "equipments": equipment_rows,
+        "nozzles": nozzles,
+        "subparts": subparts,
+        "designConditions": conditions,
+    }
+
+
+def edit_graph(adm: Dict[str, Any], changes: int, seed: str) -> Dict[str, Any]:
+    adm = copy.deepcopy(adm)
+    for idx in range(changes):
+        equipment = adm["equipments"][idx * 7 % len(adm["equipments"])]
+        equipment["hydraulic_performance"]["property_0"] = f"{seed}-{idx}"
+    return adm
+
+
+def edit_data_sheet(adm: Dict[str, Any], changes: int, seed: str) -> Dict[str, Any]:
+    adm = copy.deepcopy(adm)
+    for idx in range(changes):
+        adm["nozzles"][idx * 7 % len(adm["nozzles"])]["size"] = f"{seed}-{idx}"
+    return adm
+
+
+def without_equipment(adm: Dict[str, Any], data_sheet_adm: bool) -> Dict[str, Any]:
+    adm = copy.deepcopy(adm)
+    removed = adm["equipments"].pop()
+    if data_sheet_adm:
+        for section in ("nozzles", "subparts", "designConditions"):
+            adm[section] = [
+                row for row in adm[section] if row["equipmentUuid"] != removed["uuid"]
+            ]
+    return adm
+
+
+async def ingest_graph(graph: StandInGraph, adm, mode: str, dry_run: bool = False):
+    @contextmanager
+    def stand_in(database=None):
+        yield graph
+
+    neo4j_client.neo4j_session = stand_in
+    agent = GraphIngestionAgent()
+    if mode == "full":
+        return await neo4j_client.ingest_graph_batches(
+            agent.iter_graph_batches(adm), bulk=True
+        )
+    return await agent.run(adm, diff=True, dry_run=dry_run)
+
+
+async def ingest_sheet(graph: StandInGraph, adm, mode: str, dry_run: bool = False):
+    class StandInConnection:
+        def __init__(self, database_name):
+            self.database_name = database_name
+
+        def connect(self):
+            pass
+
+        def close(self):
+            pass
+
+        def execute_write(self, function, *args):
+            return graph.write_transaction(function, *args)
+
+    data_sheet.Neo4jConnection = StandInConnection
+    return await data_sheet.ingest_data_sheet(
+        adm,
+        "bench",
+        PLANT_ID,
+        bulk=True,
+        diff=mode != "full",
+        dry_run=dry_run,
+    )
+
+
+def run_path(name: str, ingest, adm, edit, data_sheet_adm: bool, changes: int):
+    graph = StandInGraph()
+    edited = edit(adm, changes, "edit")
+    scenarios: List[tuple] = [
+        ("full", adm, "full", False),
+        ("diff first", adm, "diff", False),
+        ("diff unchanged", adm, "diff", False),
+        (f"diff {changes} edits", edited, "diff", False),
+        ("diff -1 equipment", without_equipment(edited, data_sheet_adm), "diff", False),
+        ("dry run edit", edit(adm, changes, "dry"), "diff", True),
+    ]
+    print(f"{name}:")
+    for label, document, mode, dry_run in scenarios:
+        graph.reset()
+        started = time.perf_counter()
+        summary = asyncio.run(ingest(graph, document, mode, dry_run))
+        elapsed = time.perf_counter() - started
+        changed = ""
+        if mode == "diff":
+            changed = (
+                f"  +{summary['nodes_inserted']} ~{summary['nodes_updated']}"
+                f" -{summary['nodes_deleted']} ={summary['nodes_unchanged']}"
+            )
+        print(
+            f"  {label:>18}: {graph.statements:5d} statements,"
+            f" {graph.rows:7d} rows, {elapsed * 1000:8.1f} ms{changed}"
+        )
+        if label == "diff unchanged" and (graph.statements, graph.rows) != (1, 0):
+            raise AssertionError(f"{name}: unchanged re-ingest wrote to the graph")
+        if dry_run and graph.rows:
+            raise AssertionError(f"{name}: dry run wrote to the graph")
+
+
+def check_shared_asset(adm: Dict[str, Any]) -> None:
+    graph = SharedGraph()
+    other = copy.deepcopy(adm)
+    other["metadata"]["document_number"] = "BENCH-DS-002"
+    other["equipments"] = other["equipments"][:1]
+    first_without_shared = copy.deepcopy(adm)
+    first_without_shared["equipments"] = first_without_shared["equipments"][1:]
+    for document in (adm, other, first_without_shared):
+        summary = asyncio.run(ingest_graph(graph, document, "diff"))
+
+    expected = GraphIngestionAgent()._build_graph_payload(other)
+    missing_nodes = [
+        node["id"] for node in expected["nodes"] if node["id"] not in graph.nodes
+    ]
+    missing_edges = [
+        rel
+        for rel in expected["relationships"]
+        if (rel["start"], rel["type"], rel["end"]) not in graph.edges
+    ]
+    print(
+        f"  {'second sheet kept':>18}: -{summary['nodes_deleted']} first sheet,"
+        f" {len(missing_nodes)} nodes and {len(missing_edges)} edges"
+        " of the second lost"
+    )
+    if missing_nodes or missing_edges:
+        raise AssertionError("graph: re-ingesting one sheet removed another's graph")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--equipments", type=int, default=50)
+    parser.add_argument("--details", type=int, default=20)
+    parser.add_argument("--changes", type=int, default=3)
+    args = parser.parse_args()
+
+    run_path(
+        "graph",
+        ingest_graph,
+        synthetic_adm(args.equipments, args.details),
+        edit_graph,
+        False,
+        args.changes,
+    )
+    check_shared_asset(synthetic_adm(args.equipments, args.details))
+    run_path(
+        "data-sheet",
+        ingest_sheet,
+        synthetic_data_sheet(args.equipments),
+        edit_data_sheet,
+        True,
+        args.changes,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""Time to first write and peak memory of datasheet graph ingestion.
+
+Builds a synthetic multi-equipment ADM (``--equipments`` equipments with
+``--details`` properties in each of the equipment-level categories, plus
+document-level categories every equipment inherits) and ingests it in
+bulk mode two ways:
+
+- ``full``: the previous ``GraphIngestionAgent._build_graph_payload``
+  (copied below), which builds every node and relationship and serializes
+  document-level categories again for each equipment, then ``ingest_adm``;
+- ``stream``: ``GraphIngestionAgent.iter_graph_batches`` consumed by
+  ``ingest_graph_batches`` in ``src/utils/neo4j_client.py``.
+
+Neo4j is replaced by a stand-in session that spends ``--write-ms`` per
+transaction and records the rows, so the check that both ways write the
+same nodes and relationships needs no database. Peak memory is the
+tracemalloc peak above the ADM itself::
+
+    python -m src.benchmarks.graph_payload --equipments 50 --details 20
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, List
+
+from src.agents.datasheet.graph_agent.agent import CATEGORIES, GraphIngestionAgent
+from src.utils import neo4j_client
+from src.utils.neo4j_client import ingest_adm, ingest_graph_batches
+
+SHARED_CATEGORIES = ("service_duty", "environmental_conditions", "notes", "revisions")
+
+
+def synthetic_adm(equipments: int, details: int) -> Dict[str, Any]:
+    own = [c for c in CATEGORIES[2:] if c not in SHARED_CATEGORIES]
+    return {
+        "metadata": {"tag": "BENCH-P-001", "document_number": "BENCH-DS-001"},
+        "service_duty": {f"duty_{idx}": f"value {idx}" for idx in range(details)},
+        "environmental_conditions": {"ambient": {"min": -20, "max": 45}},
+        "notes": [f"Note {idx}: see sheet {idx}" for idx in range(details)],
+        "revisions": [{"rev": idx, "by": "QA"} for idx in range(5)],
+        "equipments": [
+            {
+                "equipment_name": f"BENCH-P-001-{eq}",
+                **{
+                    category: {
+                        f"property_{idx}": f"{eq}-{idx}" for idx in range(details)
+                    }
+                    for category in own
+                },
+            }
+            for eq in range(equipments)
+        ],
+    }
+
+
+def _serialize(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+def legacy_build_graph_payload(adm: Any) -> Dict[str, Any]:  # noqa: C901
+    """`GraphIngestionAgent._build_graph_payload` before streaming.
+
+    Kept verbatim as the reference the streamed payload is compared with, so
+    it is excluded from the complexity check rather than restructured.
+    """
+    nodes: List[Dict[str, Any]] = []
+    relationships: List[Dict[str, Any]] = []
+    visited_ids = set()
+
+    documents = adm if isinstance(adm, list) else [adm]
+    for doc_index, doc in enumerate(documents):
+        if not isinstance(doc, dict):
+            continue
+        metadata = doc.get("metadata") or {}
+        asset_tag = (
+            metadata.get("tag")
+            or metadata.get("document_number")
+            or metadata.get("equipment_name")
+            or f"datasheet-{doc_index}"
+        )
+        asset_id = f"asset::{asset_tag}"
+        if asset_id not in visited_ids:
+            nodes.append({"id": asset_id, "label": "Asset", **metadata})
+            visited_ids.add(asset_id)
+
+        equipments = doc.get("equipments") or [{}]
+        for idx, equipment in enumerate(equipments):
+            equipment = equipment or {}
+            eq_name = equipment.get("equipment_name") or f"{asset_tag}-equipment-{idx}"
+            eq_id = f"equipment::{eq_name}"
+            if eq_id not in visited_ids:
+                nodes.append({"id": eq_id, "label": "Equipment", **equipment})
+                visited_ids.add(eq_id)
+            relationships.append(
+                {"start": asset_id, "end": eq_id, "type": "HAS_EQUIPMENT"}
+            )
+
+            for category in CATEGORIES:
+                data = equipment.get(category) if isinstance(equipment, dict) else None
+                if data is None:
+                    data = doc.get(category)
+                if not data:
+                    continue
+
+                category_id = f"{eq_id}::{category}"
+                if category_id not in visited_ids:
+                    nodes.append(
+                        {
+                            "id": category_id,
+                            "label": "Category",
+                            "category": category,
+                            "data": _serialize(data),
+                        }
+                    )
+                    visited_ids.add(category_id)
+                relationships.append(
+                    {"start": eq_id, "end": category_id, "type": "HAS_CATEGORY"}
+                )
+
+                if isinstance(data, dict):
+                    for key, value in data.items():
+                        detail_id = f"{category_id}::{key}"
+                        if detail_id in visited_ids:
+                            continue
+                        nodes.append(
+                            {
+                                "id": detail_id,
+                                "label": "Detail",
+                                "key": key,
+                                "value": _serialize(value),
+                            }
+                        )
+                        visited_ids.add(detail_id)
+                        relationships.append(
+                            {
+                                "start": category_id,
+                                "end": detail_id,
+                                "type": "HAS_DETAIL",
+                            }
+                        )
+                elif isinstance(data, list):
+                    for list_idx, entry in enumerate(data):
+                        entry_id = f"{category_id}::item-{list_idx}"
+                        if entry_id in visited_ids:
+                            continue
+                        nodes.append(
+                            {
+                                "id": entry_id,
+                                "label": "Entry",
+                                "data": _serialize(entry),
+                            }
+                        )
+                        visited_ids.add(entry_id)
+                        relationships.append(
+                            {"start": category_id, "end": entry_id, "type": "HAS_ENTRY"}
+                        )
+
+    return {"nodes": nodes, "relationships": relationships}
+
+
+class StandInSession:
+    """Records UNWIND rows and spends `write_seconds` per transaction."""
+
+    def __init__(self, write_seconds: float, keep_rows: bool) -> None:
+        self.write_seconds = write_seconds
+        self.keep_rows = keep_rows
+        self.first_write_at = None
+        self.transactions = 0
+        self.written: List[tuple] = []
+
+    def run(self, query: str, **params):
+        return self
+
+    def consume(self) -> None:
+        pass
+
+    def commit(self) -> None:
+        pass
+
+    @contextmanager
+    def begin_transaction(self):
+        yield self._Transaction(self)
+
+    class _Transaction:
+        def __init__(self, session: "StandInSession") -> None:
+            self.session = session
+
+        def run(self, query: str, rows: List[Dict[str, Any]]):
+            session = self.session
+            if session.first_write_at is None:
+                session.first_write_at = time.perf_counter()
+            session.transactions += 1
+            time.sleep(session.write_seconds)
+            if session.keep_rows:
+                for row in rows:
+                    if "id" in row:
+                        props = json.dumps(row["props"], sort_keys=True)
+                        session.written.append(("node", row["id"], props))
+                    else:
+                        rel_type = query.split("`")[-2]
+                        session.written.append((rel_type, row["start"], row["end"]))
+            return session
+
+        def commit(self) -> None:
+            pass
+
+
+async def ingest(
+    mode: str, adm: Dict[str, Any], session: StandInSession, batch_size: int
+):
+    @contextmanager
+    def stand_in(database=None):
+        yield session
+
+    neo4j_client.neo4j_session = stand_in
+    if mode == "full":
+        payload = legacy_build_graph_payload(adm)
+        return await ingest_adm(payload, bulk=True, batch_size=batch_size)
+    batches = GraphIngestionAgent().iter_graph_batches(adm, batch_size)
+    return await ingest_graph_batches(batches, bulk=True, batch_size=batch_size)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--equipments", type=int, default=50)
+    parser.add_argument("--details", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--write-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    adm = synthetic_adm(args.equipments, args.details)
+    streamed = GraphIngestionAgent()._build_graph_payload(adm)
+    if streamed != legacy_build_graph_payload(adm):
+        raise AssertionError("streaming builder output differs from the previous one")
+
+    written = {}
+    for mode in ("full", "stream"):
+        session = StandInSession(args.write_ms / 1000, keep_rows=True)
+        started = time.perf_counter()
+        result = asyncio.run(ingest(mode, adm, session, args.batch_size))
+        elapsed = time.perf_counter() - started
+        first_write = session.first_write_at - started
+        written[mode] = sorted(session.written)
+
+        tracemalloc.start()
+        quiet = StandInSession(0, keep_rows=False)
+        asyncio.run(ingest(mode, adm, quiet, args.batch_size))
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+        print(
+            f"{mode:>6}: {result['nodes_ingested']} nodes,"
+            f" {result['relationships_ingested']} relationships"
+            f" in {session.transactions} transactions;"
+            f" first write {first_write * 1000:7.1f} ms, total {elapsed:6.2f}s,"
+            f" peak {peak:7.1f} MB"
+        )
+    if written["full"] != written["stream"]:
+        raise AssertionError("streaming ingest wrote different rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Landing AI job latency with fixed vs. adaptive polling.
+
+Submits ``--docs`` synthetic PDFs at once from one event loop to the fake
+server in ``fake_landing_ai.py`` (mounted in-process) with
+``src/utils/landing_ai_client.py``, once polling every ``--fixed-interval``
+seconds as the agents used to and once with the adaptive `PollPolicy`.
+Reports how long each job's result arrived after the job finished, and the
+number of status polls. ``--chunk-pages`` also checks that a chunked
+submission stitches every page back in order::
+
+    python -m src.benchmarks.landing_ai_polling --docs 20 --chunk-pages 10
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import Dict, List
+
+import fitz  # pymupdf
+import httpx
+
+from src.benchmarks.fake_landing_ai import ROUTE, create_app
+from src.utils.landing_ai_client import LandingAIClient, PollPolicy
+
+SCHEMA = {"type": "object", "properties": {"tag": {}, "design_pressure": {}}}
+
+
+def synthetic_pdf(pages: int) -> bytes:
+    doc = fitz.open()
+    for number in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Datasheet page {number + 1}", fontsize=12)
+    content = doc.tobytes()
+    doc.close()
+    return content
+
+
+async def run_policy(
+    policy: PollPolicy,
+    documents: Dict[str, bytes],
+    base_seconds: float,
+    page_seconds: float,
+    chunk_pages: int = 0,
+) -> tuple:
+    app = create_app(base_seconds, page_seconds)
+    client = LandingAIClient(
+        "fake-key",
+        base_url=f"http://fake{ROUTE}",
+        poll_policy=policy,
+        max_inflight_jobs=len(documents),
+        chunk_pages=chunk_pages,
+        transport=httpx.ASGITransport(app=app),
+    )
+    finished: Dict[str, float] = {}
+
+    async def one(name: str, content: bytes):
+        result = await client.extract(content, SCHEMA, name=name)
+        finished[name] = time.monotonic()
+        return result
+
+    async with client:
+        results = await asyncio.gather(
+            *(one(name, content) for name, content in documents.items())
+        )
+    jobs = app.state.jobs.values()
+    ready = {}
+    for job in jobs:
+        document = job.name.split("_part")[0].removesuffix(".pdf") + ".pdf"
+        ready[document] = max(ready.get(document, 0.0), job.ready_at)
+    delays = [finished[name] - ready[name] for name in documents]
+    polls = sum(job.polls for job in jobs)
+    return dict(zip(documents, results)), delays, polls
+
+
+def report(label: str, delays: List[float], polls: int) -> None:
+    print(
+        f"{label:>9}: result after job done mean {statistics.mean(delays):6.2f}s"
+        f"  max {max(delays):6.2f}s  polls {polls:5d}"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    documents = {
+        f"doc{number:03d}.pdf": synthetic_pdf(rng.randint(1, args.max_pages))
+        for number in range(args.docs)
+    }
+
+    fixed = PollPolicy(
+        initial_interval=args.fixed_interval,
+        factor=1.0,
+        max_interval=args.fixed_interval,
+        jitter=0.0,
+    )
+    for label, policy in (("fixed", fixed), ("adaptive", PollPolicy())):
+        started = time.monotonic()
+        _, delays, polls = await run_policy(
+            policy, documents, args.base_seconds, args.page_seconds
+        )
+        report(label, delays, polls)
+        print(f"{'':>9}  wall {time.monotonic() - started:6.2f}s")
+
+    if args.chunk_pages:
+        results, delays, polls = await run_policy(
+            PollPolicy(),
+            documents,
+            args.base_seconds,
+            args.page_seconds,
+            args.chunk_pages,
+        )
+        report("chunked", delays, polls)
+        stitched = all(
+            results[name].extracted["pages"]
+            == [{"page": page % args.chunk_pages} for page in range(pages)]
+            for name, pages in (
+                (name, fitz.open(stream=content, filetype="pdf").page_count)
+                for name, content in documents.items()
+            )
+        )
+        print(f"chunked pages stitched in order: {stitched}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=20)
+    parser.add_argument("--max-pages", type=int, default=40)
+    parser.add_argument("--base-seconds", type=float, default=2.0)
+    parser.add_argument("--page-seconds", type=float, default=0.2)
+    parser.add_argument("--fixed-interval", type=float, default=15.0)
+    parser.add_argument("--chunk-pages", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
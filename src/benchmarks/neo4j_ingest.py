@@ -0,0 +1,87 @@
+"""Compare per-row and bulk UNWIND ingestion throughput against a local Neo4j.
+
+Start a throwaway container first, then point the settings at it::
+
+    docker run --rm -p 7687:7687 -e NEO4J_AUTH=neo4j/benchmark neo4j:4.4
+    NEO4J_URI=bolt://localhost:7687 NEO4J_USER=neo4j NEO4J_PASSWORD=benchmark \\
+        python -m src.benchmarks.neo4j_ingest --equipments 20 --details 40 --wipe
+
+Every run deletes all nodes in the target database, so it refuses to start
+unless it is given a dedicated ``--database`` or ``--wipe`` to confirm that
+the default database is disposable.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict
+
+from src.agents.datasheet.graph_agent.agent import CATEGORIES, GraphIngestionAgent
+from src.utils.neo4j_client import ingest_adm, neo4j_session
+
+DEFAULT_DATABASES = (None, "neo4j", "system")
+
+
+def synthetic_adm(equipments: int, details: int) -> Dict[str, Any]:
+    return {
+        "metadata": {"tag": "BENCH-P-001", "document_number": "BENCH-DS-001"},
+        "equipments": [
+            {
+                "equipment_name": f"BENCH-P-001-{eq}",
+                **{
+                    category: {
+                        f"property_{idx}": f"{eq}-{idx}" for idx in range(details)
+                    }
+                    for category in CATEGORIES[2:]
+                },
+            }
+            for eq in range(equipments)
+        ],
+    }
+
+
+def _reset(database: str | None) -> None:
+    with neo4j_session(database) as session:
+        session.run("MATCH (n) DETACH DELETE n").consume()
+
+
+async def _measure(
+    payload: Dict[str, Any], database: str | None, bulk: bool, batch_size: int
+) -> float:
+    _reset(database)
+    started = time.perf_counter()
+    await ingest_adm(payload, database, bulk=bulk, batch_size=batch_size)
+    return time.perf_counter() - started
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--equipments", type=int, default=5)
+    parser.add_argument("--details", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--database", default=None)
+    parser.add_argument(
+        "--wipe",
+        action="store_true",
+        help="allow deleting every node in the default database",
+    )
+    args = parser.parse_args()
+    if args.database in DEFAULT_DATABASES and not args.wipe:
+        parser.error(
+            "this benchmark deletes every node in the target database; pass a "
+            "throwaway --database, or --wipe if the default one is disposable"
+        )
+
+    payload = GraphIngestionAgent()._build_graph_payload(
+        synthetic_adm(args.equipments, args.details)
+    )
+    node_count = len(payload["nodes"])
+    print(f"payload: {node_count} nodes, {len(payload['relationships'])} relationships")
+    for label, bulk in (("per-row", False), ("bulk", True)):
+        elapsed = await _measure(payload, args.database, bulk, args.batch_size)
+        print(f"{label:>8}: {elapsed:8.2f}s  {node_count / elapsed:10.1f} nodes/sec")
+    _reset(args.database)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,126 @@
+"""Compare dict/loop and numpy OCR row layout on synthetic multi-page OCR JSON.
+
+Each page of ``--tokens`` Vision-style annotations is laid out into table
+text with the former per-token grouping loop and with
+``src/core/data_sheets/preprocessing/ocr_layout.py``; outputs are compared::
+
+    python -m src.benchmarks.ocr_layout --pages 20 --tokens 5000
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List, Tuple
+
+from src.data_sheets.preprocessing.pre_process_ocr_data import (
+    generate_sorted_x_coordinate_data,
+)
+
+THRESHOLD_X, THRESHOLD_Y = 25, 15
+
+
+def synthetic_pages(pages: int, tokens: int, seed: int = 7) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    ocr_pages = []
+    for page in range(pages):
+        annotations = []
+        for number in range(tokens):
+            # Tokens sit on text lines with a little vertical jitter.
+            x = rng.randrange(2400)
+            y = rng.randrange(170) * 20 + rng.randrange(-3, 4) + 10
+            width, height = rng.randrange(10, 80), rng.randrange(10, 18)
+            annotations.append(
+                {
+                    "description": rng.choice((f"w{number}", "1,250", "12.5", "PSI")),
+                    "bounding_poly": {
+                        "vertices": [
+                            {"x": x, "y": y},
+                            {"x": x + width, "y": y},
+                            {"x": x + width, "y": y + height},
+                            {"x": x, "y": y + height},
+                        ]
+                    },
+                }
+            )
+        ocr_pages.append({f"page_{page}.png": {"text_annotations": annotations}})
+    return ocr_pages
+
+
+def baseline_layout(json_data: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], str]:
+    """The per-token dict grouping and string concatenation it replaces."""
+    rows: Dict[int, List[Dict[str, Any]]] = {}
+    for annotation in next(iter(json_data.values()))["text_annotations"]:
+        vertices = annotation["bounding_poly"]["vertices"]
+        key = round(min(v["y"] for v in vertices) / THRESHOLD_Y) * THRESHOLD_Y
+        rows.setdefault(key, []).append(
+            {
+                "word": annotation["description"],
+                "x": [vertices[0]["x"], vertices[1]["x"]],
+                "y": [vertices[0]["y"], vertices[2]["y"]],
+            }
+        )
+    csv_data = ""
+    positions = []
+    for key in sorted(rows):
+        cells: List[Dict[str, Any]] = []
+        # Gaps are measured from the previous word's right edge, as before.
+        previous_x_max = None
+        for word in sorted(rows[key], key=lambda w: w["x"][0]):
+            text = word["word"].replace(",", "")
+            if cells and word["x"][0] - previous_x_max <= THRESHOLD_X:
+                cell = cells[-1]
+                cell["word"] += " " + text
+                cell["x"] = [
+                    min(cell["x"][0], word["x"][0]),
+                    max(cell["x"][1], word["x"][1]),
+                ]
+                cell["y"] = [
+                    min(cell["y"][0], word["y"][0]),
+                    max(cell["y"][1], word["y"][1]),
+                ]
+            else:
+                cells.append({"word": text, "x": list(word["x"]), "y": list(word["y"])})
+            previous_x_max = word["x"][1]
+        for cell in cells:
+            x_mid = round((cell["x"][0] + cell["x"][1]) / 2)
+            y_mid = round((cell["y"][0] + cell["y"][1]) / 2)
+            csv_data += f"{cell['word']} ({x_mid}, {y_mid})\n"
+            positions.append(
+                {
+                    "word": cell["word"],
+                    "x_min": cell["x"][0],
+                    "x_max": cell["x"][1],
+                    "y_min": cell["y"][0],
+                    "y_max": cell["y"][1],
+                }
+            )
+    return positions, csv_data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--tokens", type=int, default=5000)
+    args = parser.parse_args()
+
+    pages = synthetic_pages(args.pages, args.tokens)
+
+    started = time.perf_counter()
+    expected = [baseline_layout(page) for page in pages]
+    baseline_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    laid_out = [
+        generate_sorted_x_coordinate_data(page, THRESHOLD_X, THRESHOLD_Y)
+        for page in pages
+    ]
+    numpy_seconds = time.perf_counter() - started
+
+    print(f"{args.pages} pages x {args.tokens} tokens")
+    print(f"  loop layout:  {baseline_seconds:8.3f}s")
+    print(f"  numpy layout: {numpy_seconds:8.3f}s")
+    print(f"  outputs match: {laid_out == expected}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Compare linear and grid-indexed OCR table slicing on a synthetic page.
+
+Builds one page of ``--tokens`` Vision-style annotations, cuts it into
+``--tables`` table boxes and times the per-table linear scan against the
+index (built once, then queried per table); outputs are compared::
+
+    python -m src.benchmarks.ocr_page_index --tokens 5000 --tables 20
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List, Tuple
+
+from src.data_sheets.preprocessing.pre_process_ocr_data import (
+    extract_bounding_box,
+    is_inside_box,
+)
+from src.utils.ocr_page_index import OcrPageIndex
+
+PAGE_WIDTH, PAGE_HEIGHT = 2480, 3508
+
+
+def synthetic_page(tokens: int, seed: int = 7) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    annotations = []
+    for number in range(tokens):
+        x, y = rng.randrange(PAGE_WIDTH - 80), rng.randrange(PAGE_HEIGHT - 20)
+        width, height = rng.randrange(10, 80), rng.randrange(10, 20)
+        annotations.append(
+            {
+                "description": f"w{number}",
+                "bounding_poly": {
+                    "vertices": [
+                        {"x": x, "y": y},
+                        {"x": x + width, "y": y},
+                        {"x": x + width, "y": y + height},
+                        {"x": x, "y": y + height},
+                    ]
+                },
+            }
+        )
+    return {"page_1.png": {"text_annotations": annotations}}
+
+
+def table_boxes(tables: int) -> List[List[Tuple[int, int]]]:
+    band = PAGE_HEIGHT // tables
+    return [
+        [
+            (100, row * band),
+            (PAGE_WIDTH - 100, row * band),
+            (100, (row + 1) * band),
+            (PAGE_WIDTH - 100, (row + 1) * band),
+        ]
+        for row in range(tables)
+    ]
+
+
+def linear_extract(data: Dict[str, Any], bounding_box) -> Dict[str, Any]:
+    return {
+        page: {
+            "text_annotations": [
+                annotation
+                for annotation in annotations["text_annotations"]
+                if is_inside_box(bounding_box, annotation["bounding_poly"]["vertices"])
+            ]
+        }
+        for page, annotations in data.items()
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=5000)
+    parser.add_argument("--tables", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    page = synthetic_page(args.tokens)
+    boxes = table_boxes(args.tables)
+    annotations = page["page_1.png"]["text_annotations"]
+
+    started = time.perf_counter()
+    OcrPageIndex.from_annotations(annotations)
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        expected = [linear_extract(page, box) for box in boxes]
+    linear_seconds = (time.perf_counter() - started) / (args.repeat * len(boxes))
+
+    extract_bounding_box(page, boxes[0])
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        indexed = [extract_bounding_box(page, box) for box in boxes]
+    indexed_seconds = (time.perf_counter() - started) / (args.repeat * len(boxes))
+
+    print(
+        f"{args.tokens} tokens, {len(boxes)} tables, index build {build_seconds * 1e3:.2f}ms"
+    )
+    print(f"  linear scan per table: {linear_seconds * 1e3:8.3f}ms")
+    print(f"  indexed per table:     {indexed_seconds * 1e3:8.3f}ms")
+    print(f"  outputs match: {indexed == expected}")
+
+
+if __name__ == "__main__":
+    main()
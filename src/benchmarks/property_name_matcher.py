@@ -0,0 +1,155 @@
+"""Compare pairwise fuzzywuzzy scoring and the bounded property-name matcher.
+
+Builds a synthetic standard-property table (``--rows`` rows with alternate
+names) and an OCR paragraph of a table with as many rows, then runs
+``select_best_match`` in both matching modes against the pairwise loops it
+replaced and checks that every output is identical::
+
+    python -m src.benchmarks.property_name_matcher --rows 300 --seeds 5
+"""
+
+import argparse
+import random
+import string
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+from fuzzywuzzy import fuzz
+
+from src.data_sheets.constant import split_alternate_names
+from src.data_sheets.property_name_extraction.get_property_name import (
+    combine_standard_property_names,
+    select_best_match,
+)
+
+VOCABULARY = (
+    "design operating pressure temperature flow rate inlet outlet max min "
+    "normal density viscosity molecular weight head power speed efficiency "
+    "capacity material shell tube nozzle size rating corrosion allowance "
+    "test hydrostatic volume level suction discharge differential npsh"
+).split()
+
+
+def _name(rng: random.Random) -> str:
+    words = rng.sample(VOCABULARY, rng.randint(1, 3))
+    if rng.random() < 0.3:
+        words.append(rng.choice(string.ascii_uppercase) + str(rng.randint(1, 9)))
+    return " ".join(words).title()
+
+
+def synthetic_standard_df(rows: int, rng: random.Random) -> pd.DataFrame:
+    records = []
+    for _ in range(rows):
+        alternates = [_name(rng) for _ in range(rng.randint(0, 4))]
+        records.append(
+            {
+                "standard_property_name": _name(rng).lower().replace(" ", "_"),
+                "alternate_names": ",".join(alternates),
+            }
+        )
+    return split_alternate_names(pd.DataFrame(records))
+
+
+def synthetic_paragraph(rows: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(rows):
+        name = _name(rng)
+        if rng.random() < 0.3:
+            # OCR noise: drop a character.
+            position = rng.randrange(len(name))
+            name = name[:position] + name[position + 1 :]
+        lines.append(f"{name} {rng.randint(1, 900)}.{rng.randint(0, 9)} kPa")
+    return "\n".join(lines)
+
+
+def baseline_present(properties: List[str], paragraph: str, threshold=40) -> List[str]:
+    words = paragraph.lower().split()
+    return [
+        prop
+        for prop in properties
+        if any(fuzz.ratio(prop.lower(), word) >= threshold for word in words)
+    ]
+
+
+def baseline_row(
+    paragraph: str, row_properties: List[str], threshold=45
+) -> Optional[str]:
+    words = paragraph.lower().split()
+    matched_word = None
+    matched_accuracy = 0
+    for prop in row_properties:
+        for word in words:
+            ratio = fuzz.ratio(prop.lower(), word.lower())
+            if ratio >= threshold and ratio > matched_accuracy:
+                matched_word = prop
+                matched_accuracy = ratio
+    return matched_word
+
+
+def baseline_select(columns: List[str], df: pd.DataFrame, paragraph: str, mode: str):
+    properties = combine_standard_property_names(df, columns)
+    if mode == "all":
+        return properties
+    if mode == "paragraph":
+        return baseline_present(properties, paragraph)
+    filtered: Dict[str, Any] = {}
+    for _, row in df.iterrows():
+        row_properties = [row[col] for col in columns if pd.notna(row[col])]
+        best_match = baseline_row(paragraph, row_properties)
+        if best_match:
+            filtered[row["standard_property_name"]] = best_match
+    return list(filtered.values())
+
+
+def _timed(func: Callable[[], Any]) -> tuple:
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=300)
+    parser.add_argument("--seeds", type=int, default=5)
+    args = parser.parse_args()
+
+    modes = {"paragraph": (True, False), "row": (True, True)}
+    totals = {mode: [0.0, 0.0] for mode in modes}
+    mismatches = 0
+    for seed in range(args.seeds):
+        rng = random.Random(seed)
+        df = synthetic_standard_df(args.rows, rng)
+        paragraph = synthetic_paragraph(args.rows, rng)
+        columns = [
+            column
+            for column in df.columns
+            if column.startswith("alternate_name") or column == "standard_property_name"
+        ]
+        for mode, (match_in_paragraph, match_one_property_in_row) in modes.items():
+            expected, baseline_seconds = _timed(
+                lambda: baseline_select(columns, df, paragraph, mode)
+            )
+            result, matcher_seconds = _timed(
+                lambda: select_best_match(
+                    columns,
+                    df,
+                    paragraph,
+                    match_in_paragraph,
+                    match_one_property_in_row,
+                )
+            )
+            totals[mode][0] += baseline_seconds
+            totals[mode][1] += matcher_seconds
+            mismatches += result != expected
+
+    for mode, (baseline_seconds, matcher_seconds) in totals.items():
+        print(
+            f"{mode:>9}: pairwise {baseline_seconds / args.seeds:8.3f}s"
+            f"  matcher {matcher_seconds / args.seeds:8.3f}s  (per table)"
+        )
+    print(f"outputs identical: {mismatches == 0} ({mismatches} mismatches)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Page rasterization throughput at different worker counts.
+
+Renders a PDF (``--pdf``, or a synthetic ``--pages``-page datasheet pack)
+with ``src/utils/rasterizer.py`` at each worker count and reports pages per
+second, plus a byte comparison of the 1-worker PNG output against the
+previous sequential ``pil_save`` renderer::
+
+    python -m src.benchmarks.rasterizer --pages 60 --workers 1 2 4 8
+"""
+
+import argparse
+import io
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+import fitz  # pymupdf
+
+from src.utils.rasterizer import PageRasterizer, RasterOptions
+
+
+def synthetic_pdf(path: Path, pages: int) -> None:
+    doc = fitz.open()
+    for number in range(pages):
+        page = doc.new_page(width=842, height=595)  # A4 landscape
+        for row in range(40):
+            y = 40 + row * 13
+            page.draw_line((30, y - 10), (812, y - 10), color=(0.6, 0.6, 0.6))
+            page.insert_text(
+                (36, y),
+                f"P-{number:03d} ITEM {row:02d}  DESIGN PRESSURE  "
+                f"{row * 1.5:7.2f} barg  TEMPERATURE {120 + row:4d} C  "
+                "MATERIAL SA-516-70",
+                fontsize=8,
+            )
+        page.draw_rect(fitz.Rect(30, 20, 812, 575), color=(0, 0, 0), width=1.2)
+    doc.save(str(path))
+    doc.close()
+
+
+def sequential_png(pdf_path: Path) -> Dict[int, bytes]:
+    """The renderer it replaces: one page at a time, Matrix(2, 2), pil_save."""
+    images = {}
+    doc = fitz.open(str(pdf_path))
+    for index in range(doc.page_count):
+        pix = doc.load_page(index).get_pixmap(matrix=fitz.Matrix(2, 2))
+        buffer = io.BytesIO()
+        pix.pil_save(buffer, format="PNG")
+        images[index] = buffer.getvalue()
+    doc.close()
+    return images
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pdf", type=Path)
+    parser.add_argument("--pages", type=int, default=60)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--format", default="png", choices=["png", "webp", "jpeg"])
+    parser.add_argument("--dpi", type=int, default=144)
+    parser.add_argument("--max-inflight", type=int, default=16)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = args.pdf
+        if pdf_path is None:
+            pdf_path = Path(tmp) / "synthetic.pdf"
+            synthetic_pdf(pdf_path, args.pages)
+
+        started = time.perf_counter()
+        baseline = sequential_png(pdf_path)
+        seconds = time.perf_counter() - started
+        print(f"sequential pil_save: {len(baseline) / seconds:7.2f} pages/s")
+
+        options = RasterOptions(dpi=args.dpi, image_format=args.format)
+        for workers in args.workers:
+            rasterizer = PageRasterizer(workers, options, args.max_inflight)
+            try:
+                # Warm the pool so process start-up is not timed.
+                next(rasterizer.iter_pages(pdf_path, pages=[0]))
+                started = time.perf_counter()
+                pages = {page.index: page for page in rasterizer.iter_pages(pdf_path)}
+                seconds = time.perf_counter() - started
+            finally:
+                rasterizer.close()
+            size = sum(len(page.data) for page in pages.values()) / len(pages)
+            line = (
+                f"{workers:>2} workers: {len(pages) / seconds:7.2f} pages/s"
+                f"  {size / 1024:8.1f} KiB/page"
+            )
+            if workers == 1 and args.format == "png" and args.dpi == 144:
+                same = all(pages[i].data == data for i, data in baseline.items())
+                line += f"  identical to sequential: {same}"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Peak RSS per in-flight document: in-memory bytes vs. spooled documents.
+
+Builds a synthetic scanned PDF of about ``--size-mb`` MB and, in a fresh
+process per mode, runs ``--concurrent`` copies of it at once through the
+request path's memory-relevant steps: take the upload, POST it for
+classification, open it with PyMuPDF and render page 1, and submit it for
+vision extraction (``LandingAIClient`` against an in-process mock that
+drains the body). The ``bytes`` mode reads the upload into memory and
+passes copies around as the API did. The ``spooled`` mode streams it to
+disk as a ``SpooledDocument`` (``src/utils/spooled_document.py``) and
+hands out file views::
+
+    python -m src.benchmarks.spooled_documents --size-mb 100 --concurrent 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import fitz  # pymupdf
+import httpx
+from starlette.datastructures import UploadFile
+
+from src.utils.landing_ai_client import LandingAIClient
+from src.utils.spooled_document import SpooledDocument
+
+SCHEMA = {"type": "object", "properties": {"tag": {}}}
+
+
+def rss_mb() -> float:
+    with open("/proc/self/statm", encoding="utf-8") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def synthetic_scan(path: Path, size_mb: int) -> None:
+    """Pages of incompressible noise, so the file size tracks `size_mb`."""
+    doc = fitz.open()
+    side = 2000  # 2000 x 2000 RGB noise: ~12 MB of PNG per page
+    pages = max(1, round(size_mb / (side * side * 3 / 2**20)))
+    for _ in range(pages):
+        samples = os.urandom(side * side * 3)
+        noise = fitz.Pixmap(fitz.csRGB, side, side, samples, False)
+        page = doc.new_page(width=595, height=842)
+        page.insert_image(page.rect, stream=noise.tobytes("png"))
+    doc.save(str(path))
+    doc.close()
+
+
+class DrainTransport(httpx.AsyncBaseTransport):
+    """Reads request bodies chunk by chunk and discards them.
+
+    (``httpx.MockTransport`` buffers the whole body before its handler runs.)
+    """
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async for _ in request.stream:
+            pass
+        if request.url.path.endswith("classify"):
+            return httpx.Response(200, json={"prediction": {"label": "datasheet"}})
+        return httpx.Response(200, json={"data": {"extracted_schema": {"tag": "P-1"}}})
+
+
+async def run_bytes(pdf: Path, workdir: Path, http: httpx.AsyncClient, vision):
+    with pdf.open("rb") as source:
+        upload = UploadFile(source, filename="scan.pdf")
+        document_bytes = await upload.read()
+    await http.post("http://stub/classify", content=document_bytes)
+    pdf_path = workdir / "input.pdf"
+    pdf_path.write_bytes(document_bytes)
+    with fitz.open(stream=document_bytes, filetype="pdf") as doc:
+        doc[0].get_pixmap(dpi=36)
+    await vision.extract(pdf_path.read_bytes(), SCHEMA, name="input.pdf")
+
+
+async def run_spooled(pdf: Path, workdir: Path, http: httpx.AsyncClient, vision):
+    with pdf.open("rb") as source:
+        upload = UploadFile(source, filename="scan.pdf")
+        document = await SpooledDocument.from_upload(upload, workdir / "input.pdf")
+    await http.post(
+        "http://stub/classify",
+        content=document.iter_chunks(),
+        headers={"Content-Length": str(document.size)},
+    )
+    with document.open_pdf() as doc:
+        doc[0].get_pixmap(dpi=36)
+    await vision.extract(document.path, SCHEMA)
+
+
+async def child(mode: str, pdf: Path, concurrent: int) -> dict:
+    transport = DrainTransport()
+    baseline = rss_mb()
+    run = run_bytes if mode == "bytes" else run_spooled
+    vision = LandingAIClient("stub", base_url="http://stub/vision", transport=transport)
+    async with httpx.AsyncClient(transport=transport) as http, vision:
+        with tempfile.TemporaryDirectory() as tmp:
+            workdirs = [Path(tmp) / str(number) for number in range(concurrent)]
+            for workdir in workdirs:
+                workdir.mkdir()
+            await asyncio.gather(
+                *(run(pdf, workdir, http, vision) for workdir in workdirs)
+            )
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return {"baseline_mb": baseline, "peak_mb": peak}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=100)
+    parser.add_argument("--concurrent", type=int, default=4)
+    parser.add_argument("--child", choices=["bytes", "spooled"])
+    parser.add_argument("--pdf", type=Path)
+    args = parser.parse_args()
+
+    if args.child:
+        result = asyncio.run(child(args.child, args.pdf, args.concurrent))
+        print(json.dumps(result))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = Path(tmp) / "scan.pdf"
+        synthetic_scan(pdf, args.size_mb)
+        size = pdf.stat().st_size / 2**20
+        print(f"synthetic scan: {size:.0f} MB, {args.concurrent} in flight")
+        for mode in ("bytes", "spooled"):
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    __spec__.name,
+                    "--child",
+                    mode,
+                    "--pdf",
+                    str(pdf),
+                    "--concurrent",
+                    str(args.concurrent),
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            growth = result["peak_mb"] - result["baseline_mb"]
+            print(
+                f"{mode:>8}: peak RSS {result['peak_mb']:7.0f} MB"
+                f"  (+{growth:6.0f} MB, {growth / args.concurrent:6.0f} MB/document)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -33,6 +33,46 @@ class Settings(BaseSettings):
     neo4j_uri: str = Field(..., env="NEO4J_URI")
     neo4j_user: str = Field(..., env="NEO4J_USER")
     neo4j_password: str = Field(..., env="NEO4J_PASSWORD")
+    neo4j_bulk_ingest: bool = Field(
+        True, env="NEO4J_BULK_INGEST",
+        description="Write graph payloads as batched UNWIND statements",
+    )
+    neo4j_batch_size: int = Field(
+        500, env="NEO4J_BATCH_SIZE", description="Rows per UNWIND batch in bulk ingest",
+    )
+    neo4j_diff_ingest: bool = Field(
+        False, env="NEO4J_DIFF_INGEST",
+        description="Write only nodes that changed since the last ingestion of an ADM",
+    )
+
+    # PDF rasterization
+    rasterizer_workers: int = Field(
+        4, env="RASTERIZER_WORKERS",
+        description="Processes rendering PDF pages; 1 renders in-process",
+    )
+    rasterizer_dpi: int = Field(144, env="RASTERIZER_DPI")
+    rasterizer_format: str = Field(
+        "png", env="RASTERIZER_FORMAT", description="png, webp or jpeg",
+    )
+    rasterizer_quality: int = Field(
+        85, env="RASTERIZER_QUALITY", description="WebP/JPEG quality",
+    )
+    rasterizer_max_inflight_pages: int = Field(
+        16, env="RASTERIZER_MAX_INFLIGHT_PAGES",
+        description="Pages rendering or awaiting the caller at any time",
+    )
+
+    # Batch orchestration
+    batch_workers: int = Field(
+        8, env="BATCH_WORKERS", description="Documents processed at once per process",
+    )
+    batch_max_queued_documents: int = Field(
+        200, env="BATCH_MAX_QUEUED_DOCUMENTS",
+        description="Queued plus running documents before batches get HTTP 429",
+    )
+    batch_classify_concurrency: int = Field(8, env="BATCH_CLASSIFY_CONCURRENCY")
+    batch_vision_concurrency: int = Field(4, env="BATCH_VISION_CONCURRENCY")
+    batch_graph_concurrency: int = Field(2, env="BATCH_GRAPH_CONCURRENCY")
 
     # Storage & misc
     storage_account: Optional[str] = Field(None, env="STORAGE_ACCOUNT")
@@ -42,6 +82,28 @@ class Settings(BaseSettings):
         env="VA_API_KEY",
         description="Landing AI Agentic Document Analysis API key",
     )
+    landing_ai_base_url: str = Field(
+        "https://api.va.landing.ai/v1/tools/agentic-document-analysis",
+        env="LANDING_AI_BASE_URL",
+    )
+    landing_ai_poll_initial_seconds: float = Field(
+        1.0, env="LANDING_AI_POLL_INITIAL_SECONDS",
+        description="First delay before polling a Landing AI job; grows 1.5x per poll",
+    )
+    landing_ai_poll_max_interval_seconds: float = Field(
+        10.0, env="LANDING_AI_POLL_MAX_INTERVAL_SECONDS",
+    )
+    landing_ai_poll_max_wait_seconds: float = Field(
+        900.0, env="LANDING_AI_POLL_MAX_WAIT_SECONDS",
+        description="Give up on a Landing AI job after this long",
+    )
+    landing_ai_max_inflight_jobs: int = Field(
+        8, env="LANDING_AI_MAX_INFLIGHT_JOBS",
+    )
+    landing_ai_chunk_pages: int = Field(
+        0, env="LANDING_AI_CHUNK_PAGES",
+        description="Split PDFs into chunks of this many pages; 0 sends them whole",
+    )
     skip_classifier: bool = Field(False, env="SKIP_CLASSIFIER")
 
     model_config = SettingsConfigDict(
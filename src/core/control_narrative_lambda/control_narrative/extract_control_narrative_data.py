@@ -22,6 +22,7 @@ from src.core.control_narrative_lambda.constant import (
     prompt_instrument,
 )
 from src.core.utils.llm_models.get_llm import get_llm_model
+from src.core.utils.llm_models.response_cache import cached_chain_call
 from src.core.control_narrative_lambda.postprocessing.postprocess import (
     postprocess_control_narrative,
 )
@@ -42,6 +43,17 @@ def _chunks(data, n):
         yield data[i : i + n]
 
 
+def _parse_response(text):
+    """Parse a control narrative JSON answer, fenced or not."""
+    return json.loads(text.replace("```json", "").replace("```", ""))
+
+
+def _is_json_output(text):
+    """Whether a response parses with `_parse_response`; only those are cached."""
+    _parse_response(text)
+    return True
+
+
 def _get_prompt_template_name_and_response(prompt_text, llm, control_narrative_text):
     """
     Retrieves a prompt template name and response from the OpenAI Chat API based
@@ -53,10 +65,13 @@ def _get_prompt_template_name_and_response(prompt_text, llm, control_narrative_t
     )
     name_chain = LLMChain(llm=llm, prompt=prompt_template_name)
     with get_openai_callback() as cb_response:
-        response = name_chain(
+        response = cached_chain_call(
+            name_chain,
             {
                 "control_narrative_text_string": control_narrative_text,
-            }
+            },
+            "control_narrative",
+            validate=_is_json_output,
         )
     return prompt_template_name, cb_response, response
 
@@ -77,8 +92,7 @@ def _extract_control_data_by_prompt(extract_control_data_by_prompt_args):
     _, _, response = _get_prompt_template_name_and_response(
         prompt_text, llm, control_narrative_text
     )
-    result_string = response["text"].replace("```json", "").replace("```", "")
-    result_object = json.loads(result_string)
+    result_object = _parse_response(response["text"])
     add_narrative_id(result_object, id_number)
     logger.info("DONE: Extract_Data_By_Prompt function completed")
     return result_object
@@ -1,6 +1,8 @@
 """Extract narrative data from pdf file."""
 
+import os
 import json
+import asyncio
 from dotenv import load_dotenv
 from src.utils.log import logger
 from src.control_narrative_rag_junior.connection_data_extraction.narrative_llm import (
@@ -12,9 +14,8 @@ from src.prompts.prompt import (
     CONTROL_NARRATIVE_CONTROL_LOOPS_PROMPT_RAG_JUNIOR_PATH,
     CONTROL_NARRATIVE_CONTROLLER_PROMPT_RAG_JUNIOR_PATH,
 )
-from src.utils.get_junior_response import (
-    get_document_data_from_junior_app_runner,
-)
+from src.utils.get_junior_response import junior_client
+from src.utils.work_graph import StorageCheckpoint, WorkGraphExecutor
 from src.utils.get_equipment_index import save_process_equipment_index
 from src.data_sheets.constant import (
     get_asset_details_from_s3,
@@ -22,11 +23,16 @@ from src.data_sheets.constant import (
 
 load_dotenv()
 
+CONTROL_NARRATIVE_CONCURRENCY = int(os.getenv("CONTROL_NARRATIVE_CONCURRENCY", "8"))
+CONTROL_NARRATIVE_RATE_PER_SECOND = float(
+    os.getenv("CONTROL_NARRATIVE_RATE_PER_SECOND", "0")
+)
+
 
-def _extracted_junior_data_for_a_query(model_name, document_id, question):
+async def _extracted_junior_data_for_a_query(model_name, document_id, question):
     """Extract narrative data using Junior API"""
     logger.info("Init: Extracting narrative data using Junior API")
-    junior_extracted_output = get_document_data_from_junior_app_runner(
+    junior_extracted_output = await junior_client.ask(
         model_name, question, [], document_id
     )
     if junior_extracted_output.status_code == 200:
@@ -45,90 +51,138 @@ def _extracted_junior_data_for_a_query(model_name, document_id, question):
     return None
 
 
-def _extract_controllers_for_asset_junior(model_name, document_id, asset_name):
+def _junior_answer(executor, model_name, document_id, question):
+    """Ask Junior through the executor; identical questions are asked once."""
+    return executor.call(
+        lambda: _extracted_junior_data_for_a_query(model_name, document_id, question),
+        dedupe_key=("junior", document_id, question),
+    )
+
+
+def _extract_controllers_for_asset_junior(executor, model_name, document_id, asset_name):
     """Extract controllers for a specific asset."""
     controller_question = f"In {asset_name}, list all controllers present."
-    return _extracted_junior_data_for_a_query(
-        model_name, document_id, controller_question
-    )
+    return _junior_answer(executor, model_name, document_id, controller_question)
 
 
 def _extract_control_loops_for_asset_junior(
-    model_name, document_id, asset_name, controller_key
+    executor, model_name, document_id, asset_name, controller_key
 ):
     """Extract control loops for a specific asset."""
     control_loop_question = f"""In {asset_name}, for controller {controller_key},
     specify the transmitter tags that senses its process variable with proper description,
     and also specify the control valve tags which adjusts to maintain the desired position
     with proper description. Also describe the controller {controller_key}"""
-    junior_control_loop_output = _extracted_junior_data_for_a_query(
-        model_name, document_id, control_loop_question
+    return _junior_answer(executor, model_name, document_id, control_loop_question)
+
+
+async def _controller_task(executor, model_name, document_id, asset_name):
+    """Retrieve and structure the controllers of one asset."""
+    junior_controller_output = await _extract_controllers_for_asset_junior(
+        executor, model_name, document_id, asset_name
+    )
+    logger.info(f"junior_controller_output {junior_controller_output}")
+    if not junior_controller_output:
+        return None
+    controller_text = f"""{asset_name}: {junior_controller_output}"""
+    prompt_template = get_prompt(CONTROL_NARRATIVE_CONTROLLER_PROMPT_RAG_JUNIOR_PATH)
+    controller_data = await executor.call(
+        lambda: asyncio.to_thread(
+            get_controller_data, model_name, controller_text, prompt_template
+        )
+    )
+    logger.info(f"controller_data {controller_data}")
+    return controller_data
+
+
+async def _control_loop_task(executor, model_name, document_id, asset_name, key):
+    """Retrieve and structure the control loop of one asset/controller pair."""
+    junior_control_loop_output = await _extract_control_loops_for_asset_junior(
+        executor, model_name, document_id, asset_name, key
+    )
+    logger.info(f"junior_control_loop_output {junior_control_loop_output}")
+    prompt_template_control_loop = get_prompt(
+        CONTROL_NARRATIVE_CONTROL_LOOPS_PROMPT_RAG_JUNIOR_PATH
     )
-    return junior_control_loop_output
+    control_loop_text = f"""
+                    {asset_name} (controller {key}): {junior_control_loop_output}
+                    """
+    control_loop_data = await executor.call(
+        lambda: asyncio.to_thread(
+            get_control_loop_data,
+            model_name,
+            control_loop_text,
+            prompt_template_control_loop,
+        )
+    )
+    if control_loop_data:
+        logger.info(f"control_loop_data {control_loop_data}")
+    return control_loop_data
 
 
-def get_extracted_data_for_all_query(document_id, model_name, asset_name_list):
+async def _asset_task(executor, model_name, document_id, asset_name):
+    """Run the controller task of an asset, then all of its control loop tasks."""
+    controller_data = await executor.run_task(
+        f"controllers/{asset_name}",
+        lambda: _controller_task(executor, model_name, document_id, asset_name),
+    )
+    if not controller_data:
+        return []
+    controllers = controller_data[0].get("controller", {})
+    control_loops = await asyncio.gather(
+        *(
+            executor.run_task(
+                f"control_loop/{asset_name}/{key}",
+                lambda key=key: _control_loop_task(
+                    executor, model_name, document_id, asset_name, key
+                ),
+            )
+            for key in controllers
+        )
+    )
+    output_json_data = []
+    for control_loop_data in control_loops:
+        if control_loop_data:
+            output_json_data.extend(control_loop_data)
+    return output_json_data
+
+
+async def get_extracted_data_for_all_query(
+    document_id, model_name, asset_name_list, checkpoint=None
+):
     """Extract Extraction of control loops of all
-    the assets in control narrative data.."""
+    the assets in control narrative data..
+
+    Every asset and asset/controller pair is a task on a shared
+    WorkGraphExecutor: Junior and LLM calls run concurrently under
+    CONTROL_NARRATIVE_CONCURRENCY and CONTROL_NARRATIVE_RATE_PER_SECOND,
+    repeated questions are asked once, and finished tasks are recorded in
+    `checkpoint` when given. Output keeps asset, then controller, order.
+    """
     logger.info(
         "Init: Extracting control loops of all the assets in control narrative data."
     )
-    output_json_data = []
-    junior_data = {}
-    control_loop_junior_data = {}
-    controller_json_data = []
-    for asset_name in asset_name_list:
-        junior_controller_output = _extract_controllers_for_asset_junior(
-            model_name, document_id, asset_name
-        )
-        logger.info(f"junior_controller_output {junior_controller_output}")
-        if junior_controller_output:
-            controller_text = f"""{asset_name}: {junior_controller_output}"""
-            prompt_template = get_prompt(
-                CONTROL_NARRATIVE_CONTROLLER_PROMPT_RAG_JUNIOR_PATH
-            )
-            controller_data = get_controller_data(
-                model_name, controller_text, prompt_template
+    executor = WorkGraphExecutor(
+        concurrency=CONTROL_NARRATIVE_CONCURRENCY,
+        rate_per_second=CONTROL_NARRATIVE_RATE_PER_SECOND,
+        checkpoint=checkpoint,
+    )
+    try:
+        asset_results = await asyncio.gather(
+            *(
+                _asset_task(executor, model_name, document_id, asset_name)
+                for asset_name in asset_name_list
             )
-            junior_data[f"{asset_name}"] = junior_controller_output
-            controller_json_data.extend(controller_data)
-            logger.info(f"controller_data {controller_data}")
-            if controller_data:
-                controllers = controller_data[0].get("controller", {})
-                for key, _ in controllers.items():
-                    junior_control_loop_output = _extract_control_loops_for_asset_junior(
-                        model_name, document_id, asset_name, key
-                    )
-                    logger.info(
-                        f"junior_control_loop_output {junior_control_loop_output}"
-                    )
-                    control_loop_junior_data[f"{asset_name}_{key}"] = (
-                        junior_control_loop_output
-                    )
-                    prompt_template_control_loop = get_prompt(
-                        CONTROL_NARRATIVE_CONTROL_LOOPS_PROMPT_RAG_JUNIOR_PATH
-                    )
-                    control_loop_text = f"""
-                    {asset_name} (controller {key}): {junior_control_loop_output}
-                    """
-                    control_loop_data = get_control_loop_data(
-                        model_name,
-                        control_loop_text,
-                        prompt_template_control_loop,
-                    )
-                    if control_loop_data:
-                        logger.info(f"control_loop_data {control_loop_data}")
-                        output_json_data.extend(control_loop_data)
-        logger.info(
-            "Done: Extraction of control loops of all "
-            "the assets in control narrative data."
         )
-    # _save_control_loop_local(
-    #     junior_data=junior_data,
-    #     controller_json_data=controller_json_data,
-    #     output_json_data=output_json_data,
-    #     control_loop_junior_data=control_loop_junior_data,
-    # )
+    finally:
+        if checkpoint is not None:
+            await checkpoint.save()
+        executor.report()
+    output_json_data = [item for result in asset_results for item in result]
+    logger.info(
+        "Done: Extraction of control loops of all "
+        "the assets in control narrative data."
+    )
     return output_json_data
 
 
@@ -171,9 +225,14 @@ async def get_control_loops_data(bucket_name, plant_id, document_id, model_name)
     )
     await save_process_equipment_index(bucket_name, plant_id, asset_table_list_path)
     asset_name_list = await get_asset_details_from_s3(bucket_name, asset_table_list_path)
-    control_loop_data = get_extracted_data_for_all_query(
-        document_id, model_name, asset_name_list
+    checkpoint = await StorageCheckpoint(
+        bucket_name,
+        f"{plant_id}/documents/control_narrative/{document_id}/control_loops_checkpoint.json",
+    ).load()
+    control_loop_data = await get_extracted_data_for_all_query(
+        document_id, model_name, asset_name_list, checkpoint
     )
+    await checkpoint.save(complete=True)
     logger.info(
         "Done: Extraction of control loops of all "
         "the assets in control narrative data."
@@ -8,6 +8,7 @@ from langchain.prompts import PromptTemplate
 from langchain.chains import LLMChain
 from src.utils.log import logger
 from src.utils.llm_models.get_llm import get_llm_model
+from src.utils.llm_models.response_cache import cached_chain_call, is_json_response
 
 
 def get_prompt(prompt_path):
@@ -66,7 +67,9 @@ def control_narrative_llm_extraction(model_name, narrative_text_string, prompt_t
     inputs = {
         "narrative_text_string": narrative_text_string,
     }
-    response = name_chain(inputs=inputs)
+    response = cached_chain_call(
+        name_chain, inputs, "cn_rag_junior", validate=is_json_response
+    )
     result_string = response["text"].replace("```json", "").replace("`", "")
     # print("LLM response: ", result_string)
     result_object = extract_json_from_text(result_string)
@@ -7,6 +7,7 @@ import os
 import pandas as pd
 from src.utils.log import logger
 from src.utils.s3_download_upload import read_csv_from_storage
+from src.data_sheets.standard_property_registry import standard_registry
 
 table_name = [
     "description",
@@ -68,18 +69,22 @@ columns_table_format_1_data = ["standard_property_name", "property_name", "value
 
 
 def get_standard_property_df(property_name_list_path):
-    """Load property names from a CSV file and return as a DataFrame."""
+    """Load property names from a CSV file and return as a DataFrame.
+
+    The file is parsed once by the standard property registry; callers get
+    their own copy.
+    """
     logger.info(f"Attempting to load property names from: {property_name_list_path}")
     if not os.path.exists(property_name_list_path):
         logger.error(f"File not found: {property_name_list_path}")
         return []
 
     try:
-        property_name_df = pd.read_csv(property_name_list_path)
+        property_name_df = standard_registry.frame(property_name_list_path)
     except FileNotFoundError as e:
         logger.error(f"Error reading file: {e}")
         return []
-    return property_name_df
+    return property_name_df.copy()
 
 
 def get_specific_standard_df(combined_df, asset_class):
@@ -145,7 +150,9 @@ def update_ground_truth_extracted_standard_property_name(
 async def get_asset_names_from_s3(bucket, s3_file_path):
     """Get asset names from csv"""
     # df = pd.read_csv(file_path)
-    df = await read_csv_from_storage(bucket, s3_file_path)
+    df = await standard_registry.asset_table(
+        bucket, s3_file_path, read_csv_from_storage
+    )
     df_cleaned = df.dropna()
     if "asset_name" not in df.columns:
         logger.error("asset_name not found in the csv file")
@@ -157,7 +164,9 @@ async def get_asset_names_from_s3(bucket, s3_file_path):
 
 async def get_asset_details_from_s3(bucket, s3_file_path):
     """Get asset names and tag from csv"""
-    df = await read_csv_from_storage(bucket, s3_file_path)
+    df = await standard_registry.asset_table(
+        bucket, s3_file_path, read_csv_from_storage
+    )
     df_cleaned = df.dropna()
     if "asset_name" not in df.columns or "asset_tag" not in df.columns:
         logger.error("asset_name or asset_tag not found in the csv file")
@@ -3,18 +3,29 @@
 import numpy as np
 import pandas as pd
 from src.utils.log import logger
-from src.data_sheets.constant import (
-    get_standard_property_df,
-    standard_property_name_list_path
-)
+from src.data_sheets.constant import standard_property_name_list_path
+from src.data_sheets.standard_property_registry import standard_registry
+
+
+def _standard_asset_classes(standard_property_name_df):
+    standard_property_name_df = standard_property_name_df.replace({'asset_class': {np.nan: None}})
+    return tuple(standard_property_name_df['asset_class'].dropna().unique().tolist())
+
+
+def _standard_table_names(standard_property_name_df):
+    possible_table_columns = standard_property_name_df.filter(like='possible_table_')
+    unique_table_name = (pd.unique(possible_table_columns.values.ravel()).tolist())
+    return tuple(x for x in unique_table_name if pd.notna(x))
 
 
 def get_asset_class():
     """Returns the asset class"""
     logger.info("get standard asset_class")
-    standard_property_name_df = get_standard_property_df(standard_property_name_list_path)
-    standard_property_name_df = standard_property_name_df.replace({'asset_class': {np.nan: None}})
-    standard_asset_class = standard_property_name_df['asset_class'].dropna().unique().tolist()
+    standard_asset_class = list(
+        standard_registry.derived(
+            standard_property_name_list_path, "asset_classes", _standard_asset_classes
+        )
+    )
     logger.info(f"DONE: get standard asset_class, {standard_asset_class}")
     return standard_asset_class
 
@@ -22,9 +33,10 @@ def get_asset_class():
 def get_table_name():
     """Returns the table_name"""
     logger.info("get standard table_name")
-    standard_property_name_df = get_standard_property_df(standard_property_name_list_path)
-    possible_table_columns = standard_property_name_df.filter(like='possible_table_')
-    unique_table_name = (pd.unique(possible_table_columns.values.ravel()).tolist())
-    unique_table_name = [x for x in unique_table_name if pd.notna(x)]
+    unique_table_name = list(
+        standard_registry.derived(
+            standard_property_name_list_path, "table_names", _standard_table_names
+        )
+    )
     logger.info(f"DONE: get standard table_name, {unique_table_name}")
     return unique_table_name
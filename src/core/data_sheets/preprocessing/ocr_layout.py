@@ -0,0 +1,67 @@
+"""Row layout of OCR tokens with numpy.
+
+Tokens are bucketed into rows on their top edge, ordered by x inside a row,
+and neighbours closer than a gap threshold are merged into one cell.
+"""
+
+import numpy as np
+
+LAYOUT_FIELDS = ("x_min", "x_max", "y_min", "y_max", "y_top")
+
+
+def annotation_array(annotations):
+    """Load Vision `text_annotations` into a structured array.
+
+    x_min/x_max are the x of vertices 0 and 1, y_min/y_max the y of
+    vertices 0 and 2 and y_top the smallest vertex y.
+    """
+    rows = []
+    for annotation in annotations:
+        vertices = annotation["bounding_poly"]["vertices"]
+        rows.append(
+            (
+                vertices[0]["x"],
+                vertices[1]["x"],
+                vertices[0]["y"],
+                vertices[2]["y"],
+                min(vertex["y"] for vertex in vertices),
+            )
+        )
+    coordinates = np.array(rows).reshape(len(rows), len(LAYOUT_FIELDS))
+    return np.rec.fromarrays(list(coordinates.T), names=LAYOUT_FIELDS)
+
+
+def layout_cells(annotations, threshold_x, threshold_y):
+    """Return the merged cells of a page in reading order.
+
+    Each cell is `(row_key, word, x_min, x_max, y_min, y_max)`. The row key
+    is the token's top edge rounded to a multiple of `threshold_y`; inside a
+    row tokens are taken by x (ties keep annotation order) and a token
+    starting at most `threshold_x` after the previous token's right edge
+    joins its cell. Commas are dropped from words.
+    """
+    if not annotations:
+        return []
+    tokens = annotation_array(annotations)
+    row_keys = np.rint(tokens.y_top / threshold_y).astype(np.int64) * threshold_y
+    order = np.lexsort((tokens.x_min, row_keys))
+
+    keys = row_keys[order]
+    x_min, x_max = tokens.x_min[order], tokens.x_max[order]
+    y_min, y_max = tokens.y_min[order], tokens.y_max[order]
+    new_cell = np.ones(len(order), dtype=bool)
+    new_cell[1:] = (keys[1:] != keys[:-1]) | (x_min[1:] - x_max[:-1] > threshold_x)
+    starts = np.flatnonzero(new_cell)
+
+    words = [annotations[i]["description"].replace(",", "") for i in order.tolist()]
+    bounds = starts.tolist() + [len(order)]
+    return list(
+        zip(
+            keys[starts].tolist(),
+            (" ".join(words[a:b]) for a, b in zip(bounds, bounds[1:])),
+            np.minimum.reduceat(x_min, starts).tolist(),
+            np.maximum.reduceat(x_max, starts).tolist(),
+            np.minimum.reduceat(y_min, starts).tolist(),
+            np.maximum.reduceat(y_max, starts).tolist(),
+        )
+    )
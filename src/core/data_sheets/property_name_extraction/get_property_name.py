@@ -2,15 +2,17 @@
 
 import json
 import re
-from fuzzywuzzy import fuzz
 import pandas as pd
 from src.data_sheets.property_name_extraction.property_name_llm import (
     retrieve_property_names_using_llm,
 )
+from src.data_sheets.property_name_extraction.property_name_matcher import (
+    ParagraphMatcher,
+)
 from src.prompts.prompt import PROPERTY_NAME_PROMPT_PATH
 from src.utils.log import logger
+from src.data_sheets.standard_property_registry import standard_registry
 from src.data_sheets.constant import (
-    get_standard_property_df,
     get_specific_standard_df,
     standard_property_name_list_path,
     split_alternate_names
@@ -20,23 +22,7 @@ from src.data_sheets.constant import (
 def find_matching_every_properties_in_paragraph(properties, paragraph, threshold=40):
     """Find matching properties in a paragraph."""
     logger.info("INIT: find_matching_properties_in_paragraph called")
-    paragraph_lower = paragraph.lower()
-    words = paragraph_lower.split()
-    presence_dict = {}
-    presence_list = []
-
-    for prop in properties:
-        prop_lower = prop.lower()
-        matched_word = None
-        matched_accuracy = 0
-        for word in words:
-            if fuzz.ratio(prop_lower, word) >= threshold:
-                if fuzz.ratio(prop_lower, word) > matched_accuracy:
-                    matched_word = word
-                    matched_accuracy = fuzz.ratio(prop_lower, word)
-        presence_dict[prop] = matched_word
-        if matched_word is not None:
-            presence_list.append(prop)
+    presence_list = ParagraphMatcher(paragraph).present(properties, threshold)
     logger.info("DONE: find_matching_properties_in_paragraph executed")
     return presence_list
 
@@ -51,18 +37,7 @@ def combine_standard_property_names(df, columns):
 
 def match_properties_of_that_row(paragraph, row_properties, threshold=45):
     """Match properties of that row in a paragraph."""
-    paragraph_lower = paragraph.lower()
-    words = paragraph_lower.split()
-    matched_word = None
-    matched_accuracy = 0
-    for prop in row_properties:
-        prop_lower = prop.lower()
-        for word in words:
-            ratio = fuzz.ratio(prop_lower, word.lower())
-            if ratio >= threshold and ratio > matched_accuracy:
-                matched_word = prop
-                matched_accuracy = ratio
-    return matched_word
+    return ParagraphMatcher(paragraph).best_match(row_properties, threshold)
 
 
 def select_best_match(
@@ -86,18 +61,43 @@ def select_best_match(
                 properties_list, paragraph
             )
         else:
+            matcher = ParagraphMatcher(paragraph)
+            matcher.prime(
+                combine_standard_property_names(
+                    standard_property_df, columns_to_extract
+                )
+            )
             filtered_properties = {}
-            for _, row in standard_property_df.iterrows():
-                row_properties = [
-                    row[col] for col in columns_to_extract if pd.notna(row[col])
-                ]
-                best_match = match_properties_of_that_row(paragraph, row_properties)
+            for standard_property_name, row in zip(
+                standard_property_df["standard_property_name"],
+                standard_property_df[columns_to_extract].itertuples(index=False),
+            ):
+                row_properties = [value for value in row if pd.notna(value)]
+                best_match = matcher.best_match(row_properties)
                 if best_match:
-                    filtered_properties[row["standard_property_name"]] = best_match
+                    filtered_properties[standard_property_name] = best_match
             final_property_list = list(filtered_properties.values())
     return final_property_list
 
 
+def _standard_property_candidates(standard_df, asset_class, table_name):
+    """Standard properties of an asset class's table with split alternate names."""
+    property_name_df = get_specific_standard_df(standard_df, asset_class)
+    possible_table_columns = [
+        col for col in property_name_df.columns if col.startswith("possible_table_")
+    ]
+    filtered_df = property_name_df[
+        property_name_df[possible_table_columns].eq(table_name).any(axis=1)
+    ]
+    filtered_df = split_alternate_names(filtered_df)
+    columns_to_extract = [
+        column
+        for column in filtered_df.columns
+        if column.startswith("alternate_name") or column == "standard_property_name"
+    ]
+    return filtered_df, columns_to_extract
+
+
 def load_best_match_standard_property_name(
     asset_class,
     table_name,
@@ -113,20 +113,13 @@ def load_best_match_standard_property_name(
         company specific standard property according to asset_class
         and table name {asset_class}, {table_name}"""
     )
-    property_name_df = get_standard_property_df(standard_property_name_list_path)
-    property_name_df = get_specific_standard_df(property_name_df, asset_class)
-    possible_table_columns = [
-        col for col in property_name_df.columns if col.startswith("possible_table_")
-    ]
-    filtered_df = property_name_df[
-        property_name_df[possible_table_columns].eq(table_name).any(axis=1)
-    ]
-    filtered_df = split_alternate_names(filtered_df)
-    columns_to_extract = [
-        column
-        for column in filtered_df.columns
-        if column.startswith("alternate_name") or column == "standard_property_name"
-    ]
+    filtered_df, columns_to_extract = standard_registry.derived(
+        standard_property_name_list_path,
+        ("property_candidates", asset_class, table_name),
+        lambda standard_df: _standard_property_candidates(
+            standard_df, asset_class, table_name
+        ),
+    )
     # standard_property_names = combine_standard_property_names(
     #     filtered_df, columns_to_extract
     # )
@@ -1,20 +1,32 @@
 """This module is used to extract property name from narrative text"""
 
 # pylint: disable=no-name-in-module
+import json
 from langchain_community.callbacks.manager import get_openai_callback
 from langchain.prompts import PromptTemplate
 from langchain.chains import LLMChain
 from dotenv import load_dotenv
 from src.utils.log import logger
 from src.data_sheets.sheets_table_extraction.prompt_info import (
-    update_prompt_information,
+    record_prompt_information,
 )
 from src.utils.llm_models.get_llm import get_llm_model
+from src.utils.llm_models.response_cache import cached_chain_call
 
 load_dotenv()
 MODEL_NAME = "gpt-4"
 
 
+def _clean_response(text):
+    return text.replace("```json", "").replace("`", "")
+
+
+def _is_json_output(text):
+    """Whether a response parses as `extract_expected_dictionary_output` reads it."""
+    json.loads(_clean_response(text).strip('"'))
+    return True
+
+
 def get_prompt_template_name_and_response(
     prompt_text, llm, narrative_text, property_name_list
 ):
@@ -29,7 +41,9 @@ def get_prompt_template_name_and_response(
         "property_name_list": property_name_list,
     }
     with get_openai_callback() as cb_response:
-        response = name_chain(inputs=inputs)
+        response = cached_chain_call(
+            name_chain, inputs, "property_name", validate=_is_json_output
+        )
     return prompt_template_name, cb_response, response
 
 
@@ -41,8 +55,8 @@ def execute_prompt_extraction(
     prompt_template_name, cb_response, response = get_prompt_template_name_and_response(
         prompt_text, llm, narrative_text, property_name_list
     )
-    result_string = response["text"].replace("```json", "").replace("`", "")
-    update_prompt_information(prompt_template_name, cb_response, prompt_token_path)
+    result_string = _clean_response(response["text"])
+    record_prompt_information(prompt_template_name, cb_response, prompt_token_path)
     logger.info("DONE: execute_prompt_extraction function completed")
     return result_string
 
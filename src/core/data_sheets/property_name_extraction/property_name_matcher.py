@@ -0,0 +1,77 @@
+"""Fuzzy matching of standard property names against the words of a paragraph.
+
+`fuzzywuzzy.fuzz.ratio` counts the characters of difflib's matching blocks,
+which form a common subsequence, so rapidfuzz's Indel ratio (the longest
+common subsequence) bounds it from above. One vectorised `cdist` over every
+(candidate, word) pair discards the pairs that cannot reach the threshold
+or beat the current best, and only the remaining pairs are scored with
+`fuzz.ratio`. Results are identical to scoring every pair.
+"""
+
+import numpy as np
+from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz as rapid_fuzz
+from rapidfuzz.process import cdist
+
+# `fuzz.ratio` rounds to an integer; keep a full point of slack on the bound.
+BOUND_MARGIN = 1
+
+
+class ParagraphMatcher:
+    """The distinct lower-cased words of a paragraph and their score bounds."""
+
+    def __init__(self, paragraph):
+        self.words = list(dict.fromkeys(paragraph.lower().split()))
+        self._bounds = {}
+
+    def prime(self, candidates):
+        """Compute the upper-bound scores of every not yet seen candidate."""
+        pending = list(
+            dict.fromkeys(
+                candidate.lower()
+                for candidate in candidates
+                if candidate.lower() not in self._bounds
+            )
+        )
+        if not pending:
+            return
+        if self.words:
+            bounds = cdist(pending, self.words, scorer=rapid_fuzz.ratio)
+        else:
+            bounds = np.zeros((len(pending), 0))
+        self._bounds.update(zip(pending, bounds))
+
+    def _words_above(self, candidate_lower, score):
+        bounds = self._bounds[candidate_lower]
+        return [self.words[i] for i in np.flatnonzero(bounds >= score - BOUND_MARGIN)]
+
+    def present(self, properties, threshold=40):
+        """Properties that score at least `threshold` against some word."""
+        self.prime(properties)
+        presence_list = []
+        for prop in properties:
+            prop_lower = prop.lower()
+            if any(
+                fuzz.ratio(prop_lower, word) >= threshold
+                for word in self._words_above(prop_lower, threshold)
+            ):
+                presence_list.append(prop)
+        return presence_list
+
+    def best_match(self, row_properties, threshold=45):
+        """The property with the highest score of at least `threshold`.
+
+        Ties keep the first property, and the first word, in order.
+        """
+        self.prime(row_properties)
+        matched_word = None
+        matched_accuracy = 0
+        for prop in row_properties:
+            prop_lower = prop.lower()
+            floor = max(threshold, matched_accuracy)
+            for word in self._words_above(prop_lower, floor):
+                ratio = fuzz.ratio(prop_lower, word)
+                if ratio >= threshold and ratio > matched_accuracy:
+                    matched_word = prop
+                    matched_accuracy = ratio
+        return matched_word
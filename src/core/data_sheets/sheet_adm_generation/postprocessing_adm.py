@@ -1,6 +1,8 @@
 """This module contains functions for postprocessing the ADM JSON data."""
 
+from collections import defaultdict
 from fuzzywuzzy import fuzz
+from src.utils.ocr_page_index import OcrPageIndex
 
 
 def convert_to_numerics(adm_json):
@@ -18,28 +20,29 @@ def convert_to_numerics(adm_json):
 
 def add_bounding_boxes(ocr_data, data_sheet_adm_data, threshold=50):
     """Add bounding box data to json_2"""
+    entries_by_section = defaultdict(list)
+    for entry_1 in ocr_data:
+        entries_by_section[entry_1["data_sheet_section"]].append(entry_1)
+    index = OcrPageIndex.from_words(ocr_data)
     for property_entry in data_sheet_adm_data["properties"]:
         best_match = None
         best_score = 0
 
-        for entry_1 in ocr_data:
+        section = entries_by_section.get(property_entry["data_sheet_section"], [])
+        for entry_1 in section:
             match_score = 0
-            if entry_1["data_sheet_section"] == property_entry["data_sheet_section"]:
-                if entry_1["word"] and property_entry["property_name"]:
-                    match_score = fuzz.ratio(
-                        property_entry["property_name"].lower(), entry_1["word"].lower()
-                    )
-                    if (
-                        property_entry["property_name"].lower()
-                        in entry_1["word"].lower()
-                    ):
-                        best_match = entry_1
-                        best_score = 100
-                        break
-
-                if match_score > best_score and match_score >= threshold:
+            if entry_1["word"] and property_entry["property_name"]:
+                match_score = fuzz.ratio(
+                    property_entry["property_name"].lower(), entry_1["word"].lower()
+                )
+                if property_entry["property_name"].lower() in entry_1["word"].lower():
                     best_match = entry_1
-                    best_score = match_score
+                    best_score = 100
+                    break
+
+            if match_score > best_score and match_score >= threshold:
+                best_match = entry_1
+                best_score = match_score
 
         if best_match:
             property_entry["property_name_bounding_box"] = {
@@ -49,7 +52,7 @@ def add_bounding_boxes(ocr_data, data_sheet_adm_data, threshold=50):
                 "y_max": best_match["y_max"],
             }
             get_property_value_bounding_box(
-                ocr_data, property_entry, threshold=threshold
+                ocr_data, property_entry, threshold=threshold, index=index
             )
         else:
             property_entry["property_name_bounding_box"] = {
@@ -68,10 +71,14 @@ def add_bounding_boxes(ocr_data, data_sheet_adm_data, threshold=50):
 
 
 def get_property_value_bounding_box(
-    ocr_data, property_entry, threshold, property_value_threshold=150
+    ocr_data, property_entry, threshold, property_value_threshold=150, index=None
 ):
     """Add property value bounding boxes considering fuzzy match,
-    proximity, and other tie-breakers."""
+    proximity, and other tie-breakers.
+
+    Only entries whose y_min falls in the band around the property name can
+    match, so with an `OcrPageIndex` of `ocr_data` just those are scored.
+    """
     property_value = property_entry["property_value"]
     property_name_y_min = property_entry["property_name_bounding_box"]["y_min"]
     property_name_y_max = property_entry["property_name_bounding_box"]["y_max"]
@@ -83,7 +90,12 @@ def get_property_value_bounding_box(
     min_gap = 2 * property_value_threshold  # Initialize to a large value
     best_score = 0
 
-    for entry in ocr_data:
+    if index is None:
+        index = OcrPageIndex.from_words(ocr_data)
+    candidates = [
+        index.items[position] for position in index.y_min_between(y_min, y_max)
+    ]
+    for entry in candidates:
         word = entry.get("word")
         if word and property_value:
             # Calculate the vertical distance (y-gap)
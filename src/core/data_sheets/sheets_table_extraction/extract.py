@@ -14,6 +14,7 @@ from langchain.prompts import PromptTemplate
 from langchain.chains import LLMChain
 from dotenv import load_dotenv
 from src.utils.llm_models.get_llm import get_llm_model
+from src.utils.llm_models.response_cache import cached_chain_call
 from src.data_sheets.preprocessing.preprocess import (
     pre_process_data_sheet,
     pre_process_ocr_property_name,
@@ -22,6 +23,7 @@ from src.data_sheets.preprocessing.preprocess import (
 from src.data_sheets.sheets_table_extraction.prompt_info import (
     update_prompt_information,
 )
+from src.utils.token_telemetry import flush_token_telemetry
 from src.prompts.prompt import (
     DATA_SHEET_NOZZLES_PROMPT_PATH,
     DATA_SHEET_TABLE_FORMAT_1_PROMPT_PATH,
@@ -75,6 +77,16 @@ def _setup_config():
     return config
 
 
+def _clean_response(text):
+    return text.replace("```csv", "").replace("```", "")
+
+
+def _is_csv_output(text):
+    """Whether a response reads as a table the way `extract_data_sheet_data` does."""
+    pd.read_csv(io.StringIO(_clean_csv_content(_clean_response(text))))
+    return True
+
+
 def _get_prompt_template_name_and_response(
     prompt_text, llm, data_sheet_text, columns_name_list, properties_name_list
 ):
@@ -94,7 +106,9 @@ def _get_prompt_template_name_and_response(
         "properties_name_list": properties_name_list,
     }
     with get_openai_callback() as cb_response:
-        response = name_chain(inputs=inputs)
+        response = cached_chain_call(
+            name_chain, inputs, "data_sheet_table", validate=_is_csv_output
+        )
     return prompt_template_name, cb_response, response
 
 
@@ -116,7 +130,7 @@ async def _extract_data_sheet_data_by_prompt(
         prompt_template_name, cb_response, prompt_token_path
     )
     logger.info("DONE: Extract_Data_By_Prompt function completed")
-    result_string = response["text"].replace("```csv", "").replace("```", "")
+    result_string = _clean_response(response["text"])
     logger.info(result_string)
     return result_string
 
@@ -511,5 +525,6 @@ async def get_data(input_data_path, bucket, local_path=False):
         f"{path}/ocr_bounding_box.json",
         ocr_highlight_bounding_box,
     )
+    await flush_token_telemetry()
     # generate_adm(input_data_path, path)
     # logger.info("Done: generated base adm json file")
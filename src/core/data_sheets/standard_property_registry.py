@@ -0,0 +1,120 @@
+"""Process-wide registry of the standard-property constant files.
+
+Every constant CSV (`previous_standard_name.csv`, the v2 `standard_detail`
+tables) is parsed once per process, and the lookups derived from it (asset
+classes, table names, property-name candidates, v2 node mappings) are built
+once per version of the file. A file whose modification time changes is
+re-read on the next access; modification times are checked at most every
+STANDARD_REGISTRY_RELOAD_SECONDS. Plant asset tables read from storage are
+kept for ASSET_TABLE_CACHE_SECONDS (0 disables that cache); loads that fail
+or return None are not kept, and writers of such a table drop its entry with
+`invalidate_asset_table`.
+
+Frames and lookups handed out by the registry are shared between callers
+and must be treated as read-only.
+"""
+
+import os
+import threading
+import time
+import pandas as pd
+from src.utils.log import logger
+
+STANDARD_REGISTRY_RELOAD_SECONDS = float(
+    os.getenv("STANDARD_REGISTRY_RELOAD_SECONDS", "30")
+)
+ASSET_TABLE_CACHE_SECONDS = float(os.getenv("ASSET_TABLE_CACHE_SECONDS", "60"))
+CONSTANTS_DIR = os.path.join("src", "constants")
+STANDARD_DETAIL_DIR = os.path.join(CONSTANTS_DIR, "standard_detail")
+
+
+class _LoadedFile:
+    """One parsed constant file and the lookups derived from it."""
+
+    def __init__(self, path, mtime, frame, checked):
+        self.path = path
+        self.mtime = mtime
+        self.frame = frame
+        self.checked = checked
+        self.derived = {}
+
+
+class StandardPropertyRegistry:
+    """Parsed constant CSVs and derived lookups, reloaded when files change."""
+
+    def __init__(
+        self,
+        reload_seconds=STANDARD_REGISTRY_RELOAD_SECONDS,
+        asset_table_seconds=ASSET_TABLE_CACHE_SECONDS,
+    ):
+        self.reload_seconds = reload_seconds
+        self.asset_table_seconds = asset_table_seconds
+        self._files = {}
+        self._asset_tables = {}
+        self._asset_table_versions = {}
+        self._lock = threading.RLock()
+
+    def _load(self, path):
+        now = time.monotonic()
+        with self._lock:
+            loaded = self._files.get(path)
+            if loaded is not None and now - loaded.checked < self.reload_seconds:
+                return loaded
+            mtime = os.stat(path).st_mtime_ns
+            if loaded is None or loaded.mtime != mtime:
+                if loaded is not None:
+                    logger.info(f"Standard property file changed, reloading {path}")
+                loaded = _LoadedFile(path, mtime, pd.read_csv(path), now)
+                self._files[path] = loaded
+            loaded.checked = now
+            return loaded
+
+    def frame(self, path):
+        """Return the parsed CSV at `path`."""
+        return self._load(path).frame
+
+    def derived(self, path, key, build):
+        """Return `build(frame)` for the CSV at `path`, built once per file version."""
+        loaded = self._load(path)
+        with self._lock:
+            if key not in loaded.derived:
+                loaded.derived[key] = build(loaded.frame)
+            return loaded.derived[key]
+
+    def standard_detail_path(self, asset_class):
+        """Path of the v2 standard property table of an asset class."""
+        return os.path.join(STANDARD_DETAIL_DIR, f"{asset_class}_standard_property.csv")
+
+    async def asset_table(self, bucket, path, load):
+        """Return `await load(bucket, path)`, reusing a recent successful result.
+
+        A load that raises or returns None is not cached, so the next call
+        retries it.
+        """
+        key = (bucket, path)
+        cached = self._asset_tables.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.asset_table_seconds:
+            return cached[1]
+        version = self._asset_table_versions.get(key, 0)
+        table = await load(bucket, path)
+        # A rewrite during the load may have made `table` stale.
+        stale = self._asset_table_versions.get(key, 0) != version
+        if table is not None and not stale and self.asset_table_seconds > 0:
+            self._asset_tables[key] = (time.monotonic(), table)
+        return table
+
+    def invalidate_asset_table(self, bucket, path):
+        """Forget the cached asset table at `path` after it was rewritten."""
+        key = (bucket, path)
+        self._asset_tables.pop(key, None)
+        self._asset_table_versions[key] = self._asset_table_versions.get(key, 0) + 1
+
+    def clear(self):
+        """Forget every loaded file and asset table."""
+        with self._lock:
+            self._files.clear()
+            self._asset_tables.clear()
+
+
+standard_registry = StandardPropertyRegistry()
@@ -1,9 +1,11 @@
 """Script to classify a PDF document using Azure Document Intelligence."""
 
 import os
-from io import BytesIO
-from azure.core.credentials import AzureKeyCredential
-from azure.ai.documentintelligence import DocumentIntelligenceClient
+from src.utils.classification_cache import get_classification_cache
+from src.utils.document_intelligence_gateway import (
+    document_hash,
+    get_document_intelligence_gateway,
+)
 from src.utils.log import logger
 from src.utils.s3_download_upload import load_into_memory
 
@@ -14,22 +16,16 @@ async def classify_pdf_document(bucket, endpoint, key, model_id, pdf_path):
     """
     logger.info("INIT: classify_pdf_document")
     print(pdf_path)
-    client = DocumentIntelligenceClient(
-        endpoint=endpoint, credential=AzureKeyCredential(key)
-    )
-
     pdf_bytes = await load_into_memory(bucket, pdf_path)
 
-    client = DocumentIntelligenceClient(
-        endpoint=endpoint, credential=AzureKeyCredential(key)
-    )
-
-    poller = client.begin_classify_document(
-        classifier_id=model_id, body=BytesIO(pdf_bytes)
+    gateway = get_document_intelligence_gateway(endpoint, key)
+    result = await get_classification_cache().get_or_classify(
+        document_hash(pdf_bytes),
+        model_id,
+        lambda: gateway.classify(pdf_bytes, classifier_id=model_id),
     )
-    result = poller.result()
 
-    document_type = result.documents[0].get("docType")
+    document_type = result["documents"][0].get("docType")
     if document_type:
         logger.info(f"DONE: Document type: {document_type}")
         return document_type
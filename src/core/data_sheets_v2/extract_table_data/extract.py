@@ -2,13 +2,9 @@
 
 # pylint: disable=broad-exception-caught
 import json
-import time
 import re
 from src.utils.llm_models.get_llm import get_llm_model
 from src.utils.log import logger
-from src.utils.s3_download_upload import (
-    load_into_memory,
-)
 from src.data_sheets_v2.extract_table_data.get_prompt_tables_having_property import (
     get_property_conversion_prompt,
     get_prompt_format_1_v2,
@@ -22,9 +18,13 @@ from src.data_sheets_v2.postprocessing.postprocess import (
     rename_empty_columns,
 )
 from src.utils.llm_models.llm_utils import retry_with_backoff
-from src.data_sheets_v2.extract_table_data.image_utlis import (
-    encode_image_2,
-    get_cropped_image,
+from src.utils.llm_models.response_cache import cached_llm_invoke
+from src.data_sheets_v2.extract_table_data.image_utlis import encode_image_2
+from src.data_sheets_v2.extract_table_data.page_cache import PageImageCache
+from src.data_sheets_v2.extract_table_data.scheduler import (
+    call_llm_off_loop,
+    estimate_tokens,
+    schedule_tables,
 )
 from src.utils.storage_utils import upload_file_to_storage, fetch_file_via_adapter
 
@@ -51,10 +51,17 @@ def _get_property_name(extracted_data):
     return []
 
 
-def _call_llm(llm, message):
+def _is_json_output(output):
+    """Whether an LLM response parses as JSON; only those are cached."""
+    result_string = output.replace("```json", "").replace("`", "")
+    return _extract_json_from_text(result_string) is not None
+
+
+def _call_llm(llm, message, template_version="", images=()):
     """Call LLM API."""
-    ai_message = llm.invoke(message)
-    return ai_message.content
+    return cached_llm_invoke(
+        llm, message, template_version, images, validate=_is_json_output
+    )
 
 
 def _extract_standard_property_name_data(
@@ -70,7 +77,9 @@ def _extract_standard_property_name_data(
     llm = get_llm_model(model_name=model_name)
     filter_data = _get_property_name(extracted_data)
     message = get_property_conversion_prompt(filter_data)
-    output = retry_with_backoff(_call_llm, llm, message, table_name=table_name)
+    output = retry_with_backoff(
+        _call_llm, llm, message, "property_conversion", table_name=table_name
+    )
     result_string = output.replace("```json", "").replace("`", "")
     logger.info(f"llm response: {result_string}")
     result_object = _extract_json_from_text(result_string)
@@ -120,7 +129,14 @@ def _extract_image_data_with_property_table(
     llm = get_llm_model(model_name=model_name)
     base64_image = encode_image_2(image)
     message = get_prompt_format_1_v2(base64_image)
-    output = retry_with_backoff(_call_llm, llm, message, table_name=table_name)
+    output = retry_with_backoff(
+        _call_llm,
+        llm,
+        message,
+        "prompt_format_1_v2",
+        (base64_image,),
+        table_name=table_name,
+    )
     result_string = output.replace("```json", "").replace("`", "")
     logger.info(f"llm response: {result_string}")
     result_object = _extract_json_from_text(result_string)
@@ -142,7 +158,14 @@ def _extract_image_data_without_property_table(
     llm = get_llm_model(model_name=model_name)
     base64_image = encode_image_2(image)
     message = get_prompt_format_2_v1(base64_image)
-    output = retry_with_backoff(_call_llm, llm, message, table_name=table_name)
+    output = retry_with_backoff(
+        _call_llm,
+        llm,
+        message,
+        "prompt_format_2_v1",
+        (base64_image,),
+        table_name=table_name,
+    )
     result_string = output.replace("```json", "").replace("`", "")
     logger.info(f"llm response: {result_string}")
     result_object = _extract_json_from_text(result_string)
@@ -172,8 +195,9 @@ def _add_table_details(data_json, table):
     return reordered_data
 
 
-async def _extract_table(table, model_name, path, bucket, save_local):
+async def _extract_table(table, model_name, path, bucket, save_local, page_cache=None):
     """Extract a single table's data."""
+    page_cache = page_cache or PageImageCache()
     try:
         table_id = table.get("id")
         page_id = table.get("page_id")
@@ -193,15 +217,26 @@ async def _extract_table(table, model_name, path, bucket, save_local):
         table_has_property = table.get("table_has_property", True)
         bounding_box = table.get("table_bounding_box")
         page_path = f"{path}/{page_id}"
-        image_data = await load_into_memory(bucket, page_path)
-        cropped_image = get_cropped_image(image_data, bounding_box)
+        cropped_image = await page_cache.crop(bucket, page_path, bounding_box)
 
         if table_has_property:
-            extracted_table_data = _extract_image_data_with_property_table(
-                cropped_image, table_name, appearance_number, model_name
+            extracted_table_data = await call_llm_off_loop(
+                model_name,
+                estimate_tokens(image=cropped_image),
+                _extract_image_data_with_property_table,
+                cropped_image,
+                table_name,
+                appearance_number,
+                model_name,
             )
-            extracted_standard_property_name = _extract_standard_property_name_data(
-                extracted_table_data, table_name, appearance_number, model_name
+            extracted_standard_property_name = await call_llm_off_loop(
+                model_name,
+                estimate_tokens(text=json.dumps(extracted_table_data or {})),
+                _extract_standard_property_name_data,
+                extracted_table_data,
+                table_name,
+                appearance_number,
+                model_name,
             )
             if extracted_standard_property_name and extracted_table_data:
                 extracted_table_data = _add_table_details(extracted_table_data, table)
@@ -209,8 +244,14 @@ async def _extract_table(table, model_name, path, bucket, save_local):
                     extracted_table_data, extracted_standard_property_name
                 )
         else:
-            extracted_table_data = _extract_image_data_without_property_table(
-                cropped_image, table_name, appearance_number, model_name
+            extracted_table_data = await call_llm_off_loop(
+                model_name,
+                estimate_tokens(image=cropped_image),
+                _extract_image_data_without_property_table,
+                cropped_image,
+                table_name,
+                appearance_number,
+                model_name,
             )
             if extracted_table_data:
                 extracted_table_data_json = _add_table_details(
@@ -253,7 +294,6 @@ async def _process_tables(table_processing_context, filter_unprocessed=False):
 
     path = f"{plant_id}/documents/data_sheet/{document_id}"
     tables = input_data["tables_data"]
-    total_time = 0
 
     if filter_unprocessed:
         tables_to_process = [
@@ -262,25 +302,18 @@ async def _process_tables(table_processing_context, filter_unprocessed=False):
     else:
         tables_to_process = tables
 
-    for table in tables_to_process:
-        last_request_time = time.time()
-        try:
-            await _extract_table(table, model_name, path, bucket, save_local)
-            table["is_extracted"] = True
-        except Exception as e:
-            logger.warning(f"Skipping table due to error: {e}")
-            continue  # Skip to the next table
-        total_time = total_time + time.time() - last_request_time
-        if total_time >= 800:
-            await upload_file_to_storage(
-                bucket, input_data_path, json.dumps(input_data)
-            )
-            logger.warning(
-                f"Processing time exceeded 800 seconds with {total_time:.2f}"
-            )
-            return None
+    page_cache = PageImageCache()
+
+    async def _extract(table):
+        await _extract_table(table, model_name, path, bucket, save_local, page_cache)
 
-    await upload_file_to_storage(bucket, input_data_path, json.dumps(input_data))
+    try:
+        total_time = await schedule_tables(tables_to_process, _extract)
+    finally:
+        page_cache.log_stats()
+        page_cache.close()
+        # Checkpoint `is_extracted` flags so a second shot only retries leftovers.
+        await upload_file_to_storage(bucket, input_data_path, json.dumps(input_data))
     logger.info(f"DONE: Table data extraction completed in {total_time:.2f} seconds.")
     return None
 
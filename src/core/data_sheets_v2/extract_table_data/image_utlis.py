@@ -9,9 +9,14 @@ from src.utils.log import logger
 
 def get_cropped_image(image_data, bounding_box):
     """Crop image to bounding box."""
-    logger.info("INIT: Cropping image to bounding box.")
     # image = Image.open(image_path)
     image = Image.open(BytesIO(image_data))
+    return crop_image(image, bounding_box)
+
+
+def crop_image(image, bounding_box):
+    """Crop an already decoded image to bounding box."""
+    logger.info("INIT: Cropping image to bounding box.")
     x_min, y_min = float(bounding_box["x_min"]), float(bounding_box["y_min"])
     x_max, y_max = float(bounding_box["x_max"]), float(bounding_box["y_max"])
     cropped_image = image.crop((x_min, y_min, x_max, y_max))
@@ -0,0 +1,136 @@
+"""Per-document cache of decoded page images shared by every table crop.
+
+A page image is downloaded and decoded once, then kept in a memory-bounded
+LRU. With a spill directory the encoded bytes are also written to disk, so a
+page evicted from memory is re-decoded from disk instead of re-downloaded.
+Each cache spills into its own temporary directory under the configured one,
+removed on `close()`, so spilled pages never outlive the run that wrote them.
+"""
+
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+import weakref
+from collections import OrderedDict
+from io import BytesIO
+from PIL import Image
+from src.utils.log import logger
+from src.utils.s3_download_upload import load_into_memory
+from src.data_sheets_v2.extract_table_data.image_utlis import crop_image
+
+PAGE_CACHE_MAX_BYTES = int(
+    os.getenv("DATA_SHEET_PAGE_CACHE_MAX_BYTES", str(512 * 1024 * 1024))
+)
+PAGE_CACHE_SPILL_DIR = os.getenv("DATA_SHEET_PAGE_CACHE_SPILL_DIR")
+
+
+def _decoded_size(image):
+    """Approximate in-memory size of a decoded image in bytes."""
+    width, height = image.size
+    return width * height * len(image.getbands())
+
+
+class PageImageCache:
+    """LRU of decoded page images keyed by page id."""
+
+    def __init__(self, max_bytes=PAGE_CACHE_MAX_BYTES, spill_dir=PAGE_CACHE_SPILL_DIR):
+        self.max_bytes = max_bytes
+        self.spill_dir = None
+        self._cleanup = None
+        self._images = OrderedDict()
+        self._encoded = {}
+        self._in_flight = {}
+        self._bytes = 0
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "disk_hits": 0,
+            "evictions": 0,
+            "bytes_downloaded": 0,
+            "bytes_saved": 0,
+        }
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+            self.spill_dir = tempfile.mkdtemp(prefix="page-cache-", dir=spill_dir)
+            self._cleanup = weakref.finalize(
+                self, shutil.rmtree, self.spill_dir, ignore_errors=True
+            )
+
+    def _spill_path(self, page_id):
+        digest = hashlib.sha1(page_id.encode("utf-8")).hexdigest()
+        return os.path.join(self.spill_dir, f"{digest}.page")
+
+    def _store(self, page_id, image, encoded_size):
+        size = _decoded_size(image)
+        self._images[page_id] = (image, size)
+        self._encoded[page_id] = encoded_size
+        self._bytes += size
+        while self._bytes > self.max_bytes and len(self._images) > 1:
+            evicted_id, (_, evicted_size) = self._images.popitem(last=False)
+            self._encoded.pop(evicted_id, None)
+            self._bytes -= evicted_size
+            self.stats["evictions"] += 1
+            logger.info(f"Page cache evicted {evicted_id}")
+
+    def put(self, page_id, image_bytes):
+        """Seed the cache with bytes the caller already downloaded."""
+        if page_id in self._images:
+            return self._images[page_id][0]
+        image = Image.open(BytesIO(image_bytes))
+        image.load()
+        if self.spill_dir:
+            with open(self._spill_path(page_id), "wb") as spill_file:
+                spill_file.write(image_bytes)
+        self._store(page_id, image, len(image_bytes))
+        return image
+
+    async def _load(self, bucket, page_id):
+        if self.spill_dir and os.path.exists(self._spill_path(page_id)):
+            with open(self._spill_path(page_id), "rb") as spill_file:
+                image_bytes = spill_file.read()
+            self.stats["disk_hits"] += 1
+            self.stats["bytes_saved"] += len(image_bytes)
+        else:
+            image_bytes = await load_into_memory(bucket, page_id)
+            self.stats["misses"] += 1
+            self.stats["bytes_downloaded"] += len(image_bytes)
+        return self.put(page_id, image_bytes)
+
+    async def get(self, bucket, page_id):
+        """Return the decoded image for `page_id`, downloading it at most once."""
+        if page_id in self._images:
+            self._images.move_to_end(page_id)
+            self.stats["hits"] += 1
+            self.stats["bytes_saved"] += self._encoded.get(page_id, 0)
+            return self._images[page_id][0]
+        if page_id in self._in_flight:
+            image = await asyncio.shield(self._in_flight[page_id])
+            self.stats["hits"] += 1
+            self.stats["bytes_saved"] += self._encoded.get(page_id, 0)
+            return image
+        task = asyncio.ensure_future(self._load(bucket, page_id))
+        self._in_flight[page_id] = task
+        try:
+            return await task
+        finally:
+            self._in_flight.pop(page_id, None)
+
+    async def crop(self, bucket, page_id, bounding_box):
+        """Crop `bounding_box` out of the cached page image."""
+        image = await self.get(bucket, page_id)
+        return crop_image(image, bounding_box)
+
+    def close(self):
+        """Drop cached images and delete this cache's spill directory."""
+        self._images.clear()
+        self._encoded.clear()
+        self._bytes = 0
+        if self._cleanup is not None:
+            self._cleanup()
+        self.spill_dir = None
+
+    def log_stats(self):
+        """Log hit/miss counters and the bytes the cache avoided downloading."""
+        logger.info(f"Page cache stats: {self.stats}")
@@ -0,0 +1,130 @@
+"""Bounded-concurrency scheduler for data sheet table extraction.
+
+Tables are pulled from a shared queue by a fixed number of asyncio workers.
+Blocking LLM calls run in worker threads and every call first reserves an
+estimated token count from the deployment's tokens-per-minute budget.
+"""
+
+import asyncio
+import math
+import os
+import threading
+import time
+from collections import deque
+from src.utils.log import logger
+
+TABLE_EXTRACTION_CONCURRENCY = int(os.getenv("DATA_SHEET_TABLE_CONCURRENCY", "4"))
+TABLE_EXTRACTION_RETRIES = int(os.getenv("DATA_SHEET_TABLE_RETRIES", "2"))
+TABLE_EXTRACTION_TIME_LIMIT = float(os.getenv("DATA_SHEET_TABLE_TIME_LIMIT", "800"))
+DEPLOYMENT_TOKENS_PER_MINUTE = int(
+    os.getenv("AZURE_OPENAI_TOKENS_PER_MINUTE", "150000")
+)
+COMPLETION_TOKENS_ESTIMATE = 1500
+IMAGE_TILE_SIZE = 512
+IMAGE_TOKENS_PER_TILE = 170
+IMAGE_BASE_TOKENS = 85
+
+_budgets = {}
+_budgets_lock = threading.Lock()
+
+
+class TokenBudget:
+    """Sliding one-minute token budget shared by all calls to one deployment."""
+
+    def __init__(self, tokens_per_minute):
+        self.tokens_per_minute = tokens_per_minute
+        self._spent = deque()
+        self._lock = threading.Lock()
+
+    def _try_reserve(self, tokens):
+        """Reserve tokens now, or return how many seconds to wait first."""
+        with self._lock:
+            now = time.monotonic()
+            while self._spent and now - self._spent[0][0] >= 60:
+                self._spent.popleft()
+            used = sum(spent for _, spent in self._spent)
+            if not self._spent or used + tokens <= self.tokens_per_minute:
+                self._spent.append((now, tokens))
+                return 0.0
+            return 60 - (now - self._spent[0][0])
+
+    async def acquire(self, tokens):
+        """Wait until `tokens` fit in the current one-minute window."""
+        tokens = min(tokens, self.tokens_per_minute)
+        while True:
+            wait_time = self._try_reserve(tokens)
+            if not wait_time:
+                return
+            logger.info(f"Token budget exhausted, waiting {wait_time:.1f}s")
+            await asyncio.sleep(wait_time)
+
+
+def get_token_budget(deployment_name):
+    """Return the process-wide token budget for a deployment."""
+    with _budgets_lock:
+        if deployment_name not in _budgets:
+            _budgets[deployment_name] = TokenBudget(DEPLOYMENT_TOKENS_PER_MINUTE)
+        return _budgets[deployment_name]
+
+
+def estimate_tokens(image=None, text=""):
+    """Rough prompt + completion token estimate for one chat call."""
+    tokens = COMPLETION_TOKENS_ESTIMATE + len(text) // 4
+    if image is not None:
+        width, height = image.size
+        tiles = math.ceil(width / IMAGE_TILE_SIZE) * math.ceil(height / IMAGE_TILE_SIZE)
+        tokens += IMAGE_BASE_TOKENS + IMAGE_TOKENS_PER_TILE * tiles
+    return tokens
+
+
+async def call_llm_off_loop(model_name, estimated_tokens, func, *args):
+    """Reserve budget for `model_name`, then run the blocking `func` in a thread."""
+    await get_token_budget(model_name).acquire(estimated_tokens)
+    return await asyncio.to_thread(func, *args)
+
+
+async def schedule_tables(
+    tables,
+    extract_table,
+    concurrency=TABLE_EXTRACTION_CONCURRENCY,
+    retries=TABLE_EXTRACTION_RETRIES,
+    time_limit=TABLE_EXTRACTION_TIME_LIMIT,
+):
+    """Run `extract_table(table)` for every table on a bounded worker pool.
+
+    Successful tables are marked `is_extracted`. Workers stop picking up new
+    tables once `time_limit` seconds have passed, leaving the rest for a
+    second-shot pass. Returns the elapsed wall-clock seconds.
+    """
+    queue = asyncio.Queue()
+    for table in tables:
+        queue.put_nowait(table)
+    started = time.monotonic()
+
+    async def _worker():
+        while not queue.empty():
+            if time.monotonic() - started >= time_limit:
+                return
+            table = queue.get_nowait()
+            for attempt in range(retries + 1):
+                try:
+                    await extract_table(table)
+                    table["is_extracted"] = True
+                    break
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    if attempt == retries:
+                        logger.warning(
+                            f"Skipping table {table.get('id')} after {attempt + 1} attempts: {e}"
+                        )
+                    else:
+                        await asyncio.sleep(2**attempt)
+
+    workers = max(1, min(concurrency, len(tables)))
+    await asyncio.gather(*(_worker() for _ in range(workers)))
+    elapsed = time.monotonic() - started
+    if not queue.empty():
+        logger.warning(
+            f"Processing time exceeded {time_limit:.0f} seconds with {elapsed:.2f}, "
+            f"{queue.qsize()} tables left for the second shot"
+        )
+    return elapsed
@@ -5,6 +5,7 @@ from datetime import datetime
 from langchain.output_parsers import PydanticOutputParser
 from langchain.schema import HumanMessage
 from src.utils.llm_models.get_llm import get_llm_model
+from src.utils.llm_models.response_cache import cached_llm_invoke
 from src.utils.log import logger
 from src.data_sheets_v2.get_adm_json.get_meta_data.schema import Metadata
 from src.data_sheets_v2.get_adm_json.get_meta_data.postprocess import (
@@ -47,8 +48,10 @@ def extract_metadata(json_input):
     llm = get_llm_model(model_name="gpt-4o")
     message = format_prompt(json_input)
     # print(message.content)
-    response = llm.invoke([message])
-    extracted_metadata = parser.parse(response.content)
+    response_content = cached_llm_invoke(
+        llm, [message], "data_sheet_metadata", validate=parser.parse
+    )
+    extracted_metadata = parser.parse(response_content)
 
     # Dynamically set the 'adm_version' to 'ADM_DATA_SHEET' + today's date
     today_date = datetime.now().strftime("%Y-%m-%d")
@@ -5,6 +5,7 @@ import json
 import re
 from fuzzywuzzy import process
 from src.utils.llm_models.get_llm import get_llm_model
+from src.utils.llm_models.response_cache import cached_llm_invoke
 from src.utils.log import logger
 from src.data_sheets_v2.get_adm_json.get_nodes_folder.get_prompt_nodes import (
     get_nodes_column_prompt,
@@ -41,8 +42,9 @@ def get_nodes_details_llm(llm_input):
 
     llm = get_llm_model(model_name="gpt-4o")
     message = get_nodes_column_prompt(table_name, parent_table_name, node_entity)
-    response = llm.invoke(message)
-    extracted_output = response.content
+    extracted_output = cached_llm_invoke(
+        llm, message, "nodes_column", validate=extract_json_from_text
+    )
 
     logger.info("DONE: Extracting nodes data from JSON input")
     return extracted_output
@@ -2,6 +2,7 @@
 
 import re
 from src.utils.llm_models.get_llm import get_llm_model
+from src.utils.llm_models.response_cache import cached_llm_invoke
 
 
 def to_snake_case(text):
@@ -72,6 +73,11 @@ def get_raw_non_standard_adm_json(raw_json):
     return output_json
 
 
+def _normalize_node_name(response_content):
+    """Turn the LLM's node name answer into snake case."""
+    return response_content.strip().lower().replace(" ", "_")
+
+
 def get_node_name_from_llm(table_name, parent_table_name):
     """
     Use an LLM to get the node name for a non-standard table.
@@ -107,8 +113,13 @@ def get_node_name_from_llm(table_name, parent_table_name):
 
     If you are not sure, or if the table does not fit into any of the categories, please respond with "others".
     '''
-    response = llm.invoke(prompt)
-    node_name = response.content.strip().lower().replace(" ", "_")
+    response_content = cached_llm_invoke(
+        llm,
+        prompt,
+        "non_standard_node_name",
+        validate=lambda content: _normalize_node_name(content) in node_names,
+    )
+    node_name = _normalize_node_name(response_content)
 
     if node_name not in node_names:
         node_name = "others"
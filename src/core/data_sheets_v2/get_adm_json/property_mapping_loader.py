@@ -1,8 +1,12 @@
 """Parse the standard property table and generate a mapping dictionary."""
 
 import re
+import sys
 import pandas as pd
 from src.utils.log import logger
+from src.data_sheets.standard_property_registry import standard_registry
+
+_AND_SEPARATOR = re.compile(r"\s*and\s*", flags=re.IGNORECASE)
 
 
 def parse_categories(nodes_column, column_name=None):
@@ -22,11 +26,13 @@ def parse_categories(nodes_column, column_name=None):
     # ] if nodes_column else []
 
     if column_name not in ["parent_table_name", "possible_table_name"]:
-        nodes_column = re.sub(r"\s*and\s*", ",", nodes_column, flags=re.IGNORECASE)
+        nodes_column = _AND_SEPARATOR.sub(",", nodes_column)
         nodes_column = nodes_column.lower()
-        return [node.strip() for node in nodes_column.split(",") if node.strip()]
+        return [
+            sys.intern(node.strip()) for node in nodes_column.split(",") if node.strip()
+        ]
 
-    return [nodes_column.strip().lower()]
+    return [sys.intern(nodes_column.strip().lower())]
 
     # return [
     #     cat.strip().title().lower() for cat in nodes_column.split(",") if cat.strip()
@@ -42,7 +48,11 @@ def _generate_mapping_dict(mapping_df, asset_class):
     mapping_dict = {}
     # print("mapping_df", mapping_df)
 
-    for _, row in mapping_df.iterrows():
+    for row in mapping_df.to_dict("records"):
+        asset_class_name = row["asset_class"].strip().lower()
+        if asset_class != asset_class_name:
+            continue
+
         node_name = parse_categories(row.get("node_name"))
         node_categories = parse_categories(row.get("node_category"))
         node_subpart_type = parse_categories(row.get("node_subpart_type"))
@@ -56,9 +66,6 @@ def _generate_mapping_dict(mapping_df, asset_class):
             "parent_table_name": parent_table_name,
             "possible_table_name": possible_table_name,
         }
-        asset_class_name = row["asset_class"].strip().lower()
-        if asset_class != asset_class_name:
-            continue
 
         table_key = row.get("possible_table_name", "").strip().lower().replace(" ", "_")
         parent_key = row.get("parent_table_name", "")
@@ -75,20 +82,26 @@ def _generate_mapping_dict(mapping_df, asset_class):
 
 
 async def prepare_asset_mapping(asset_class):
-    """Load the mapping CSV file."""
+    """Load the mapping CSV file.
+
+    The mapping is built once per version of the CSV by the standard
+    property registry and shared between calls; do not mutate it.
+    """
     logger.info("INIT: Preparing asset mapping")
-    csv_path = f"src/constants/standard_detail/{asset_class}_standard_property.csv"
+    csv_path = standard_registry.standard_detail_path(asset_class)
     if not pd.io.common.file_exists(csv_path):
         asset_class = "heat_exchanger_air_cooled"  # Default to a known asset class
         logger.error(f"CSV file does not exist at {csv_path}")
-        csv_path = f"src/constants/standard_detail/{asset_class}_standard_property.csv"
+        csv_path = standard_registry.standard_detail_path(asset_class)
     try:
-        mapping_df = pd.read_csv(csv_path)
+        mapping_dict = standard_registry.derived(
+            csv_path,
+            ("asset_mapping", asset_class),
+            lambda mapping_df: _generate_mapping_dict(mapping_df, asset_class),
+        )
     except Exception as e:
         logger.error(f"Failed to read CSV at {csv_path}: {e}")
         raise
 
-    mapping_dict = _generate_mapping_dict(mapping_df, asset_class)
-
     logger.info("DONE: Loading mapping CSV")
     return mapping_dict
@@ -3,23 +3,26 @@
 from src.utils.log import logger
 from src.utils.llm_models.get_llm import get_llm_model
 from src.utils.llm_models.llm_utils import retry_with_backoff
-from src.data_sheets_v2.extract_table_data.image_utlis import (
-    encode_image_2,
-    get_cropped_image,
-)
+from src.utils.llm_models.response_cache import cached_llm_invoke
+from src.data_sheets_v2.extract_table_data.image_utlis import encode_image_2
+from src.data_sheets_v2.extract_table_data.page_cache import PageImageCache
 from src.data_sheets_v2.prepare_input.bounding_box.get_prompt import (
     get_prompt_table_info,
 )
-from src.utils.s3_download_upload import (
-    load_into_memory,
-)
 from src.utils.json_utils import extract_json_from_text
 
 
-def call_llm(llm, message):
+def _is_list_output(output):
+    """Whether an LLM response holds the expected JSON list; only those are cached."""
+    result_string = output.replace("```json", "").replace("`", "")
+    return isinstance(extract_json_from_text(result_string), list)
+
+
+def call_llm(llm, message, template_version="", images=()):
     """Call LLM API."""
-    ai_message = llm.invoke(message)
-    return ai_message.content
+    return cached_llm_invoke(
+        llm, message, template_version, images, validate=_is_list_output
+    )
 
 
 def extract_table_has_property_info(image, model_name):
@@ -28,7 +31,7 @@ def extract_table_has_property_info(image, model_name):
     llm = get_llm_model(model_name=model_name)
     base64_image = encode_image_2(image)
     message = get_prompt_table_info(base64_image)
-    output = retry_with_backoff(call_llm, llm, message)
+    output = retry_with_backoff(call_llm, llm, message, "table_info", (base64_image,))
     result_string = output.replace("```json", "").replace("`", "")
     logger.info(f"llm response: {result_string}")
     result_object = extract_json_from_text(result_string)
@@ -49,7 +52,7 @@ def extract_table_info(image, model_name):
     llm = get_llm_model(model_name=model_name)
     base64_image = encode_image_2(image)
     message = get_prompt_table_info(base64_image)
-    output = retry_with_backoff(call_llm, llm, message)
+    output = retry_with_backoff(call_llm, llm, message, "table_info", (base64_image,))
     print(f"output: {output}")
     result_string = output.replace("```json", "").replace("`", "")
     logger.info(f"llm response: {result_string}")
@@ -66,7 +69,7 @@ def extract_table_info(image, model_name):
 
 
 async def get_table_has_property_info(
-    bucket_name, image_path, table_bounding_box, model_name="gpt-4o"
+    bucket_name, image_path, table_bounding_box, model_name="gpt-4o", page_cache=None
 ):
     """
     Extracts table has property information from the image using the bounding box.
@@ -76,8 +79,10 @@ async def get_table_has_property_info(
         # Simulate extraction logic
         # In a real scenario, this would involve analyzing the image and bounding box
         # to determine if the table has specific properties.
-        image_data = await load_into_memory(bucket_name, image_path)
-        cropped_image = get_cropped_image(image_data, table_bounding_box)
+        page_cache = page_cache or PageImageCache()
+        cropped_image = await page_cache.crop(
+            bucket_name, image_path, table_bounding_box
+        )
         table_info = extract_table_has_property_info(cropped_image, model_name)
 
         logger.info("DONE: Extracted table has property information.")
@@ -88,7 +93,7 @@ async def get_table_has_property_info(
 
 
 async def get_table_info_llm(
-    bucket_name, image_path, table_bounding_box, model_name="gpt-4o"
+    bucket_name, image_path, table_bounding_box, model_name="gpt-4o", page_cache=None
 ):
     """
     Extracts table name from the image using the bounding box.
@@ -96,8 +101,10 @@ async def get_table_info_llm(
     logger.info("INIT: Extracting table name from image.")
     try:
         # to determine the table name.
-        image_data = await load_into_memory(bucket_name, image_path)
-        cropped_image = get_cropped_image(image_data, table_bounding_box)
+        page_cache = page_cache or PageImageCache()
+        cropped_image = await page_cache.crop(
+            bucket_name, image_path, table_bounding_box
+        )
         table_info = extract_table_info(cropped_image, model_name)
         print(f"table_info: {table_info}")
         logger.info("DONE: Extracted table name.")
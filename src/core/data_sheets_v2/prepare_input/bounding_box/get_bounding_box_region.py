@@ -31,7 +31,7 @@ def get_table_from_document_intelligence(document_intelligence_json):
 
 
 async def extract_table_bounding_boxes(
-    bucket_name, image_path, polygon_list, table_details
+    bucket_name, image_path, polygon_list, table_details, page_cache=None
 ):
     """
     Extracts bounding boxes from document intelligence JSON data.
@@ -83,7 +83,7 @@ async def extract_table_bounding_boxes(
         }
         try:
             table_info_llm = await get_table_has_property_info(
-                bucket_name, image_path, table_bounding_box
+                bucket_name, image_path, table_bounding_box, page_cache=page_cache
             )
             table_has_property = table_info_llm[0].get("table_has_property", True)
             table_name = table_info_llm[0].get(
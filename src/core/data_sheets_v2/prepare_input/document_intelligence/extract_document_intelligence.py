@@ -3,16 +3,12 @@ This code sample shows Prebuilt Layout operations with the
 Azure AI Document Intelligence client library.
 """
 
+import asyncio
 import os
 
 # import json
 from src.utils.log import logger
-from src.utils.document_analysis_utils import (
-    initialize_document_analysis_client,
-    analyze_document,
-    analyze_image,
-    analyze_image_from_bytes,
-)
+from src.utils.document_intelligence_gateway import get_document_intelligence_gateway
 from src.utils.s3_download_upload import save_json_to_storage, check_file_in_storage
 
 
@@ -32,30 +28,35 @@ def load_azure_document_intelligence_credentials():
     return endpoint, api_key
 
 
-def extract_data_document_intelligence(
+async def extract_data_document_intelligence(
     path_or_bytes, file_type, model_id="prebuilt-layout"
 ):
     """
     This function uses the Azure AI Document Intelligence client library
     to analyze a given document using the prebuilt layout model.
+    Returns the analyze result as a dict.
     """
     document_intelligence_endpoint, document_intelligence_api_key = (
         load_azure_document_intelligence_credentials()
     )
 
-    client = initialize_document_analysis_client(
+    gateway = get_document_intelligence_gateway(
         document_intelligence_endpoint, document_intelligence_api_key
     )
-    if file_type == "pdf":
-        result = analyze_document(
-            client, model_id=model_id, document_path=path_or_bytes
-        )
-    elif file_type == "image":
-        result = analyze_image(client, model_id=model_id, image_path=path_or_bytes)
+    if file_type in ("pdf", "image"):
+        try:
+            with open(path_or_bytes, "rb") as document:
+                document_bytes = await asyncio.to_thread(document.read)
+        except FileNotFoundError:
+            logger.error(f"Document file not found: {path_or_bytes}")
+            raise
     elif file_type == "image_bytes":
-        result = analyze_image_from_bytes(client, model_id, image_bytes=path_or_bytes)
+        if not path_or_bytes:
+            raise ValueError("Image bytes cannot be empty.")
+        document_bytes = path_or_bytes
     else:
         raise ValueError(f"Unsupported file type: {file_type}")
+    result = await gateway.analyze(document_bytes, model_id=model_id)
     logger.info("Document intelligence extraction completed successfully.")
     return result
 
@@ -92,7 +93,7 @@ async def get_document_intelligence(
     ):
         logger.info("File does not exist, extracting using document intelligence.")
         try:
-            raw_document_intelligence_output = extract_data_document_intelligence(
+            raw_document_intelligence_output = await extract_data_document_intelligence(
                 path, file_type, model_id="prebuilt-layout"
             )
         except Exception as e:
@@ -102,7 +103,7 @@ async def get_document_intelligence(
         logger.info("INIT: Filtering document intelligence data and saving to storage.")
         try:
             filtered_document_intelligence_output_dict = (
-                raw_document_intelligence_output.to_dict()
+                raw_document_intelligence_output
             )
             document_intelligence_json_data = {
                 "analyzeResult": filtered_document_intelligence_output_dict
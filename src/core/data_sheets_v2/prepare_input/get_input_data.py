@@ -16,6 +16,7 @@ from src.data_sheets_v2.prepare_input.bounding_box.get_bounding_box_region impor
 from src.data_sheets_v2.prepare_input.landing_ai.vision_extract_input_json import (
     parse_pages,
 )
+from src.data_sheets_v2.extract_table_data.page_cache import PageImageCache
 
 
 async def get_list_of_page(bucket, path):
@@ -35,13 +36,18 @@ async def get_list_of_page(bucket, path):
 
 
 async def get_document_intelligence_files(
-    bucket_name, image_path, extracted_document_intelligence_pdf_output_path
+    bucket_name,
+    image_path,
+    extracted_document_intelligence_pdf_output_path,
+    page_cache=None,
 ):
     """
     Get document intelligence files from the specified bucket and path.
     """
     logger.info("INIT: Extracting document intelligence data from file")
     image_bytes = await load_into_memory(bucket_name, image_path)
+    if page_cache is not None:
+        page_cache.put(image_path, image_bytes)
 
     await get_document_intelligence(
         bucket_name,
@@ -67,12 +73,14 @@ async def prepare_table_extraction_data(
     input_table_data = []
     input_data = {"meta_data": {}, "table_data": input_table_data}
     image_path_list = await get_list_of_page(bucket_name, data_sheet_folder_path)
+    page_cache = PageImageCache()
     for image_path in image_path_list:
         document_intelligence_image_path = f"{image_path}.ocr.json"
         await get_document_intelligence_files(
             bucket_name,
             image_path,
             document_intelligence_image_path,
+            page_cache,
         )
         extracted_document_intelligence_json = await load_json_from_storage(
             bucket_name, document_intelligence_image_path
@@ -96,10 +104,13 @@ async def prepare_table_extraction_data(
                 "appearance_number": 1,
                 "is_validated": False,
             },
+            page_cache,
         )
         input_table_data.extend(table_data)
         # break
 
+    page_cache.log_stats()
+    page_cache.close()
     input_data["table_data"] = input_table_data
     updated_input_data = _input_meta_data(input_data, document_id, plant_id)
     logger.info("DONE: Extracted input data for table extraction.")
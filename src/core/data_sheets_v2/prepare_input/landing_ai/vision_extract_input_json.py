@@ -6,11 +6,10 @@ and the `PIL` library for image handling.
 
 import re
 import uuid
-from io import BytesIO
-from PIL import Image
 from agentic_doc.parse import parse  # type: ignore
 from agentic_doc.common import ChunkType  # type: ignore
 from src.utils.s3_download_upload import load_into_memory
+from src.data_sheets_v2.extract_table_data.page_cache import PageImageCache
 from src.data_sheets_v2.prepare_input.bounding_box.extract_table_has_property_info import (
     get_table_info_llm,
 )
@@ -23,6 +22,7 @@ async def parse_pages(bucket_name: str, image_path_list: list) -> list:
     input_data_entries = []
     table_idx = 1
     figure_idx = 1
+    page_cache = PageImageCache()
     for image_path in image_path_list:
         try:
             file_bytes = await load_into_memory(bucket_name, image_path)
@@ -31,7 +31,7 @@ async def parse_pages(bucket_name: str, image_path_list: list) -> list:
                 continue
 
             parsed_docs = parse(file_bytes)
-            image = Image.open(BytesIO(file_bytes))
+            image = page_cache.put(image_path, file_bytes)
             width, height = image.size
             image_info = str(image_path).split("+")
             doc = parsed_docs[0]  # Assuming single document per image
@@ -51,7 +51,10 @@ async def parse_pages(bucket_name: str, image_path_list: list) -> list:
                     table_has_property = True
                     table_name = ""
                     table_info_llm = await get_table_info_llm(
-                        bucket_name, image_path, table_bounding_box
+                        bucket_name,
+                        image_path,
+                        table_bounding_box,
+                        page_cache=page_cache,
                     )
                     table_has_property = table_info_llm[0].get(
                         "table_has_property", True
@@ -115,4 +118,6 @@ async def parse_pages(bucket_name: str, image_path_list: list) -> list:
         except (IOError, ValueError, AttributeError) as e:
             print(f"[ERROR] Parsing document {e}")
 
+    page_cache.log_stats()
+    page_cache.close()
     return input_data_entries
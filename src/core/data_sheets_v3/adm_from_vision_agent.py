@@ -2,111 +2,68 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import pathlib
-import time
-import concurrent.futures as cf
 from typing import Dict, Any, List
 
-import requests
 from dotenv import load_dotenv
 
+from src.utils.landing_ai_client import LandingAIClient, PollPolicy
+
 load_dotenv()
 
 
 # --------------------------------------------------------------------- #
 VA_API_KEY: str = os.getenv("VA_API_KEY", "")
-HEADERS = {"Authorization": f"Basic {VA_API_KEY}"}
-BASE_URL = "https://api.va.landing.ai/v1/tools/agentic-document-analysis"
+BASE_URL = os.getenv(
+    "LANDING_AI_BASE_URL",
+    "https://api.va.landing.ai/v1/tools/agentic-document-analysis",
+)
 
 CONNECT_TIMEOUT = 10  # seconds
 READ_TIMEOUT = 300  # seconds per chunk
 MAX_RETRIES = 3
-POLL_INTERVAL = 15  # seconds
+MAX_INFLIGHT_JOBS = int(os.getenv("LANDING_AI_MAX_INFLIGHT_JOBS", "4"))
+CHUNK_PAGES = int(os.getenv("LANDING_AI_CHUNK_PAGES", "0"))
+POLL_POLICY = PollPolicy(
+    initial_interval=float(os.getenv("LANDING_AI_POLL_INITIAL_SECONDS", "1")),
+    max_interval=float(os.getenv("LANDING_AI_POLL_MAX_INTERVAL_SECONDS", "10")),
+    max_wait=float(os.getenv("LANDING_AI_POLL_MAX_WAIT_SECONDS", "900")),
+)
 
 OUTPUT_DIR = pathlib.Path("outputs")
 OUTPUT_DIR.mkdir(exist_ok=True)
 
 
+def _client() -> LandingAIClient:
+    return LandingAIClient(
+        VA_API_KEY,
+        base_url=BASE_URL,
+        poll_policy=POLL_POLICY,
+        max_inflight_jobs=MAX_INFLIGHT_JOBS,
+        chunk_pages=CHUNK_PAGES,
+        connect_timeout=CONNECT_TIMEOUT,
+        read_timeout=READ_TIMEOUT,
+        max_retries=MAX_RETRIES,
+    )
+
+
 # --------------------------------------------------------------------- #
-def extract_one(pdf_path: pathlib.Path, schema: Dict[str, Any]) -> pathlib.Path:
-    """Submit one PDF and poll until Landing AI returns extracted_schema."""
-    files = {"pdf": (pdf_path.name, pdf_path.open("rb"), "application/pdf")}
-    payload = {"fields_schema": json.dumps(schema)}
-
-    # First request ----------------------------------------------------------------
-    try:
-        resp = requests.post(
-            BASE_URL,
-            headers=HEADERS,
-            files=files,
-            data=payload,
-            timeout=(CONNECT_TIMEOUT, None),
-        )
-    except requests.RequestException as exc:
-        raise RuntimeError(
-            f"Initial request failed for {pdf_path.name}: {exc}"
-        ) from exc
-
-    # 202 Accepted  →  async job; Location header gives polling URL
-    if resp.status_code == 202:
-        status_url = resp.headers["Location"]
-    else:
-        status_url = None
-
-    # 206 Partial or 200 Success can arrive immediately
-    if resp.status_code in (200, 206):
-        body = resp.json()
-    else:
-        # Unexpected
-        raise RuntimeError(
-            f"{pdf_path.name}: HTTP {resp.status_code} – {resp.text[:300]}"
-        )
-    # ↓↓↓ add these two lines ↓↓↓
-    if resp.status_code == 206 and "data" in body and "status" not in body:
-        body["status"] = "partial"
-
-    if "status" not in body:
-        debug_file = OUTPUT_DIR / f"{pdf_path.stem}_error.json"
-        debug_file.write_text(json.dumps(body, indent=2, ensure_ascii=False))
-        err_msg = body.get("error", {}).get("message", "<no message>")
-        raise RuntimeError(
-            f"{pdf_path.name}: unexpected response ({resp.status_code}) – {err_msg}\n"
-            f"Full payload saved to {debug_file}"
-        )
-
-    # Poll loop if needed ----------------------------------------------------------
-    retries = 0
-    while status_url and body.get("status") == "processing":
-        time.sleep(POLL_INTERVAL)
-        try:
-            body = requests.get(
-                status_url,
-                headers=HEADERS,
-                timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
-            ).json()
-        except requests.RequestException as exc:
-            retries += 1
-            if retries > MAX_RETRIES:
-                raise RuntimeError(f"{pdf_path.name}: polling failed – {exc}") from exc
-            time.sleep(POLL_INTERVAL * retries)  # exponential back-off
-            continue
-
-    # Final verification -----------------------------------------------------------
-    if body.get("status") not in ("success", "partial"):
-        raise RuntimeError(f"{pdf_path.name}: extractor returned {body.get('status')}")
-
-    # >>> INSIGHT PRINT BLOCK (add here)
-    run_logs = body.get("logs") or body.get("data", {}).get("logs")
+async def _extract_and_save(
+    client: LandingAIClient, pdf_path: pathlib.Path, schema: Dict[str, Any]
+) -> pathlib.Path:
+    result = await client.extract(pdf_path, schema)
+
+    run_logs = result.logs
     if run_logs:
         print(f"— Landing-AI run-logs for {pdf_path.name} —")
         for line in run_logs:
             print("   ", line)
         print("— end logs —\n")
-    # <<<
 
-    extracted = body.get("data", {}).get("extracted_schema", {})
+    extracted = result.extracted
 
     out_file = OUTPUT_DIR / f"{pdf_path.stem}_extracted.json"
     out_file.write_text(json.dumps(extracted, indent=2, ensure_ascii=False))
@@ -114,21 +71,32 @@ def extract_one(pdf_path: pathlib.Path, schema: Dict[str, Any]) -> pathlib.Path:
     return out_file
 
 
+def extract_one(pdf_path: pathlib.Path, schema: Dict[str, Any]) -> pathlib.Path:
+    """Submit one PDF and poll until Landing AI returns extracted_schema."""
+
+    async def run() -> pathlib.Path:
+        async with _client() as client:
+            return await _extract_and_save(client, pdf_path, schema)
+
+    return asyncio.run(run())
+
+
 # --------------------------------------------------------------------- #
 # --------------------------------------------------------------------- #
 def extract_many(pdf_paths: List[pathlib.Path], schema_path: pathlib.Path) -> None:
-    """Run extraction on a list of PDFs using a thread pool."""
+    """Run extraction on a list of PDFs concurrently from one event loop."""
     schema = json.loads(schema_path.read_text(encoding="utf-8"))
 
-    with cf.ThreadPoolExecutor(max_workers=min(4, len(pdf_paths))) as pool:
-        futures = {pool.submit(extract_one, path, schema): path for path in pdf_paths}
+    async def run() -> list:
+        async with _client() as client:
+            return await asyncio.gather(
+                *(_extract_and_save(client, path, schema) for path in pdf_paths),
+                return_exceptions=True,
+            )
 
-        for fut in cf.as_completed(futures):
-            pdf = futures[fut]
-            try:
-                fut.result()
-            except Exception as err:  # pylint: disable=broad-except
-                print(f"✖ {pdf.name}: {err}")
+    for pdf, result in zip(pdf_paths, asyncio.run(run())):
+        if isinstance(result, Exception):
+            print(f"✖ {pdf.name}: {result}")
 
 
 # --------------------------------------------------------------------- #
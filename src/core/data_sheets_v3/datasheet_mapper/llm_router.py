@@ -8,6 +8,7 @@ from __future__ import annotations
 import os
 import json
 import functools
+from src.utils.llm_models.response_cache import cached_llm_invoke
 from langchain_openai import AzureChatOpenAI
 from langchain.schema import SystemMessage
 
@@ -56,8 +57,14 @@ def llm_match(question: str) -> dict[str, str]:
         {"role": "user", "content": question},
     ]
 
-    resp = LLM.invoke(messages, response_format={"type": "json_object"})
+    content = cached_llm_invoke(
+        LLM,
+        messages,
+        "llm_match",
+        validate=json.loads,
+        response_format={"type": "json_object"},
+    )
     try:
-        return json.loads(resp.content)
+        return json.loads(content)
     except Exception:
         return {}
@@ -0,0 +1,166 @@
+"""Async AppSync GraphQL client with connection pooling.
+
+One `httpx.AsyncClient` is shared by every call made from the same event
+loop. Identical concurrent requests are coalesced into one round trip,
+read-only lookups listed in `CACHED_QUERIES` are kept for a short TTL, and
+writes sharing a debounce key are merged so only the latest payload is sent.
+"""
+
+import asyncio
+import json
+import os
+import time
+import httpx
+from src.utils.log import logger
+from src.utils.token import get_token
+
+API_URL = os.getenv("APPSYNC_ENDPOINT")
+GRAPHQL_TIMEOUT = float(os.getenv("GRAPHQL_TIMEOUT", "10"))
+GRAPHQL_MAX_CONNECTIONS = int(os.getenv("GRAPHQL_MAX_CONNECTIONS", "20"))
+GRAPHQL_READ_CACHE_TTL = float(os.getenv("GRAPHQL_READ_CACHE_TTL", "300"))
+GRAPHQL_DEBOUNCE_SECONDS = float(os.getenv("GRAPHQL_DEBOUNCE_SECONDS", "0.2"))
+CACHED_QUERIES = {"GET_DATABASE_NAME_FROM_PLANT_ID"}
+
+
+class GraphQLClient:
+    """Pooled, coalescing GraphQL client."""
+
+    def __init__(self, url=API_URL):
+        self.url = url
+        self._client = None
+        self._client_loop = None
+        self._in_flight = {}
+        self._read_cache = {}
+        self._pending_writes = {}
+        self._last_writes = {}
+
+    def _http(self):
+        # httpx clients are bound to the loop they were first used on.
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=GRAPHQL_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=GRAPHQL_MAX_CONNECTIONS,
+                    max_keepalive_connections=GRAPHQL_MAX_CONNECTIONS,
+                ),
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def _post(self, body, token):
+        response = await self._http().post(
+            self.url,
+            content=body,
+            headers={"Authorization": token, "Content-Type": "application/json"},
+        )
+        res = response.json()
+        logger.info(f"GraphQL response: {res}")
+        return res
+
+    async def execute(
+        self, query, operation_name, operation_type, variables, token=None
+    ):
+        """Send one operation, sharing the round trip with identical in-flight calls."""
+        token = token if token is not None else get_token()
+        body = json.dumps(
+            {
+                "query": query,
+                "operation_name": operation_name,
+                "operation_type": operation_type,
+                "variables": variables,
+            }
+        )
+        key = (body, token)
+        cacheable = operation_type == "query" and operation_name in CACHED_QUERIES
+        if cacheable:
+            cached = self._read_cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+        if key in self._in_flight:
+            return await asyncio.shield(self._in_flight[key])
+
+        task = asyncio.ensure_future(self._post(body, token))
+        self._in_flight[key] = task
+        try:
+            res = await task
+        finally:
+            self._in_flight.pop(key, None)
+        if cacheable and "errors" not in res:
+            self._read_cache[key] = (time.monotonic() + GRAPHQL_READ_CACHE_TTL, res)
+        return res
+
+    async def execute_debounced(
+        self, debounce_key, query, operation_name, operation_type, variables
+    ):
+        """Send a write; writes arriving while one is in flight are merged.
+
+        An uncontended write is sent at once. Calls made while a write for the
+        same key is in flight queue behind it, and only the latest of them is
+        sent, after a short quiet period. A write identical to the last one
+        sent for the key within that period is skipped and answered with that
+        earlier result.
+        """
+        token = get_token()
+        args = (query, operation_name, operation_type, variables, token)
+        payload = json.dumps(variables, sort_keys=True)
+        last = self._last_writes.get(debounce_key)
+        if (
+            last
+            and last[0] == payload
+            and time.monotonic() - last[1] < GRAPHQL_DEBOUNCE_SECONDS
+        ):
+            return last[2]
+
+        loop = asyncio.get_running_loop()
+        state = self._pending_writes.get(debounce_key)
+        if state is not None:
+            queued = state["next"]
+            if queued is None:
+                queued = state["next"] = {"future": loop.create_future()}
+            queued["args"] = args
+            return await asyncio.shield(queued["future"])
+
+        write = {"args": args, "future": loop.create_future()}
+        state = {"next": None}
+        self._pending_writes[debounce_key] = state
+        # The writes run in their own task so a cancelled caller cannot strand
+        # the callers queued behind it.
+        state["task"] = asyncio.ensure_future(
+            self._drain_writes(debounce_key, state, write)
+        )
+        return await asyncio.shield(write["future"])
+
+    async def _drain_writes(self, debounce_key, state, write):
+        """Send `write`, then the latest write queued behind it, until none is left."""
+        try:
+            while write is not None:
+                try:
+                    res = await self.execute(*write["args"])
+                except Exception as e:
+                    write["future"].set_exception(e)
+                else:
+                    write["future"].set_result(res)
+                    sent_payload = json.dumps(write["args"][3], sort_keys=True)
+                    self._last_writes[debounce_key] = (
+                        sent_payload,
+                        time.monotonic(),
+                        res,
+                    )
+                if state["next"] is not None:
+                    await asyncio.sleep(GRAPHQL_DEBOUNCE_SECONDS)
+                write, state["next"] = state["next"], None
+        finally:
+            self._pending_writes.pop(debounce_key, None)
+            for leftover in (write, state["next"]):
+                if leftover is not None and not leftover["future"].done():
+                    leftover["future"].cancel()
+
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+graphql_client = GraphQLClient()
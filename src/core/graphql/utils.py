@@ -1,9 +1,8 @@
 """This module contains utility functions"""
 
-import json
 import os
-import requests
 from src.utils.log import logger
+from src.graphql.client import graphql_client
 from src.graphql.operations import (
     GET_PLANT_GRAPH_QL,
     GET_DOCUMENT_GRAPH_QL_STATUS,
@@ -12,37 +11,18 @@ from src.graphql.operations import (
     UPDATE_GRAPH_QL_DATABASE,
     UPDATE_DOCUMENT,
 )
-from src.utils.token import get_token
 
-API_URL = os.getenv("APPSYNC_ENDPOINT")
 REGION = os.getenv("REGION")
 USER_GROUP = os.getenv("USER_GROUP")
 ADMIN_GROUP = os.getenv("ADMIN_GROUP")
 MEMBER_ID = os.getenv("MEMBER_ID")
 
 
-def call_graph_ql(query, operation_name, operation_type, variables):
+async def call_graph_ql(query, operation_name, operation_type, variables):
     """call graphql"""
-    app_sync_url = API_URL
-    # Create request
-    token = get_token()
-    res = requests.post(
-        app_sync_url,
-        data=json.dumps(
-            {
-                "query": query,
-                "operation_name": operation_name,
-                "operation_type": operation_type,
-                "variables": variables,
-            }
-        ),
-        headers={"Authorization": token, "Content-Type": "application/json"},
-        timeout=10
+    return await graphql_client.execute(
+        query, operation_name, operation_type, variables
     )
-    res = res.json()
-    logger.info(f"GraphQL response: {res}")
-
-    return res
 
 
 async def get_graph_ql_status(graph_id):
@@ -50,12 +30,12 @@ async def get_graph_ql_status(graph_id):
     if not os.getenv("LOCAL", "false") == "true":
         logger.info("INIT: Getting GraphQL status")
         try:
-            result = call_graph_ql(
+            result = await call_graph_ql(
                 GET_PLANT_GRAPH_QL, "GET_PLANT_GRAPH_QL", "query", {"id": graph_id}
             )
             graph_ql_status = result["data"]["getPlant"]["graphDatabase"]
             if not graph_ql_status:
-                step_status = call_graph_ql(
+                step_status = await call_graph_ql(
                     CREATE_GRAPH_QL_DATABASE,
                     "CREATE_GRAPH_QL_DATABASE",
                     "mutation",
@@ -71,7 +51,7 @@ async def get_graph_ql_status(graph_id):
                 )
                 status = step_status["data"]["createGraphDatabase"]["status"]
                 graph_database_id = step_status["data"]["createGraphDatabase"]["id"]
-                call_graph_ql(
+                await call_graph_ql(
                     UPDATE_PLANT_GRAPH_QL,
                     "UPDATE_PLANT_GRAPH_QL",
                     "mutation",
@@ -95,7 +75,7 @@ async def get_graph_ql_document_status(graph_id):
         logger.info("INIT: Getting GraphQL Document status")
         try:
             # Call the GraphQL API
-            result = call_graph_ql(
+            result = await call_graph_ql(
                 GET_DOCUMENT_GRAPH_QL_STATUS, "status", "query", {"id": graph_id}
             )
             # Correctly access the 'getDocument' key
@@ -122,7 +102,7 @@ async def update_graph_ql_status(graph_id, status):
     if not os.getenv("LOCAL", "false") == "true":
         logger.info("INIT: Updating GraphQL status")
         try:
-            step_status = call_graph_ql(
+            step_status = await call_graph_ql(
                 GET_PLANT_GRAPH_QL, "GET_PLANT_GRAPH_QL", "query", {"id": graph_id}
             )
             if (
@@ -133,7 +113,7 @@ async def update_graph_ql_status(graph_id, status):
                 graph_database_id = step_status["data"]["getPlant"]["graphDatabase"][
                     "id"
                 ]
-                result = call_graph_ql(
+                result = await call_graph_ql(
                     UPDATE_GRAPH_QL_DATABASE,
                     "UPDATE_GRAPH_QL_DATABASE",
                     "mutation",
@@ -163,7 +143,8 @@ async def update_document_status(document_id, status):
     if not os.getenv("LOCAL", "false") == "true":
         logger.info("INIT: Updating Document")
         try:
-            call_graph_ql(
+            await graphql_client.execute_debounced(
+                ("UpdateDocument.status", document_id),
                 UPDATE_DOCUMENT,
                 "UpdateDocument",
                 "mutation",
@@ -184,7 +165,8 @@ async def update_document_junior_status(document_id, status):
     if not os.getenv("LOCAL", "false") == "true":
         logger.info("INIT: Updating juniorOutputStatus for Document")
         try:
-            call_graph_ql(
+            await graphql_client.execute_debounced(
+                ("UpdateDocument.juniorOutputStatus", document_id),
                 UPDATE_DOCUMENT,
                 "UpdateDocument",
                 "mutation",
@@ -1,11 +1,33 @@
 """This module provides functionality to ingest data sheets"""
 
 # pylint: disable=R0801
+import os
 import time
+from collections import defaultdict
 from src.utils.neo4j_connector import Neo4jConnection
+from src.utils.graph_diff import (
+    GraphDiff,
+    ensure_manifest_constraint,
+    fingerprint,
+    node_key,
+    read_fingerprints,
+    split_key,
+    write_fingerprints,
+)
 from src.utils.log import logger
 from src.constants import ADM_IngestionStatus
 
+DATA_SHEET_BULK_INGEST = os.getenv("DATA_SHEET_BULK_INGEST", "true").lower() == "true"
+DATA_SHEET_DIFF_INGEST = os.getenv("DATA_SHEET_DIFF_INGEST", "false").lower() == "true"
+
+CORE_SECTIONS = ["metaData", "equipments", "nozzles", "subparts"]
+# Identity property of each node label; auxiliary node labels use `uuid`.
+KEY_PROPERTIES = {
+    "EQUIPMENT": "equipmentUuid",
+    "NOZZLE": "nozzleUuid",
+    "SUBPART": "subpartUuid",
+}
+
 
 def _ingest_subparts(session, data):
     """
@@ -373,17 +395,542 @@ def _update_data_sheet_ingestion_timestamp(session, uuid):
     )
 
 
-async def ingest_data_sheet(adm, database_name, plant_id):
-    """This function ingests data sheet into the database"""
-    logger.info("INIT: ingest_data_sheet")
-    neo4j_conn = Neo4jConnection(database_name)
-    neo4j_conn.connect()
+def _subpart_rows(subparts, dataSheetUuid):
+    """Build the UNWIND rows for subparts, mirroring `_ingest_subparts`."""
+    rows = []
+    for subpart in subparts:
+        if "uuid" not in subpart or not subpart["uuid"]:
+            logger.info("Skipping subpart")
+            continue
+        equipmentTypeName = subpart.get("equipmentTypeName", "")
+        rows.append(
+            {
+                "subpartUuid": subpart["uuid"],
+                "equipmentUuid": subpart.get("equipmentUuid"),
+                "equipmentTypeName": equipmentTypeName,
+                "properties": {
+                    "dataSheetUuid": dataSheetUuid,
+                    "label": "SubPart",
+                    "equipmentTypeName": equipmentTypeName,
+                    **{k: v for k, v in subpart.items() if k != "uuid"},
+                },
+            }
+        )
+    return rows
+
+
+def _nozzle_rows(nozzles, dataSheetUuid):
+    """Build the UNWIND rows for nozzles, mirroring `_ingest_nozzles`."""
+    rows = []
+    for nozzle in nozzles:
+        if "uuid" not in nozzle or not nozzle["uuid"]:
+            logger.info(f"Nozzle UUID is not available. Skipping nozzle: {nozzle}")
+            continue
+        nozzle_properties = {k: v for k, v in nozzle.items() if k != "uuid"}
+        nozzle_properties["dataSheetUuid"] = dataSheetUuid
+        rows.append(
+            {
+                "nozzleUuid": nozzle["uuid"],
+                "equipmentUuid": nozzle.get("equipmentUuid", ""),
+                "equipmentTypeName": nozzle.get("equipmentTypeName", ""),
+                "properties": nozzle_properties,
+            }
+        )
+    return rows
+
+
+def _equipment_rows(equipments, dataSheetUuid, plantId):
+    """Build the UNWIND rows for equipments, mirroring `_ingest_equipments`."""
+    rows = []
+    for equipment in equipments:
+        equipmentUuid = equipment.get("uuid")
+        equipmentTypeName = equipment.get("equipmentTypeName", "")
+        rows.append(
+            {
+                "equipmentUuid": equipmentUuid,
+                "equipmentTypeName": equipmentTypeName,
+                "properties": {
+                    "dataSheetUuid": dataSheetUuid,
+                    "plantId": plantId,
+                    "label": "Equipment",
+                    "equipmentTypeName": equipmentTypeName,
+                    "equipmentUuid": equipmentUuid,
+                    **{k: v for k, v in equipment.items() if k != "uuid"},
+                },
+            }
+        )
+    return rows
+
+
+def _node_rows(properties_list, label, dataSheetUuid, plantId):
+    """Build the UNWIND rows for auxiliary nodes, mirroring `_ingest_nodes`."""
+    if not properties_list:
+        raise ValueError("Missing or empty 'properties' in node_data")
+    rows = []
+    for node_subtype in properties_list:
+        if "uuid" not in node_subtype:
+            raise ValueError("Missing 'uuid' in one of the equipment properties")
+        equipmentTypeName = node_subtype.get("equipmentTypeName")
+        subpartTypeName = node_subtype.get("subpartTypeName")
+        equipmentUuid = node_subtype.get("equipmentUuid")
+        rows.append(
+            {
+                "uuid": node_subtype["uuid"],
+                "equipmentUuid": equipmentUuid,
+                "equipmentTypeName": equipmentTypeName,
+                "subpartTypeName": subpartTypeName,
+                "properties": {
+                    "dataSheetUuid": dataSheetUuid,
+                    "plantId": plantId,
+                    "label": label,
+                    "equipmentTypeName": equipmentTypeName,
+                    "equipmentUuid": equipmentUuid,
+                    "subpartTypeName": subpartTypeName,
+                    **{k: v for k, v in node_subtype.items() if k != "uuid"},
+                },
+            }
+        )
+    return rows
+
+
+def _data_sheet_edge_keys(rows, uuid_field):
+    """Edge keys and item positions reproducing the per-item data sheet edges.
+
+    The per-item path links every nozzle/subpart of the data sheet that exists
+    so far once per item, so on a fresh ingest the item at position j only gets
+    the (equipmentTypeName, equipmentUuid) keys of items at positions >= j.
+    Returns the distinct keys with the last position they occur at, and the
+    first position of every item uuid.
+    """
+    keys = {}
+    positions = {}
+    for position, row in enumerate(rows):
+        key = (row["equipmentTypeName"], row["equipmentUuid"])
+        keys[key] = {
+            "equipmentTypeName": row["equipmentTypeName"],
+            "equipmentUuid": row["equipmentUuid"],
+            "last": position,
+        }
+        positions.setdefault(row[uuid_field], position)
+    return list(keys.values()), positions
+
+
+def _existing_data_sheet_items(tx, label, uuid_field, dataSheetUuid, plantId):
+    """Uuids of `label` nodes already linked to the data sheet by property.
+
+    Those match the per-item data sheet edge query from its first item on.
+    """
+    record = tx.run(
+        f"""
+        MATCH (n:{label} {{dataSheetUuid: $dataSheetUuid, plantId: $plantId}})
+        RETURN collect(n.{uuid_field}) AS uuids
+        """,
+        dataSheetUuid=dataSheetUuid,
+        plantId=plantId,
+    ).single()
+    return record["uuids"] if record else []
+
+
+def _ingest_equipments_bulk(tx, rows, dataSheetUuid, plantId):
+    """Merge all equipments and their data sheet edges with two statements."""
+    results = []
+    results.append(
+        tx.run(
+            """
+            UNWIND $rows AS row
+            MERGE (e:EQUIPMENT {equipmentUuid: row.equipmentUuid})
+            ON CREATE SET e += row.properties
+            ON MATCH SET e += row.properties
+            """,
+            rows=rows,
+        )
+    )
+    results.append(
+        tx.run(
+            """
+            MATCH (d:DATA_SHEET {uuid: $dataSheetUuid, plantId: $plantId})
+            UNWIND $rows AS row
+            MATCH (e:EQUIPMENT {equipmentUuid: row.equipmentUuid, dataSheetUuid: $dataSheetUuid, plantId: $plantId})
+            MERGE (e)-[:BELONGS_TO_DATA_SHEET {plantId: $plantId, equipmentTypeName: row.equipmentTypeName, equipmentUuid: row.equipmentUuid}]->(d)
+            MERGE (d)-[:DESCRIBES_EQUIPMENT {plantId: $plantId, equipmentTypeName: row.equipmentTypeName, equipmentUuid: row.equipmentUuid}]->(e)
+            """,
+            rows=rows,
+            dataSheetUuid=dataSheetUuid,
+            plantId=plantId,
+        )
+    )
+    return results
+
+
+def _ingest_nozzles_bulk(tx, rows, equipmentTag, dataSheetUuid, plantId):
+    """Merge all nozzles, their equipment edges and data sheet edges."""
+    existing = _existing_data_sheet_items(
+        tx, "NOZZLE", "nozzleUuid", dataSheetUuid, plantId
+    )
+    keys, positions = _data_sheet_edge_keys(rows, "nozzleUuid")
+    results = []
+    results.append(
+        tx.run(
+            """
+            UNWIND $rows AS row
+            MERGE (n:NOZZLE {nozzleUuid: row.nozzleUuid})
+            ON CREATE SET
+                n.equipmentTag = $equipmentTag,
+                n.plantId = $plantId,
+                n += row.properties,
+                n.source = "dataSheet",
+                n.label = "Nozzle",
+                n.equipmentTypeName = row.equipmentTypeName
+            ON MATCH SET
+                n += row.properties
+            """,
+            rows=rows,
+            equipmentTag=equipmentTag,
+            plantId=plantId,
+        )
+    )
+    results.append(
+        tx.run(
+            """
+            UNWIND $rows AS row
+            MATCH (e:EQUIPMENT {equipmentUuid: row.equipmentUuid, plantId: $plantId})
+            MATCH (n:NOZZLE {nozzleUuid: row.nozzleUuid, plantId: $plantId})
+            MERGE (e)-[:CONTAINS_NOZZLE {plantId: $plantId, equipmentTypeName: row.equipmentTypeName, equipmentUuid: row.equipmentUuid}]->(n)
+            MERGE (n)-[:PART_OF_EQUIPMENT {plantId: $plantId, equipmentTypeName: row.equipmentTypeName, equipmentUuid: row.equipmentUuid}]->(e)
+            """,
+            rows=rows,
+            plantId=plantId,
+        )
+    )
+    results.append(
+        tx.run(
+            """
+            MATCH (d:DATA_SHEET {uuid: $dataSheetUuid, plantId: $plantId})
+            MATCH (n:NOZZLE {dataSheetUuid: $dataSheetUuid, plantId: $plantId})
+            UNWIND $keys AS key
+            WITH d, n, key
+            WHERE n.nozzleUuid IN $existing OR $positions[n.nozzleUuid] <= key.last
+            MERGE (n)-[:BELONGS_TO_DATA_SHEET {plantId: $plantId, equipmentTypeName: key.equipmentTypeName, equipmentUuid: key.equipmentUuid}]->(d)
+            MERGE (d)-[:DESCRIBES_NOZZLE {plantId: $plantId, equipmentTypeName: key.equipmentTypeName, equipmentUuid: key.equipmentUuid}]->(n)
+            """,
+            keys=keys,
+            existing=existing,
+            positions=positions,
+            dataSheetUuid=dataSheetUuid,
+            plantId=plantId,
+        )
+    )
+    return results
+
+
+def _ingest_subparts_bulk(tx, rows, equipmentTag, dataSheetUuid, plantId):
+    """Merge all subparts, their equipment/nozzle edges and data sheet edges."""
+    existing = _existing_data_sheet_items(
+        tx, "SUBPART", "subpartUuid", dataSheetUuid, plantId
+    )
+    keys, positions = _data_sheet_edge_keys(rows, "subpartUuid")
+    results = []
+    results.append(
+        tx.run(
+            """
+            UNWIND $rows AS row
+            MATCH (e:EQUIPMENT {equipmentUuid: row.equipmentUuid, plantId: $plantId})
+            MERGE (sp:SUBPART {subpartUuid: row.subpartUuid, equipmentTag: $equipmentTag, plantId: $plantId})
+            ON CREATE SET sp += row.properties, sp.source = "dataSheet"
+            ON MATCH SET sp += row.properties
+            MERGE (e)-[:CONTAINS_SUBPART {plantId: $plantId, equipmentTypeName: row.equipmentTypeName, equipmentUuid: row.equipmentUuid}]->(sp)
+            MERGE (sp)-[:PART_OF_EQUIPMENT {plantId: $plantId, equipmentTypeName: row.equipmentTypeName, equipmentUuid: row.equipmentUuid}]->(e)
+            """,
+            rows=rows,
+            equipmentTag=equipmentTag,
+            plantId=plantId,
+        )
+    )
+    results.append(
+        tx.run(
+            """
+            UNWIND $rows AS row
+            MATCH (n:NOZZLE {subpartUuid: row.subpartUuid, plantId: $plantId})
+            MATCH (sp:SUBPART {subpartUuid: row.subpartUuid, plantId: $plantId})
+            MERGE (sp)-[:CONTAINS_NOZZLE {plantId: $plantId, equipmentTypeName: row.equipmentTypeName, equipmentUuid: row.equipmentUuid}]->(n)
+            MERGE (n)-[:PART_OF_SUBPART {plantId: $plantId, equipmentTypeName: row.equipmentTypeName, equipmentUuid: row.equipmentUuid}]->(sp)
+            """,
+            rows=rows,
+            plantId=plantId,
+        )
+    )
+    results.append(
+        tx.run(
+            """
+            MATCH (d:DATA_SHEET {uuid: $dataSheetUuid, plantId: $plantId})
+            MATCH (sp:SUBPART {dataSheetUuid: $dataSheetUuid, plantId: $plantId})
+            UNWIND $keys AS key
+            WITH d, sp, key
+            WHERE sp.subpartUuid IN $existing OR $positions[sp.subpartUuid] <= key.last
+            MERGE (sp)-[:BELONGS_TO_DATA_SHEET {plantId: $plantId, equipmentTypeName: key.equipmentTypeName, equipmentUuid: key.equipmentUuid}]->(d)
+            MERGE (d)-[:DESCRIBES_SUBPART {plantId: $plantId, equipmentTypeName: key.equipmentTypeName, equipmentUuid: key.equipmentUuid}]->(sp)
+            """,
+            keys=keys,
+            existing=existing,
+            positions=positions,
+            dataSheetUuid=dataSheetUuid,
+            plantId=plantId,
+        )
+    )
+    return results
+
+
+def _ingest_nodes_bulk(tx, rows, label, dataSheetUuid, plantId):
+    """Merge all auxiliary nodes of one label and their edges."""
+    results = []
+    label = label.upper()
+    results.append(
+        tx.run(
+            f"""
+            UNWIND $rows AS row
+            MERGE (a:{label} {{uuid: row.uuid}})
+            ON CREATE SET a += row.properties
+            ON MATCH SET a += row.properties
+            """,
+            rows=rows,
+        )
+    )
+    # A null subpartTypeName is left out of the edge properties entirely.
+    with_subpart = [row for row in rows if row["subpartTypeName"] is not None]
+    without_subpart = [row for row in rows if row["subpartTypeName"] is None]
+    for group, rel_props in (
+        (
+            with_subpart,
+            "plantId: $plantId, dataSheetUuid: $dataSheetUuid, "
+            "equipmentTypeName: row.equipmentTypeName, "
+            "subpartTypeName: row.subpartTypeName",
+        ),
+        (
+            without_subpart,
+            "plantId: $plantId, dataSheetUuid: $dataSheetUuid, "
+            "equipmentTypeName: row.equipmentTypeName",
+        ),
+    ):
+        if not group:
+            continue
+        results.append(
+            tx.run(
+                f"""
+                MATCH (d:DATA_SHEET {{uuid: $dataSheetUuid, plantId: $plantId}})
+                UNWIND $rows AS row
+                MATCH (a:{label} {{uuid: row.uuid}})
+                MERGE (a)-[:BELONGS_TO_DATA_SHEET {{{rel_props}}}]->(d)
+                MERGE (d)-[:DESCRIBES_{label} {{{rel_props}}}]->(a)
+                """,
+                rows=group,
+                dataSheetUuid=dataSheetUuid,
+                plantId=plantId,
+            )
+        )
+    equip_rel_props = (
+        "plantId: $plantId, equipmentUuid: row.equipmentUuid, "
+        "equipmentTypeName: row.equipmentTypeName"
+    )
+    results.append(
+        tx.run(
+            f"""
+            UNWIND $rows AS row
+            MATCH (a:{label} {{uuid: row.uuid}})
+            MATCH (e:EQUIPMENT {{equipmentUuid: row.equipmentUuid, plantId: $plantId}})
+            MERGE (a)-[:PART_OF_EQUIPMENT {{{equip_rel_props}}}]->(e)
+            MERGE (e)-[:CONTAINS_{label} {{{equip_rel_props}}}]->(a)
+            """,
+            rows=rows,
+            plantId=plantId,
+        )
+    )
+    return results
+
+
+def _ingest_data_sheet_bulk(tx, adm, plant_id):
+    """Ingest a whole data sheet ADM inside one transaction.
+
+    Every entity list is sent once with UNWIND and each edge type is created
+    by a single set-based statement, producing the same nodes and edges as
+    the per-item `_ingest_*` functions. Returns the summed update counters.
+    """
+    meta_data = adm["metaData"]
+    equipmentTag = meta_data["equipmentTag"]
+    dataSheetUuid = meta_data["uuid"]
+    _ingest_data_sheet_node(tx, meta_data, plant_id)
+
+    results = _ingest_equipments_bulk(
+        tx,
+        _equipment_rows(adm.get("equipments"), dataSheetUuid, plant_id),
+        dataSheetUuid,
+        plant_id,
+    )
+    nozzle_rows = _nozzle_rows(adm.get("nozzles") or [], dataSheetUuid)
+    if nozzle_rows:
+        results += _ingest_nozzles_bulk(
+            tx, nozzle_rows, equipmentTag, dataSheetUuid, plant_id
+        )
+    subpart_rows = _subpart_rows(adm.get("subparts") or [], dataSheetUuid)
+    if subpart_rows:
+        results += _ingest_subparts_bulk(
+            tx, subpart_rows, equipmentTag, dataSheetUuid, plant_id
+        )
+    for node in adm:
+        if node not in ["metaData", "equipments", "nozzles", "subparts"]:
+            rows = _node_rows(adm[node], node, dataSheetUuid, plant_id)
+            results += _ingest_nodes_bulk(tx, rows, node, dataSheetUuid, plant_id)
+
+    _update_data_sheet_ingestion_timestamp(tx, dataSheetUuid)
+    return _summed_counters(results)
+
+
+def _data_sheet_rows(adm, plant_id):
+    """Every node row of a data sheet ADM, keyed `<LABEL>:<uuid>` for diffing."""
+    meta_data = adm["metaData"]
+    dataSheetUuid = meta_data["uuid"]
+    rows = {node_key("DATA_SHEET", dataSheetUuid): meta_data}
+    for row in _equipment_rows(adm.get("equipments"), dataSheetUuid, plant_id):
+        rows[node_key("EQUIPMENT", row["equipmentUuid"])] = row
+    for row in _nozzle_rows(adm.get("nozzles") or [], dataSheetUuid):
+        rows[node_key("NOZZLE", row["nozzleUuid"])] = row
+    for row in _subpart_rows(adm.get("subparts") or [], dataSheetUuid):
+        rows[node_key("SUBPART", row["subpartUuid"])] = row
+    for node in adm:
+        if node not in CORE_SECTIONS:
+            for row in _node_rows(adm[node], node, dataSheetUuid, plant_id):
+                rows[node_key(node.upper(), row["uuid"])] = row
+    return rows
+
+
+def _changed_data_sheet_rows(rows, diff):
+    """Rows to rewrite, grouped by label.
+
+    Subparts of changed nozzles are included too, since their nozzle edges
+    are created from the subpart side.
+    """
+    changed = set(diff.inserted) | set(diff.updated)
+    changed_rows = defaultdict(list)
+    for key, row in rows.items():
+        if key in changed:
+            changed_rows[split_key(key)[0]].append(row)
+    nozzle_subparts = {
+        row["properties"].get("subpartUuid") for row in changed_rows["NOZZLE"]
+    }
+    changed_rows["SUBPART"] = [
+        row
+        for key, row in rows.items()
+        if split_key(key)[0] == "SUBPART"
+        and (key in changed or row["subpartUuid"] in nozzle_subparts)
+    ]
+    return changed_rows
+
+
+def _delete_data_sheet_nodes(tx, deleted_keys):
+    """Detach-delete the nodes that left the data sheet."""
+    deleted = defaultdict(list)
+    for key in deleted_keys:
+        label, uuid = split_key(key)
+        deleted[label].append(uuid)
+    results = []
+    for label, uuids in deleted.items():
+        key_property = KEY_PROPERTIES.get(label, "uuid")
+        results.append(
+            tx.run(
+                f"""
+                UNWIND $uuids AS uuid
+                MATCH (n:{label} {{{key_property}: uuid}})
+                DETACH DELETE n
+                """,
+                uuids=uuids,
+            )
+        )
+    return results
+
+
+def _upsert_data_sheet_rows(tx, adm, plant_id, changed_rows):
+    """Run the changed rows through the set-based statements of the bulk path."""
+    meta_data = adm["metaData"]
+    equipmentTag = meta_data["equipmentTag"]
+    dataSheetUuid = meta_data["uuid"]
+    results = []
+    if changed_rows["EQUIPMENT"]:
+        results += _ingest_equipments_bulk(
+            tx, changed_rows["EQUIPMENT"], dataSheetUuid, plant_id
+        )
+    if changed_rows["NOZZLE"]:
+        results += _ingest_nozzles_bulk(
+            tx, changed_rows["NOZZLE"], equipmentTag, dataSheetUuid, plant_id
+        )
+    if changed_rows["SUBPART"]:
+        results += _ingest_subparts_bulk(
+            tx, changed_rows["SUBPART"], equipmentTag, dataSheetUuid, plant_id
+        )
+    for node in adm:
+        if node not in CORE_SECTIONS and changed_rows[node.upper()]:
+            results += _ingest_nodes_bulk(
+                tx, changed_rows[node.upper()], node, dataSheetUuid, plant_id
+            )
+    return results
+
+
+def _summed_counters(results):
+    """Statement count and summed update counters of `results`."""
+    counters = {
+        "statements": len(results),
+        "nodes_created": 0,
+        "relationships_created": 0,
+    }
+    for result in results:
+        summary = result.consume().counters
+        counters["nodes_created"] += summary.nodes_created
+        counters["relationships_created"] += summary.relationships_created
+    return counters
+
+
+def _ingest_data_sheet_diff(tx, adm, plant_id, rows, diff, scope, fingerprints):
+    """Write only the inserted, updated and deleted nodes of a data sheet.
+
+    The new fingerprint manifest is stored in the same transaction.
+    """
+    changed_rows = _changed_data_sheet_rows(rows, diff)
+    _ingest_data_sheet_node(tx, adm["metaData"], plant_id)
+    results = _delete_data_sheet_nodes(tx, diff.deleted)
+    results += _upsert_data_sheet_rows(tx, adm, plant_id, changed_rows)
+    _update_data_sheet_ingestion_timestamp(tx, adm["metaData"]["uuid"])
+    write_fingerprints(tx, scope, fingerprints)
+    return _summed_counters(results)
+
+
+def _ingest_data_sheet_incremental(neo4j_conn, adm, plant_id, dry_run=False):
+    """Diff a data sheet against its last ingestion and write only the changes.
+
+    Returns the diff summary; with `dry_run` nothing is written. An unchanged
+    data sheet costs the single fingerprint query.
+    """
+    scope = f"data-sheet::{plant_id}::{adm['metaData']['uuid']}"
+    rows = _data_sheet_rows(adm, plant_id)
+    fingerprints = {key: fingerprint(row) for key, row in rows.items()}
+    neo4j_conn.execute_write(ensure_manifest_constraint, neo4j_conn.database_name)
+    previous = neo4j_conn.execute_write(read_fingerprints, scope)
+    diff = GraphDiff.compute(previous, fingerprints)
+    summary = diff.summary(dry_run)
+    if dry_run or not diff.changed:
+        return summary
+    summary.update(
+        neo4j_conn.execute_write(
+            _ingest_data_sheet_diff, adm, plant_id, rows, diff, scope, fingerprints
+        )
+    )
+    return summary
+
+
+def _ingest_data_sheet_per_item(neo4j_conn, adm, plant_id):
+    """Ingest a data sheet with one transaction per entity type."""
     equipments = adm.get("equipments")
     nozzles = adm.get("nozzles")
     sub_parts = adm.get("subparts")
     equipmentTag = adm["metaData"]["equipmentTag"]
     dataSheetUuid = adm["metaData"]["uuid"]
-    logger.info(f"Ingesting DATA_SHEET node: {equipmentTag}")
     logger.info("Ingesting metadata...")
     neo4j_conn.execute_write(_ingest_data_sheet_node, adm["metaData"], plant_id)
 
@@ -430,7 +977,6 @@ async def ingest_data_sheet(adm, database_name, plant_id):
                 "plantId": plant_id,
                 "label": node,
             }
-            # neo4j_conn.execute_write(_ingest_nodes, node_data)
             neo4j_conn.execute_write(
                 _ingest_nodes,
                 node_data,
@@ -438,4 +984,36 @@ async def ingest_data_sheet(adm, database_name, plant_id):
 
     logger.info("Finishing Ingestion of Data Sheet...")
     neo4j_conn.execute_write(_update_data_sheet_ingestion_timestamp, dataSheetUuid)
+
+
+async def ingest_data_sheet(
+    adm, database_name, plant_id, bulk=None, diff=None, dry_run=False
+):
+    """This function ingests data sheet into the database.
+
+    `bulk` defaults to DATA_SHEET_BULK_INGEST; the bulk path writes the whole
+    data sheet in one transaction with set-based statements. `diff` defaults
+    to DATA_SHEET_DIFF_INGEST; the diff path writes only what changed since
+    the last diff ingestion and returns a summary, which `dry_run` computes
+    without writing.
+    """
     logger.info("INIT: ingest_data_sheet")
+    bulk = DATA_SHEET_BULK_INGEST if bulk is None else bulk
+    diff = DATA_SHEET_DIFF_INGEST if diff is None else diff
+    neo4j_conn = Neo4jConnection(database_name)
+    neo4j_conn.connect()
+    logger.info(f"Ingesting DATA_SHEET node: {adm['metaData']['equipmentTag']}")
+    summary = None
+    try:
+        if diff or dry_run:
+            summary = _ingest_data_sheet_incremental(neo4j_conn, adm, plant_id, dry_run)
+            logger.info(f"Diff data sheet ingestion: {summary}")
+        elif bulk:
+            counters = neo4j_conn.execute_write(_ingest_data_sheet_bulk, adm, plant_id)
+            logger.info(f"Bulk data sheet ingestion: {counters}")
+        else:
+            _ingest_data_sheet_per_item(neo4j_conn, adm, plant_id)
+    finally:
+        neo4j_conn.close()
+    logger.info("DONE: ingest_data_sheet")
+    return summary
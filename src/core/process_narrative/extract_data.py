@@ -1,6 +1,7 @@
 """This script extracts data from the PDF file using OpenAI."""
 
 import json
+import os
 import asyncio
 # from concurrent.futures import ThreadPoolExecutor
 import jsonschema
@@ -18,6 +19,7 @@ from src.process_narrative.postprocessing.postprocessing import (
     process_narrative_post_processing,
 )
 from src.utils.llm_models.get_llm import get_llm_model
+from src.utils.llm_models.response_cache import cached_chain_call
 from src.process_narrative.postprocessing.post_process_data_and_save_to_s3 import (
     post_process_data_and_save_to_storage,
 )
@@ -28,20 +30,20 @@ from src.utils.storage_utils import (
 
 load_dotenv()
 
+PROCESS_NARRATIVE_LLM_CONCURRENCY = int(
+    os.getenv("PROCESS_NARRATIVE_LLM_CONCURRENCY", "4")
+)
 
-def _chunks(data, n):
-    """
-    Generates chunks of size `n` from the given `data`.
 
-    Parameters:
-        data (iterable): The iterable from which chunks are generated.
-        n (int): The size of each chunk.
+def _parse_response(text):
+    """Parse a paragraph's JSON answer, fenced or not."""
+    return json.loads(text.replace("```json", "").replace("```", ""))
 
-    Yields:
-        iterable: An iterable containing `n` elements from the `data` iterable.
-    """
-    for i in range(0, len(data), n):
-        yield data[i : i + n]
+
+def _is_json_output(text):
+    """Whether a response parses with `_parse_response`; only those are cached."""
+    _parse_response(text)
+    return True
 
 
 def _get_prompt_template_name_and_response(
@@ -87,13 +89,16 @@ def _get_prompt_template_name_and_response(
     )
     name_chain = LLMChain(llm=llm, prompt=prompt_template_name)
     with get_openai_callback() as cb_response:
-        response = name_chain(
+        response = cached_chain_call(
+            name_chain,
             {
                 "asset_json_string": json.dumps(assets_list_wo_narrative, indent=2),
                 "assets_json_string": asset,
                 "source_destination_connection_json": source_destination_connection_json,
                 "narrative_id": index + 1,
-            }
+            },
+            "process_narrative",
+            validate=_is_json_output,
         )
     return prompt_template_name, cb_response, response
 
@@ -104,18 +109,19 @@ async def _extract_asset_data_by_prompt(
     """
     Extracts asset data by prompt.
 
+    The LLM chain is synchronous, so it runs on a worker thread to let
+    several paragraphs be in flight at once.
+
     Args:
         prompt_text (str): The prompt text.
         llm (LLM): The language model.
         assets_list_wo_narrative (list): The list of assets without narrative.
         index (int): The index.
         asset (dict): The asset.
-        bucket_name (str): The name of the bucket.
-        extracted_json_file_key (str): The key of the extracted JSON file.
         pid_source_destination_connection_data (dict): The data for source-destination connections.
 
     Returns:
-        dict: The extracted asset data.
+        list: The assets extracted from the paragraph.
     """
     (
         prompt_text,
@@ -123,12 +129,11 @@ async def _extract_asset_data_by_prompt(
         assets_list_wo_narrative,
         index,
         asset,
-        bucket_name,
-        extracted_json_file_key,
         pid_source_destination_connection_data,
     ) = extract_asset_data_by_prompt_args
     logger.info("INIT: Extract_Asset_Data_By_Prompt function initialized")
-    _, cb_response, response = _get_prompt_template_name_and_response(
+    _, cb_response, response = await asyncio.to_thread(
+        _get_prompt_template_name_and_response,
         (
             prompt_text,
             llm,
@@ -136,23 +141,12 @@ async def _extract_asset_data_by_prompt(
             asset,
             index,
             pid_source_destination_connection_data,
-        )
+        ),
     )
     prompt_logger.info(
         f"The number of tokens that our prompt is using is... \n {cb_response}"
     )
-    result_string = response["text"].replace("```json", "").replace("```", "")
-    result_object = json.loads(result_string)
-    try:
-        existing_data = await fetch_file_via_adapter(bucket_name, extracted_json_file_key)
-    except CloudAdapterException:
-        existing_data = []
-    merged_data = existing_data + result_object
-    await upload_file_to_storage(
-        bucket_name,
-        extracted_json_file_key,
-        json.dumps(merged_data),
-    )
+    result_object = _parse_response(response["text"])
     logger.info("DONE: Extract_Asset_Data_By_Prompt function completed")
     return result_object
 
@@ -243,18 +237,24 @@ async def _get_connection_data(
     )
 
 
-async def _generate_connection_id(bucket_name, extracted_json_file_key):
+async def _generate_connection_id(
+    bucket_name, extracted_json_file_key, extracted_data=None
+):
     """
     Generates connection IDs for assets in a bucket/container.
+
+    When `extracted_data` is given it is numbered and written directly instead
+    of being downloaded first.
     """
     logger.info("INIT: Generate Connection IDs function initialized")
-    try:
-        extracted_data = await fetch_file_via_adapter(
-            bucket_name,
-            extracted_json_file_key
-        )
-    except CloudAdapterException:
-        extracted_data = []
+    if extracted_data is None:
+        try:
+            extracted_data = await fetch_file_via_adapter(
+                bucket_name,
+                extracted_json_file_key
+            )
+        except CloudAdapterException:
+            extracted_data = []
 
     connection_counter = 1
     for asset in extracted_data:
@@ -288,14 +288,12 @@ async def _process_asset(
         prompt_text (str): The prompt text.
         llm (LLM): The language model.
         assets_list_wo_narrative (list): The list of assets without narrative.
-        results (list): The list to store the result objects.
-        bucket_name (str): The name of the S3 bucket.
-        extracted_json_file_key (str): The key of the extracted JSON file in the S3 bucket.
+        semaphore (asyncio.Semaphore): Bounds the number of concurrent LLM calls.
         pid_source_destination_connection_data (dict):
         The dictionary containing source-destination connection data.
 
     Returns:
-        dict: The result object.
+        list: The result object.
     """
     (
         index,
@@ -304,25 +302,21 @@ async def _process_asset(
         prompt_text,
         llm,
         assets_list_wo_narrative,
-        results,
-        bucket_name,
-        extracted_json_file_key,
+        semaphore,
         pid_source_destination_connection_data,
     ) = process_asset_args
-    logger.info(f"INIT:Processing paragraph ({index + 1}/{number_of_paragraphs})")
-    result_object = await _extract_asset_data_by_prompt(
-        (
-            prompt_text,
-            llm,
-            assets_list_wo_narrative,
-            index,
-            asset,
-            bucket_name,
-            extracted_json_file_key,
-            pid_source_destination_connection_data,
+    async with semaphore:
+        logger.info(f"INIT:Processing paragraph ({index + 1}/{number_of_paragraphs})")
+        result_object = await _extract_asset_data_by_prompt(
+            (
+                prompt_text,
+                llm,
+                assets_list_wo_narrative,
+                index,
+                asset,
+                pid_source_destination_connection_data,
+            )
         )
-    )
-    results.append(result_object)
     logger.info(f"DONE: Processing paragraph ({index + 1}/{number_of_paragraphs})")
     return result_object
 
@@ -405,36 +399,33 @@ async def extract_data(
     number_of_paragraphs = len(asset_list)
     prompt_text = PID_PROMPT
     llm = get_llm_model(model_name=model_name)
-    results = []
-    empty_string = []
-    await upload_file_to_storage(
-        bucket_name,
-        extracted_json_file_key,
-        json.dumps(empty_string),
-    )
-
-    for asset_chunk in _chunks(list(enumerate(asset_list)), 4):
-        tasks = []
-        for item in asset_chunk:
-            # Create the tuple of arguments
-            args_tuple = (
-                item[0],
-                item[1],
-                number_of_paragraphs,
-                prompt_text,
-                llm,
-                assets_list_wo_narrative,
-                results,
-                bucket_name,
-                extracted_json_file_key,
-                pid_source_destination_connection_data,
+    semaphore = asyncio.Semaphore(PROCESS_NARRATIVE_LLM_CONCURRENCY)
+
+    # gather keeps paragraph order, so connection numbering stays deterministic.
+    paragraph_results = await asyncio.gather(
+        *(
+            _process_asset(
+                (
+                    index,
+                    asset,
+                    number_of_paragraphs,
+                    prompt_text,
+                    llm,
+                    assets_list_wo_narrative,
+                    semaphore,
+                    pid_source_destination_connection_data,
+                )
             )
-            tasks.append(_process_asset(args_tuple))
-
-        chunk_results = await asyncio.gather(*tasks)
-        results.extend(chunk_results)
+            for index, asset in enumerate(asset_list)
+        )
+    )
+    extracted_data = [
+        asset for result_object in paragraph_results for asset in result_object
+    ]
     await _generate_connection_id(
-        bucket_name=bucket_name, extracted_json_file_key=extracted_json_file_key
+        bucket_name=bucket_name,
+        extracted_json_file_key=extracted_json_file_key,
+        extracted_data=extracted_data,
     )
     await post_process_data_and_save_to_storage(
         bucket_name=bucket_name, extracted_json_file_key=extracted_json_file_key
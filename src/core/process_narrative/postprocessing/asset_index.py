@@ -0,0 +1,99 @@
+"""In-memory lookups over the expected-asset CSV used by postprocessing."""
+
+from src.utils.log import logger
+from src.utils.s3_download_upload import read_csv_from_storage
+
+
+def _normalise(name):
+    """Normalise an asset name the way the fuzzy matcher compares names."""
+    return str(name).lower()
+
+
+class AssetIndex:
+    """Expected assets indexed by id, name, tag and normalised name.
+
+    Built once per postprocessing run so per-connection lookups are dict
+    reads instead of CSV downloads. Where several rows share a key the first
+    row wins, matching the previous DataFrame lookups.
+
+    Nothing builds an index yet: ``process_narrative_post_processing`` does
+    not run the sensor, source/destination or connection postprocessing, and
+    its arguments carry no expected-asset CSV path. Whoever wires those steps
+    back in should call ``from_storage`` once there and pass the index down.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self.records = df.to_dict(orient="records")
+        self.names = [record["asset_name"] for record in self.records]
+        self._by_id = {}
+        self._by_name = {}
+        self._by_tag = {}
+        self._by_normalised_name = {}
+        for record in self.records:
+            self._by_id.setdefault(record["id"], record)
+            self._by_name.setdefault(record["asset_name"], record)
+            if "asset_tag" in record:
+                self._by_tag.setdefault(record["asset_tag"], record)
+            self._by_normalised_name.setdefault(
+                _normalise(record["asset_name"]), record["asset_name"]
+            )
+        self._normalised_names = [_normalise(name) for name in self.names]
+
+    @classmethod
+    async def from_storage(cls, bucket_name, expected_asset_csv_s3):
+        """Download the expected-asset CSV once and index it."""
+        logger.info(f"INIT: building asset index from {expected_asset_csv_s3}")
+        df = await read_csv_from_storage(bucket=bucket_name, path=expected_asset_csv_s3)
+        index = cls(df)
+        logger.info(f"DONE: asset index built with {len(index.records)} assets")
+        return index
+
+    def column(self, column_name):
+        """Return a CSV column as a list, in file order."""
+        return self.df[column_name].tolist()
+
+    def get_by_id(self, asset_id):
+        """Return the asset row for a numeric id or an "asset_<id>" string."""
+        if isinstance(asset_id, str):
+            try:
+                asset_id = int(asset_id.split("_")[1])
+            except IndexError:
+                return None
+        return self._by_id.get(asset_id)
+
+    def get_by_name(self, asset_name):
+        """Return the asset row with exactly this name."""
+        return self._by_name.get(asset_name)
+
+    def get_by_tag(self, asset_tag):
+        """Return the asset row with exactly this tag."""
+        return self._by_tag.get(asset_tag)
+
+    def has_name(self, asset_name):
+        """Return whether an asset with exactly this name exists."""
+        return asset_name in self._by_name
+
+    def asset_id_for_name(self, asset_name):
+        """Return the "asset_<id>" identifier of the named asset."""
+        return "asset_" + str(self._by_name[asset_name]["id"])
+
+    def best_match(self, name, threshold, scorer):
+        """Return the asset name scoring highest against `name` (>= threshold).
+
+        An exact normalised match short-circuits the scan; otherwise every
+        name is scored with `scorer(asset_name, name)` on normalised strings
+        and the first best-scoring name wins.
+        """
+        normalised = _normalise(name)
+        exact = self._by_normalised_name.get(normalised)
+        if exact is not None:
+            return exact
+        best_match = None
+        best_similarity = 0
+        for asset_name, normalised_name in zip(self.names, self._normalised_names):
+            similarity = scorer(normalised_name, normalised)
+            if similarity >= threshold and similarity > best_similarity:
+                best_similarity = similarity
+                best_match = asset_name
+        return best_match
@@ -55,43 +55,37 @@ def extract_unique_values_sensor_property(paragraph, sensor_property):
 
 
 async def extract_value_assets(
-    expected_asset_csv_s3, bucket_name, sensor_property, narrative_csv_path
+    asset_index, bucket_name, sensor_property, narrative_csv_path
 ):
     """Extract sensor property value from narrative for all assets."""
     logger.info(f"INIT: extract {sensor_property} value from narrative for all assets.")
-    expected_values = {}
-    df = await read_csv_from_storage(bucket=bucket_name, path=expected_asset_csv_s3)
     narrative = await read_csv_from_storage(bucket=bucket_name, path=narrative_csv_path)
     narrative_string = narrative.to_csv(index=False)
-    for _, row in df.iterrows():
-        asset_name = row["asset_name"]
-        narrative = narrative_string
-        unique_values = extract_unique_values_sensor_property(
-            narrative, sensor_property
-        )
-        expected_values[asset_name] = unique_values
+    # Every asset is checked against the whole narrative, so the values are shared.
+    unique_values = extract_unique_values_sensor_property(
+        narrative_string, sensor_property
+    )
+    expected_values = {asset_name: unique_values for asset_name in asset_index.names}
     logger.info(
         f"DONE: extracted {sensor_property} value from narrative for all assets."
     )
     return expected_values
 
 
-def validate_and_update_sensor_property_value(
+async def validate_and_update_sensor_property_value(
     updated_received_assets_connections,
     sensor_property,
     bucket_name,
-    expected_asset_csv_s3,
+    asset_index,
     narrative_csv_path,
 ):
     """Validate and update sensor property value."""
     logger.info(f"Validating and updating {sensor_property} values")
-    expected_values = extract_value_assets(
-        expected_asset_csv_s3, bucket_name, sensor_property, narrative_csv_path
+    expected_values = await extract_value_assets(
+        asset_index, bucket_name, sensor_property, narrative_csv_path
     )
     for received_asset in updated_received_assets_connections:
-        asset_name = ut.get_asset_name_from_id(
-            received_asset, bucket_name, expected_asset_csv_s3
-        )
+        asset_name = ut.get_asset_name_from_id(received_asset, asset_index)
         expected_val = expected_values.get(asset_name, {})
         value = received_asset[sensor_property]["value"]
         if (value not in expected_val) and (value is not None):
@@ -5,34 +5,26 @@ import src.process_narrative.postprocessing.utils as ut
 
 
 def rename_attribute_with_best_match(
-    received_assets_connections, asset_name_list, attribute_type
+    received_assets_connections, asset_index, attribute_type
 ):
     """Rename attribute with best match."""
     logger.info("INIT: rename attribute_with_best_match")
     for connection in received_assets_connections:
-        expected_attribute_val_name = connection.get(attribute_type, "").lower()
-        best_match = None
-        best_similarity = 0
-        for asset_name in asset_name_list:
-            similarity = fuzz.ratio(asset_name.lower(), expected_attribute_val_name)
-            if similarity >= 90:
-                if similarity > best_similarity:
-                    best_similarity = similarity
-                    best_match = asset_name
+        best_match = asset_index.best_match(
+            connection.get(attribute_type, ""), 90, fuzz.ratio
+        )
         if best_match is not None:
             connection[attribute_type] = best_match
     logger.info("DONE: renamed attribute_with_best_match")
 
 
 def filter_source_destination_name_property(
-    received_assets_connections, attribute_type, bucket_name, expected_asset_csv_s3
+    received_assets_connections, attribute_type, asset_index
 ):
     """Filter source and destination name property."""
     logger.info(f"INIT: filter {attribute_type}")
     for connection in received_assets_connections:
-        asset_name = ut.get_asset_name_from_id(
-            connection, bucket_name, expected_asset_csv_s3
-        )
+        asset_name = ut.get_asset_name_from_id(connection, asset_index)
         connection_type = connection["connection_type"]
         if (connection_type == "IN_LET") and (
             attribute_type == "destination_asset_name"
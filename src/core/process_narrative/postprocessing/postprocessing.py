@@ -4,7 +4,6 @@ from src.utils.log import logger
 import src.process_narrative.postprocessing.postprocess_sensor_property as sp
 import src.process_narrative.postprocessing.postprocess_source_name_destination_name as sdn
 import src.process_narrative.postprocessing.postprocess_connection as connection
-import src.process_narrative.postprocessing.utils as ut
 from src.utils.s3_download_upload import save_json_to_storage
 from src.utils.storage_utils import (
     fetch_file_via_adapter
@@ -25,33 +24,33 @@ async def _load_config_and_necessary_variables(
     return existing_data, pnid_connections_json
 
 
-def post_process_sensor_property(
-    received_assets_connections, bucket_name, expected_asset_csv_s3, narrative_csv_path
+async def post_process_sensor_property(
+    received_assets_connections, bucket_name, asset_index, narrative_csv_path
 ):
     """Post process sensor property."""
     logger.info("INIT: post process sensor(temperature, pressure, flow_rate) property")
     updated_received_assets_connections = sp.add_verification(
         received_assets_connections
     )
-    sp.validate_and_update_sensor_property_value(
+    await sp.validate_and_update_sensor_property_value(
         updated_received_assets_connections,
         "pressure",
         bucket_name,
-        expected_asset_csv_s3,
+        asset_index,
         narrative_csv_path,
     )
-    sp.validate_and_update_sensor_property_value(
+    await sp.validate_and_update_sensor_property_value(
         updated_received_assets_connections,
         "temperature",
         bucket_name,
-        expected_asset_csv_s3,
+        asset_index,
         narrative_csv_path,
     )
-    sp.validate_and_update_sensor_property_value(
+    await sp.validate_and_update_sensor_property_value(
         updated_received_assets_connections,
         "flow_rate",
         bucket_name,
-        expected_asset_csv_s3,
+        asset_index,
         narrative_csv_path,
     )
     sp.filter_unverified_connections(updated_received_assets_connections)
@@ -63,46 +62,39 @@ def post_process_sensor_property(
 
 
 def post_process_source_name_and_destination_name_property(
-    updated_received_assets_connections, bucket_name, expected_asset_csv_s3
+    updated_received_assets_connections, asset_index
 ):
     """Post process source name and destination name property."""
     logger.info("INIT: post process source_name_and_destination_name_property")
-    asset_name_list = ut.read_asset_names_from_csv(
-        bucket_name, expected_asset_csv_s3, "asset_name"
-    )
     sdn.rename_attribute_with_best_match(
-        updated_received_assets_connections, asset_name_list, "source_asset_name"
+        updated_received_assets_connections, asset_index, "source_asset_name"
     )
     sdn.rename_attribute_with_best_match(
-        updated_received_assets_connections, asset_name_list, "destination_asset_name"
+        updated_received_assets_connections, asset_index, "destination_asset_name"
     )
     sdn.filter_source_destination_name_property(
         updated_received_assets_connections,
         "source_asset_name",
-        bucket_name,
-        expected_asset_csv_s3,
+        asset_index,
     )
     sdn.filter_source_destination_name_property(
         updated_received_assets_connections,
         "destination_asset_name",
-        bucket_name,
-        expected_asset_csv_s3,
+        asset_index,
     )
     logger.info("Done: post processing of source name and destination name property")
 
 
 async def postprocess_connection(
     received_assets_connections,
-    bucket_name,
-    expected_asset_csv_s3,
+    asset_index,
     pnid_connections_json,
 ):
     """Postprocess connection."""
     logger.info("INIT: postprocess connections")
     await connection.synchronize_and_replicate_connections(
         received_assets_connections,
-        bucket_name,
-        expected_asset_csv_s3,
+        asset_index,
         pnid_connections_json,
     )
     logger.info("DONE: postprocess connections")
@@ -2,34 +2,23 @@
 
 import os
 from src.utils.log import logger
-from src.utils.s3_download_upload import read_csv_from_storage
 
 ROOT_FOLDER_PATH = os.path.abspath("")
 
 
-def get_asset_name_from_id(connection, bucket_name, expected_asset_csv):
+def get_asset_name_from_id(connection, asset_index):
     """Get asset name from asset id."""
-    logger.info("INIT: get_asset_name_from_id")
-    df = read_csv_from_storage(bucket=bucket_name, path=expected_asset_csv)
     asset_id = connection["asset_id"]
-    logger.info(f"asset_id: {asset_id}")
-    try:
-        asset_id = int(asset_id.split("_")[1])
-        logger.info(f"asset_id: {asset_id}")
-        row = df[df["id"] == asset_id]
-        logger.info(f"row: {row}")
-        asset_name = row.iloc[0]["asset_name"]
-        logger.info(f"asset_name: {asset_name}")
-        return asset_name
-    except IndexError:
-        logger.error("Invalid asset_id format.")
+    asset = asset_index.get_by_id(asset_id)
+    if asset is None:
+        logger.error(f"Invalid asset_id format: {asset_id}")
         return None
+    return asset["asset_name"]
 
 
-def read_asset_names_from_csv(bucket_name, expected_asset_csv, column_name):
+def read_asset_names_from_csv(asset_index, column_name):
     """Read asset names from csv."""
     logger.info("INIT: read_asset_names_from_csv")
-    df = read_csv_from_storage(bucket=bucket_name, path=expected_asset_csv)
-    asset_names_list = df[column_name].tolist()
+    asset_names_list = asset_index.column(column_name)
     logger.info("DONE: the asset_names list is created")
     return asset_names_list
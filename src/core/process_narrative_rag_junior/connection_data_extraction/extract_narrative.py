@@ -1,6 +1,8 @@
 """Extract narrative data from pdf file."""
 
+import os
 import json
+import asyncio
 from dotenv import load_dotenv
 from src.utils.log import logger
 
@@ -21,9 +23,7 @@ from src.utils.storage_utils import (
 from src.process_narrative_rag_junior.connection_data_extraction import (
     generate_process_narrative_adm,
 )
-from src.utils.get_junior_response import (
-    get_document_data_from_junior_app_runner,
-)
+from src.utils.get_junior_response import junior_client
 
 from src.prompts.prompt import PROCESS_NARRATIVE_PROMPT_RAG_JUNIOR_PATH
 
@@ -31,8 +31,10 @@ get_process_narrative_adm = generate_process_narrative_adm.get_process_narrative
 
 load_dotenv()
 
+JUNIOR_STRUCTURING_CONCURRENCY = int(os.getenv("JUNIOR_STRUCTURING_CONCURRENCY", "4"))
+
 
-def _extracted_junior_data_for_a_query(model_name, connection, document_id):
+async def _extracted_junior_data_for_a_query(model_name, connection, document_id):
     """Extract narrative data using Junior API"""
     logger.info("Init: Extracting narrative data using Junior API")
     sources_asset_name = connection.get("source_asset_name")
@@ -45,7 +47,7 @@ def _extracted_junior_data_for_a_query(model_name, connection, document_id):
     #     f"what is the flowrate, temperature and pressure of the flow between "
     #     f"{sources_asset_name} and {destination_asset_name}?"
     # )
-    junior_extracted_output = get_document_data_from_junior_app_runner(
+    junior_extracted_output = await junior_client.ask(
         model_name, api_input, [], document_id
     )
     if junior_extracted_output.status_code == 200:
@@ -85,35 +87,56 @@ def _extracted_structured_data_for_a_query(model_name, connection, junior_paragr
     return llm_extracted_output
 
 
-def _get_extracted_data_for_all_query(
+async def _extract_data_for_a_query(
+    model_name, connection, document_id, structuring_semaphore
+):
+    """Ask Junior about one connection and structure its answer as soon as it arrives."""
+    junior_output = await _extracted_junior_data_for_a_query(
+        model_name, connection, document_id
+    )
+    if not junior_output:
+        return None
+    async with structuring_semaphore:
+        query_extract_data = await asyncio.to_thread(
+            _extracted_structured_data_for_a_query,
+            model_name,
+            connection,
+            junior_output,
+        )
+    logger.info(f"Extracted data: {query_extract_data}")
+    return query_extract_data
+
+
+async def _get_extracted_data_for_all_query(
     document_id, model_name, pid_source_destination_connection_data
 ):
     """Extract Extraction of stream conditions of all
-    the queries(connections) in process narrative data.."""
+    the queries(connections) in process narrative data..
+
+    Junior requests run concurrently (bounded by the Junior client) and each
+    answer goes straight to the structuring stage, so the two stages overlap.
+    Results are collected in connection order.
+    """
     logger.info(
         "Init: Extracting stream conditions of all the queries in process narrative data."
     )
-    output = []
-    # junior_data = []
-    for connection in pid_source_destination_connection_data:
-        junior_output = _extracted_junior_data_for_a_query(
-            model_name, connection, document_id
-        )
-        if junior_output:
-            query_extract_data = _extracted_structured_data_for_a_query(
-                model_name, connection, junior_output
+    structuring_semaphore = asyncio.Semaphore(JUNIOR_STRUCTURING_CONCURRENCY)
+    query_results = await asyncio.gather(
+        *(
+            _extract_data_for_a_query(
+                model_name, connection, document_id, structuring_semaphore
             )
-            logger.info(f"Extracted data: {query_extract_data}")
-            # junior_data.append(junior_output)
+            for connection in pid_source_destination_connection_data
+        )
+    )
+    output = []
+    for query_extract_data in query_results:
+        if query_extract_data:
             output.extend(query_extract_data)
     logger.info(
         "Done: Extraction of stream conditions of all "
         "the queries(connections) in process narrative data."
     )
-    # save_json_local(
-    #     "data/local/mafpp/process_narrative/test_output/7_nov/2.junior_data.txt",
-    #     junior_data,
-    # )
     return output
 
 
@@ -165,7 +188,7 @@ async def get_data(
         "connections": [],
     }
 
-    connection_data = _get_extracted_data_for_all_query(
+    connection_data = await _get_extracted_data_for_all_query(
         document_id, model_name, pid_source_destination_connection_data
     )
     if connection_data:
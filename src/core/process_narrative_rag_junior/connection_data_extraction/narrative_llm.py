@@ -7,6 +7,7 @@ import re
 from langchain.prompts import PromptTemplate
 from langchain.chains import LLMChain
 from src.utils.llm_models.get_llm import get_llm_model
+from src.utils.llm_models.response_cache import cached_chain_call, is_json_response
 from src.utils.log import logger
 
 
@@ -48,7 +49,9 @@ def llm_extraction(model_name, narrative_text_string, query, prompt_template):
         "narrative_text_string": narrative_text_string,
         "query": query,
     }
-    response = name_chain(inputs=inputs)
+    response = cached_chain_call(
+        name_chain, inputs, "pn_connections_rag_junior", validate=is_json_response
+    )
     result_string = response["text"].replace("```json", "").replace("`", "")
     # print(result_string)
     result_object = extract_json_from_text(result_string)
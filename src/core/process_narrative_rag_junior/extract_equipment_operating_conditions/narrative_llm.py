@@ -8,6 +8,7 @@ from langchain.prompts import PromptTemplate
 from langchain.chains import LLMChain
 from src.utils.log import logger
 from src.utils.llm_models.get_llm import get_llm_model
+from src.utils.llm_models.response_cache import cached_chain_call, is_json_response
 
 
 def get_prompt(prompt_path):
@@ -48,7 +49,12 @@ def llm_extraction(model_name, narrative_text_string, query, prompt_template):
         "narrative_text_string": narrative_text_string,
         "query": query,
     }
-    response = name_chain(inputs=inputs)
+    response = cached_chain_call(
+        name_chain,
+        inputs,
+        "pn_equipment_operating_conditions",
+        validate=is_json_response,
+    )
     result_string = response["text"].replace("```json", "").replace("`", "")
     # print(result_string)
     result_object = extract_json_from_text(result_string)
@@ -7,6 +7,7 @@ from langchain.chains import LLMChain
 from src.utils.log import logger
 from src.utils.json_utils import extract_json_from_text
 from src.utils.llm_models.get_llm import get_llm_model
+from src.utils.llm_models.response_cache import cached_chain_call, is_json_response
 
 
 def get_prompt(prompt_path):
@@ -29,7 +30,10 @@ def llm_extraction(model_name, narrative_text_string, query, prompt_template):
         "narrative_text_string": narrative_text_string,
         "query": query,
     }
-    response = name_chain(inputs=inputs)
+    # Free-text answer passed on to the wrapper prompt; only an empty one is invalid.
+    response = cached_chain_call(
+        name_chain, inputs, "pn_stream_conditions", validate=str.strip
+    )
     result_string = response["text"]
     logger.info("Done: Extracting narrative data.")
     return result_string
@@ -44,7 +48,9 @@ def llm_wrapper(model_name, llm_extracted_stream_conditions_output, prompt_templ
     )
     name_chain = LLMChain(llm=llm, prompt=prompt)
     inputs = {"narrative_text_string": llm_extracted_stream_conditions_output}
-    response = name_chain(inputs=inputs)
+    response = cached_chain_call(
+        name_chain, inputs, "pn_stream_conditions_wrapper", validate=is_json_response
+    )
     result_string = response["text"].replace("```json", "").replace("`", "")
     result_object = extract_json_from_text(result_string)
     logger.info("Done: Extracting narrative data.")
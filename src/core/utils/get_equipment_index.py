@@ -3,7 +3,9 @@
 import os
 import requests
 import pandas as pd
+from src.data_sheets.standard_property_registry import standard_registry
 from src.utils.log import logger
+from src.utils.connection_index import ConnectionKeySet, EQUIPMENT_KEY
 from src.utils.s3_download_upload import save_df_to_storage
 from src.utils.token import get_token
 
@@ -127,16 +129,12 @@ def is_stand_by(entry):
     return True
 
 
-def is_duplicate(entry_list, new_entry):
-    """Check if the given entry is a duplicate entry"""
-    for entry in entry_list:
-        if (
-            entry["asset_name"] == new_entry["asset_name"]
-            and entry["asset_tag"] == new_entry["asset_tag"]
-            and entry["asset_class"] == new_entry["asset_class"]
-        ):
-            return True
-    return False
+def is_duplicate(entry_keys, new_entry):
+    """Check if the given entry is a duplicate entry
+
+    `entry_keys` is a ConnectionKeySet over EQUIPMENT_KEY.
+    """
+    return new_entry in entry_keys
 
 
 async def save_process_equipment_index(bucket_name, plant_id, asset_list_path):
@@ -152,6 +150,7 @@ async def save_process_equipment_index(bucket_name, plant_id, asset_list_path):
         raise ValueError("Equipment index data is either unavailable or empty")
     logger.info("Processing equipment index data...")
     equipment_data = []
+    equipment_keys = ConnectionKeySet(EQUIPMENT_KEY)
     for entry in equipment_index_data:
         #     "name": null,
         # "type": "PUMP PROCESS",
@@ -173,10 +172,12 @@ async def save_process_equipment_index(bucket_name, plant_id, asset_list_path):
         except KeyError as e:
             raise KeyError(f"The key {e} is missing from the entry dictionary.") from e
 
-        if not is_stand_by(entry) and not is_duplicate(equipment_data, new_entry):
+        if not is_stand_by(entry) and not is_duplicate(equipment_keys, new_entry):
+            equipment_keys.add(new_entry)
             equipment_data.append(new_entry)
 
     df = pd.DataFrame(equipment_data)
     await save_df_to_storage(bucket_name, asset_list_path, df)
+    standard_registry.invalidate_asset_table(bucket_name, asset_list_path)
 
     logger.info(f"Extracted data has been saved to {asset_list_path}")
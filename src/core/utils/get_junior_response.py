@@ -2,17 +2,21 @@
 
 import os
 import json
+import asyncio
+import httpx
 import requests
 from src.utils.log import logger
 from src.utils.token import get_token
 
+JUNIOR_TIMEOUT = float(os.getenv("JUNIOR_TIMEOUT", "60"))
+JUNIOR_CONCURRENCY = int(os.getenv("JUNIOR_CONCURRENCY", "8"))
+JUNIOR_MAX_RETRIES = int(os.getenv("JUNIOR_MAX_RETRIES", "3"))
+JUNIOR_BACKOFF_SECONDS = float(os.getenv("JUNIOR_BACKOFF_SECONDS", "1"))
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 
-def get_document_data_from_junior_app_runner(
-    model_name, api_input, chat_history, session_id
-):
-    """Returns the response from the Junior App Runner."""
-    logger.info("Init: Extracting narrative data using Junior API")
-    junior_api_url = os.environ.get("JUNIOR_API_URL", "")
+
+def _junior_request(model_name, api_input, chat_history, session_id):
+    """Build the headers and JSON body of a Junior App Runner request."""
     token = get_token()
     headers = {
         "Content-Type": "application/json",
@@ -30,6 +34,16 @@ def get_document_data_from_junior_app_runner(
             },
         },
     }
+    return headers, body
+
+
+def get_document_data_from_junior_app_runner(
+    model_name, api_input, chat_history, session_id
+):
+    """Returns the response from the Junior App Runner."""
+    logger.info("Init: Extracting narrative data using Junior API")
+    junior_api_url = os.environ.get("JUNIOR_API_URL", "")
+    headers, body = _junior_request(model_name, api_input, chat_history, session_id)
     response = requests.post(
         junior_api_url, headers=headers, data=json.dumps(body), timeout=60
     )
@@ -40,3 +54,81 @@ def get_document_data_from_junior_app_runner(
             f"Error: Extracting data using Junior API {response.status_code}"
         )
     return response
+
+
+class JuniorClient:
+    """Async Junior App Runner client on a pooled, concurrency-limited session.
+
+    Transport errors and 429/5xx responses are retried with exponential
+    backoff; the last response (or error) is returned to the caller.
+    """
+
+    def __init__(
+        self,
+        url=None,
+        concurrency=JUNIOR_CONCURRENCY,
+        max_retries=JUNIOR_MAX_RETRIES,
+        backoff_seconds=JUNIOR_BACKOFF_SECONDS,
+    ):
+        self.url = url
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self._client = None
+        self._client_loop = None
+        self._semaphore = None
+
+    def _http(self):
+        # httpx clients and semaphores are bound to the loop they were created on.
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=JUNIOR_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=self.concurrency,
+                    max_keepalive_connections=self.concurrency,
+                ),
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._client_loop = loop
+        return self._client
+
+    async def ask(self, model_name, api_input, chat_history, session_id):
+        """Send one question; returns the `httpx.Response`."""
+        url = self.url or os.environ.get("JUNIOR_API_URL", "")
+        headers, body = _junior_request(model_name, api_input, chat_history, session_id)
+        client = self._http()
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    response = await client.post(url, headers=headers, json=body)
+                except httpx.TransportError as e:
+                    if attempt == self.max_retries:
+                        raise
+                    logger.warning(f"Junior request failed ({e}); retrying")
+                else:
+                    if (
+                        response.status_code not in RETRYABLE_STATUS_CODES
+                        or attempt == self.max_retries
+                    ):
+                        break
+                    logger.warning(
+                        f"Junior request returned {response.status_code}; retrying"
+                    )
+                await asyncio.sleep(self.backoff_seconds * 2**attempt)
+        if response.status_code == 200:
+            logger.info("Done: Extracting data using Junior API")
+        else:
+            logger.error(
+                f"Error: Extracting data using Junior API {response.status_code}"
+            )
+        return response
+
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+junior_client = JuniorClient()
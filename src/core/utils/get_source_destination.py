@@ -1,6 +1,7 @@
 """This module contains functions for extracting source and destination data."""
 import json
 from src.utils.log import logger
+from src.utils.connection_index import ConnectionKeySet, SOURCE_DESTINATION_KEY
 from src.utils.get_equipment_index import (
     invoke_equipment_index_lambda,
 )
@@ -20,21 +21,13 @@ def is_stand_by(entry):
     return True
 
 
-def is_duplicate(entry, existing_data):
+def is_duplicate(entry, existing_keys):
     """
     Check if the given entry is a duplicate of an existing entry.
+
+    `existing_keys` is a ConnectionKeySet over SOURCE_DESTINATION_KEY.
     """
-    for existing_entry in existing_data:
-        if (
-            entry["source_equipment_tag"] == existing_entry["source_equipment_tag"]
-            and entry["destination_equipment_tag"]
-            == existing_entry["destination_equipment_tag"]
-            and entry["source_asset_name"] == existing_entry["source_asset_name"]
-            and entry["destination_asset_name"]
-            == existing_entry["destination_asset_name"]
-        ):
-            return True
-    return False
+    return entry in existing_keys
 
 
 def load_equipment_connectivity_index(plant_id):
@@ -55,6 +48,7 @@ async def process_equipment_connectivity(
     """
     equipment_connectivity_index_data = load_equipment_connectivity_index(plant_id)
     source_destination_data = []
+    source_destination_keys = ConnectionKeySet(SOURCE_DESTINATION_KEY)
     for entry in equipment_connectivity_index_data:
         try:
             new_entry = {
@@ -68,8 +62,9 @@ async def process_equipment_connectivity(
             raise KeyError(f"The key {e} is missing from the entry dictionary.") from e
 
         if not is_stand_by(entry) and not is_duplicate(
-            new_entry, source_destination_data
+            new_entry, source_destination_keys
         ):
+            source_destination_keys.add(new_entry)
             source_destination_data.append(new_entry)
     await upload_file_to_storage(
         bucket_name,
@@ -0,0 +1,285 @@
+"""Persistent, content-addressed cache for LLM responses.
+
+Responses are keyed by a SHA-256 of the model, the deployment, the call
+site, ``LLM_CACHE_VERSION``, the rendered messages and any image bytes, so
+re-running a document with unchanged inputs is served without calling the
+model. Call sites pass a ``validate`` callback that parses the response the
+way they will use it; only responses it accepts are stored or replayed, so
+malformed output never outlives the call that produced it.
+
+Configuration (environment variables):
+    LLM_CACHE_BACKEND       "none" (default), "sqlite" or "storage"
+    LLM_CACHE_VERSION       mixed into every key; bump it when prompts or
+                            response parsing change to retire old entries
+    LLM_CACHE_PATH          SQLite file for the local backend
+    LLM_CACHE_BUCKET        bucket used by the object-storage backend
+    LLM_CACHE_PREFIX        key prefix used by the object-storage backend
+    LLM_CACHE_TTL_SECONDS   entries older than this are treated as misses
+    LLM_CACHE_MAX_BYTES     size bound of the SQLite backend (LRU eviction)
+    LLM_CACHE_BYPASS        "true" to neither read nor write the cache
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from py_unified_cloud_adapter.utils.errors import CloudAdapterException  # type: ignore
+from src.utils.log import logger
+from src.utils.s3_download_upload import load_into_memory, put_object_in_storage
+
+LLM_CACHE_BACKEND = os.getenv("LLM_CACHE_BACKEND", "none").lower()
+LLM_CACHE_VERSION = os.getenv("LLM_CACHE_VERSION", "1")
+LLM_CACHE_PATH = os.getenv(
+    "LLM_CACHE_PATH", os.path.join(tempfile.gettempdir(), "llm_response_cache.sqlite")
+)
+LLM_CACHE_BUCKET = os.getenv("LLM_CACHE_BUCKET", "")
+LLM_CACHE_PREFIX = os.getenv("LLM_CACHE_PREFIX", "llm_response_cache")
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+LLM_CACHE_BYPASS = os.getenv("LLM_CACHE_BYPASS", "false").lower() == "true"
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def _message_payload(message):
+    """JSON-friendly view of a LangChain message, dict message or string."""
+    if isinstance(message, (str, dict)):
+        return message
+    return {"type": getattr(message, "type", ""), "content": message.content}
+
+
+def make_cache_key(model, deployment, template_version, messages, images=(), **kwargs):
+    """Return the content address of one LLM request."""
+    if not isinstance(messages, (list, tuple)):
+        messages = [messages]
+    digest = hashlib.sha256()
+    header = {
+        "model": model,
+        "deployment": deployment,
+        "template_version": template_version,
+        "cache_version": LLM_CACHE_VERSION,
+        "messages": [_message_payload(message) for message in messages],
+        "kwargs": kwargs,
+    }
+    digest.update(json.dumps(header, sort_keys=True, default=str).encode("utf-8"))
+    for image in images:
+        if isinstance(image, str):
+            image = base64.b64decode(image)
+        digest.update(hashlib.sha256(image).digest())
+    return digest.hexdigest()
+
+
+class SQLiteCacheBackend:
+    """Local SQLite backend with size-based LRU eviction."""
+
+    def __init__(self, path=LLM_CACHE_PATH, max_bytes=LLM_CACHE_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+                "ON responses (accessed_at)"
+            )
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, key):
+        """Return (value, created_at) or None."""
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row:
+                conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+        return row
+
+    def set(self, key, value):
+        """Store a value and evict least recently used rows above max_bytes."""
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value), now, now),
+            )
+            total = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+            while total > self.max_bytes:
+                oldest = conn.execute(
+                    "SELECT key, size FROM responses ORDER BY accessed_at LIMIT 1"
+                ).fetchone()
+                if not oldest or oldest[0] == key:
+                    break
+                conn.execute("DELETE FROM responses WHERE key = ?", (oldest[0],))
+                total -= oldest[1]
+
+
+class StorageCacheBackend:
+    """Object-storage backend; expired objects are overwritten on the next write."""
+
+    def __init__(self, bucket=LLM_CACHE_BUCKET, prefix=LLM_CACHE_PREFIX):
+        self.bucket = bucket
+        self.prefix = prefix
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+
+    def _run(self, coroutine):
+        # LLM call sites are synchronous, so storage I/O runs on a private loop.
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def _path(self, key):
+        return f"{self.prefix}/{key[:2]}/{key}.json"
+
+    def get(self, key):
+        """Return (value, created_at) or None."""
+        try:
+            data = self._run(load_into_memory(self.bucket, self._path(key)))
+        except (CloudAdapterException, FileNotFoundError):
+            return None
+        if not data:
+            return None
+        entry = json.loads(data)
+        return entry["value"], entry["created_at"]
+
+    def set(self, key, value):
+        """Store a value."""
+        entry = json.dumps({"value": value, "created_at": time.time()})
+        self._run(put_object_in_storage(self.bucket, self._path(key), entry))
+
+
+class LLMResponseCache:
+    """TTL-aware front for a cache backend that tolerates backend failures."""
+
+    def __init__(
+        self, backend, ttl_seconds=LLM_CACHE_TTL_SECONDS, bypass=LLM_CACHE_BYPASS
+    ):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.bypass = bypass or backend is None
+        self.stats = {"hits": 0, "misses": 0}
+
+    def get(self, key):
+        """Return the cached text for `key`, or None."""
+        if self.bypass:
+            return None
+        try:
+            row = self.backend.get(key)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(f"LLM cache read failed: {e}")
+            return None
+        if row and time.time() - row[1] <= self.ttl_seconds:
+            self.stats["hits"] += 1
+            return row[0]
+        self.stats["misses"] += 1
+        return None
+
+    def set(self, key, value):
+        """Store the response text for `key`."""
+        if self.bypass or value is None:
+            return
+        try:
+            self.backend.set(key, value)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(f"LLM cache write failed: {e}")
+
+
+def get_response_cache():
+    """Return the process-wide response cache built from the environment."""
+    global _cache  # pylint: disable=global-statement
+    with _cache_lock:
+        if _cache is None:
+            if LLM_CACHE_BACKEND == "storage":
+                backend = StorageCacheBackend()
+            elif LLM_CACHE_BACKEND == "sqlite":
+                backend = SQLiteCacheBackend()
+            else:
+                backend = None
+            _cache = LLMResponseCache(backend)
+        return _cache
+
+
+def _is_valid(validate, content):
+    """Whether `content` may be cached; a raising validator rejects it."""
+    if validate is None:
+        return True
+    try:
+        return bool(validate(content))
+    except Exception:  # pylint: disable=broad-exception-caught
+        return False
+
+
+def is_json_response(text):
+    """Validator for prompts answering with one JSON object or list, fenced or not."""
+    text = text.replace("```json", "").replace("`", "")
+    match = re.search(r"[\[{].*[\]}]", text, re.DOTALL)
+    if not match:
+        return False
+    json.loads(match.group(0))
+    return True
+
+
+def _llm_identity(llm):
+    model = getattr(llm, "model_name", None) or getattr(llm, "model", None)
+    deployment = getattr(llm, "deployment_name", None)
+    return model, deployment
+
+
+def cached_llm_invoke(
+    llm, messages, template_version="", images=(), validate=None, **kwargs
+):
+    """Return `llm.invoke(messages, **kwargs).content`, served from the cache when possible.
+
+    `images` are the image bytes (or base64 strings) carried by `messages`.
+    The response is only cached, and a cached one only served, when
+    `validate(response)` is truthy.
+    """
+    model, deployment = _llm_identity(llm)
+    key = make_cache_key(
+        model, deployment, template_version, messages, images, **kwargs
+    )
+    cache = get_response_cache()
+    cached = cache.get(key)
+    if cached is not None and _is_valid(validate, cached):
+        logger.info(f"LLM cache hit for {template_version or 'prompt'} ({key[:12]})")
+        return cached
+    content = llm.invoke(messages, **kwargs).content
+    if _is_valid(validate, content):
+        cache.set(key, content)
+    return content
+
+
+def cached_chain_call(chain, inputs, template_version="", validate=None):
+    """Call an LLMChain, returning its usual `{**inputs, "text": ...}` response.
+
+    `validate` gates caching of the response text as in `cached_llm_invoke`.
+    """
+    model, deployment = _llm_identity(chain.llm)
+    rendered = chain.prompt.format(**inputs)
+    key = make_cache_key(model, deployment, template_version, [rendered])
+    cache = get_response_cache()
+    cached = cache.get(key)
+    if cached is not None and _is_valid(validate, cached):
+        logger.info(f"LLM cache hit for {template_version or 'chain'} ({key[:12]})")
+        return {**inputs, chain.output_key: cached}
+    response = chain(inputs)
+    if _is_valid(validate, response[chain.output_key]):
+        cache.set(key, response[chain.output_key])
+    return response
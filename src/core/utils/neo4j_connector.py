@@ -2,6 +2,8 @@
 
 import os
 import json
+import threading
+import time
 from dotenv import load_dotenv
 from neo4j import GraphDatabase
 from neo4j.exceptions import AuthError, ServiceUnavailable, Neo4jError
@@ -9,6 +11,81 @@ from src.utils.log import logger
 from src.graphql.utils import call_graph_ql
 from src.graphql.operations import GET_DATABASE_NAME_FROM_PLANT_ID
 
+NEO4J_MAX_CONNECTION_POOL_SIZE = int(os.getenv("NEO4J_MAX_CONNECTION_POOL_SIZE", "50"))
+NEO4J_LIVENESS_CHECK_SECONDS = float(os.getenv("NEO4J_LIVENESS_CHECK_SECONDS", "60"))
+
+_drivers = {}
+_drivers_lock = threading.Lock()
+_metrics = {
+    "drivers_created": 0,
+    "driver_acquisitions": 0,
+    "driver_acquire_seconds": 0.0,
+    "sessions": 0,
+    "session_seconds": 0.0,
+}
+
+
+def _create_driver(uri, username, password):
+    """Create a pooled driver for one URI/credential pair."""
+    config = {
+        "max_connection_lifetime": 60 * 60 * 1000,
+        "max_connection_pool_size": NEO4J_MAX_CONNECTION_POOL_SIZE,
+    }
+    # `encrypted` may only be set for schemes without a +s/+ssc suffix.
+    if "+s" not in uri.split("://")[0]:
+        config["encrypted"] = False
+    return GraphDatabase.driver(uri=uri, auth=(username, password), **config)
+
+
+def get_driver(uri, username, password):
+    """Return the process-wide driver for these credentials, creating it lazily.
+
+    A driver idle for longer than NEO4J_LIVENESS_CHECK_SECONDS is verified
+    before reuse and replaced if the server cannot be reached.
+    """
+    started = time.perf_counter()
+    key = (uri, username, password)
+    with _drivers_lock:
+        entry = _drivers.get(key)
+        if (
+            entry
+            and time.monotonic() - entry["checked_at"] > NEO4J_LIVENESS_CHECK_SECONDS
+        ):
+            try:
+                entry["driver"].verify_connectivity()
+                entry["checked_at"] = time.monotonic()
+            except (ServiceUnavailable, Neo4jError) as e:
+                logger.warning(f"Neo4j driver failed liveness check, recreating: {e}")
+                entry["driver"].close()
+                entry = None
+        if not entry:
+            logger.info("INIT: Creating pooled Neo4j driver for %s", uri)
+            entry = {
+                "driver": _create_driver(uri, username, password),
+                "checked_at": time.monotonic(),
+            }
+            _metrics["drivers_created"] += 1
+        _drivers[key] = entry
+        _metrics["driver_acquisitions"] += 1
+        _metrics["driver_acquire_seconds"] += time.perf_counter() - started
+        return entry["driver"]
+
+
+def get_pool_metrics():
+    """Return driver acquisition and session latency counters."""
+    with _drivers_lock:
+        metrics = dict(_metrics)
+        metrics["drivers_open"] = len(_drivers)
+    return metrics
+
+
+def close_all_drivers():
+    """Close every pooled driver, e.g. on process shutdown."""
+    with _drivers_lock:
+        for entry in _drivers.values():
+            entry["driver"].close()
+        _drivers.clear()
+
 
 async def get_database_name(plant_id):
     """Function to get database name"""
@@ -18,7 +95,7 @@ async def get_database_name(plant_id):
     if is_running_env_local == "true":
         database_name = "db" + plant_id.replace("-", "")
     else:
-        res = call_graph_ql(
+        res = await call_graph_ql(
             query=GET_DATABASE_NAME_FROM_PLANT_ID,
             operation_name="GET_DATABASE_NAME_FROM_PLANT_ID",
             operation_type="query",
@@ -40,22 +117,16 @@ class Neo4jConnection:
         self.database_name = database_name
 
     def connect(self):
-        """Connect to the Neo4j database."""
+        """Attach to the shared driver for the configured Neo4j instance."""
 
         if not self.driver:
             try:
                 logger.info(
-                    "INIT: Creating database connection : %s", self.database_name
+                    "INIT: Acquiring database connection : %s", self.database_name
                 )
                 self.username = os.getenv("NEO4J_USERNAME", "")
                 self.password = os.getenv("NEO4J_PASSWORD", "")
-                self.driver = GraphDatabase.driver(
-                    uri=self.uri,
-                    auth=(self.username, self.password),
-                    max_connection_lifetime=60 * 60 * 1000,
-                    max_connection_pool_size=1,
-                    encrypted=False,
-                )
+                self.driver = get_driver(self.uri, self.username, self.password)
             except AuthError as e:
                 logger.error(f"Authentication failed: {e}")
             except ServiceUnavailable as e:
@@ -66,15 +137,20 @@ class Neo4jConnection:
                 logger.error(f"Unexpected error: {e}")
 
     def close(self):
-        """Close the database connection."""
+        """Release the connection; the pooled driver stays open for reuse."""
         if self.driver:
-            self.driver.close()
-            self.driver = None
+            logger.info("Neo4j pool metrics: %s", get_pool_metrics())
+        self.driver = None
 
     def execute_write(self, query_function, *args):
         """Execute write operations safely."""
+        started = time.perf_counter()
         with self.driver.session(database=self.database_name) as session:
             result = session.write_transaction(query_function, *args)
+        elapsed = time.perf_counter() - started
+        with _drivers_lock:
+            _metrics["sessions"] += 1
+            _metrics["session_seconds"] += elapsed
         return result
 
     @staticmethod
@@ -0,0 +1,171 @@
+"""Uniform-grid spatial index over the OCR tokens of one page.
+
+Build it once per page and answer "tokens anchored in / intersecting this
+box" and "tokens whose y_min falls in this band" queries without scanning
+every token. Query results are token positions in their original order, so
+callers iterating them see tokens in the same order as a linear scan.
+"""
+
+import bisect
+import math
+from collections import defaultdict
+
+_PAGE_INDEX_CACHE_SIZE = 8
+_page_index_cache = {}
+
+
+class OcrPageIndex:
+    """Grid of token anchors and extents.
+
+    Each token has an anchor point (used for containment tests) and an
+    axis-aligned extent (used for intersection tests).
+    """
+
+    def __init__(self, anchors, extents, cell_size=None, items=None):
+        self.anchors = anchors
+        self.extents = extents
+        self.items = items
+        if cell_size is None:
+            cell_size = self._default_cell_size(extents)
+        self.cell_size = cell_size
+        self._anchor_cells = defaultdict(list)
+        self._extent_cells = defaultdict(list)
+        for position, (x, y) in enumerate(anchors):
+            self._anchor_cells[self._cell(x, y)].append(position)
+        for position, (x_min, y_min, x_max, y_max) in enumerate(extents):
+            for cell in self._cells(x_min, y_min, x_max, y_max):
+                self._extent_cells[cell].append(position)
+        order = sorted(range(len(extents)), key=lambda position: extents[position][1])
+        self._y_order = order
+        self._y_sorted = [extents[position][1] for position in order]
+
+    @staticmethod
+    def _default_cell_size(extents):
+        """About four tokens per cell for a uniformly filled page."""
+        if not extents:
+            return 1
+        width = max(e[2] for e in extents) - min(e[0] for e in extents)
+        height = max(e[3] for e in extents) - min(e[1] for e in extents)
+        return max(math.sqrt(max(width * height, 1) * 4 / len(extents)), 1)
+
+    @classmethod
+    def from_annotations(cls, annotations, cell_size=None):
+        """Index Vision-style `text_annotations`; the anchor is the first vertex."""
+        anchors = []
+        extents = []
+        for annotation in annotations:
+            vertices = annotation["bounding_poly"]["vertices"]
+            anchors.append((vertices[0]["x"], vertices[0]["y"]))
+            xs = [vertex.get("x", 0) for vertex in vertices]
+            ys = [vertex.get("y", 0) for vertex in vertices]
+            extents.append((min(xs), min(ys), max(xs), max(ys)))
+        return cls(anchors, extents, cell_size, items=list(annotations))
+
+    @classmethod
+    def from_words(cls, words, cell_size=None):
+        """Index word entries with x_min/x_max/y_min/y_max; the anchor is the top-left."""
+        anchors = [(word["x_min"], word["y_min"]) for word in words]
+        extents = [
+            (word["x_min"], word["y_min"], word["x_max"], word["y_max"])
+            for word in words
+        ]
+        return cls(anchors, extents, cell_size, items=list(words))
+
+    def __len__(self):
+        return len(self.anchors)
+
+    def _cell(self, x, y):
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def _cells(self, x_min, y_min, x_max, y_max):
+        col_min, row_min = self._cell(x_min, y_min)
+        col_max, row_max = self._cell(x_max, y_max)
+        for col in range(col_min, col_max + 1):
+            for row in range(row_min, row_max + 1):
+                yield col, row
+
+    def anchored_in(self, x_min, y_min, x_max, y_max):
+        """Positions of tokens whose anchor lies in the box (inclusive)."""
+        if x_min > x_max or y_min > y_max:
+            return []
+        hits = []
+        for cell in self._cells(x_min, y_min, x_max, y_max):
+            for position in self._anchor_cells.get(cell, ()):
+                x, y = self.anchors[position]
+                if x_min <= x <= x_max and y_min <= y <= y_max:
+                    hits.append(position)
+        hits.sort()
+        return hits
+
+    def intersecting(self, x_min, y_min, x_max, y_max):
+        """Positions of tokens whose extent overlaps the box (inclusive)."""
+        if x_min > x_max or y_min > y_max:
+            return []
+        hits = set()
+        for cell in self._cells(x_min, y_min, x_max, y_max):
+            for position in self._extent_cells.get(cell, ()):
+                t_x_min, t_y_min, t_x_max, t_y_max = self.extents[position]
+                if (
+                    t_x_min <= x_max
+                    and x_min <= t_x_max
+                    and t_y_min <= y_max
+                    and y_min <= t_y_max
+                ):
+                    hits.add(position)
+        return sorted(hits)
+
+    def y_min_between(self, low, high):
+        """Positions of tokens whose top edge lies in [low, high]."""
+        start = bisect.bisect_left(self._y_sorted, low)
+        end = bisect.bisect_right(self._y_sorted, high)
+        return sorted(self._y_order[start:end])
+
+
+def _front_offset(index, annotations):
+    """How many leading items were removed from the indexed list, or None.
+
+    Callers drop the page-level annotation with `del annotations[0]`, so a
+    list that only lost items at the front keeps its index.
+    """
+    offset = len(index.items) - len(annotations)
+    if offset < 0:
+        return None
+    if annotations and (
+        annotations[0] is not index.items[offset]
+        or annotations[-1] is not index.items[-1]
+    ):
+        return None
+    return offset
+
+
+def get_annotation_index(annotations):
+    """Return `(index, offset)` for a `text_annotations` list.
+
+    A recently indexed list is reused; `offset` is the number of leading
+    items removed from it since it was indexed. A list changed in any other
+    way is indexed again.
+    """
+    key = id(annotations)
+    cached = _page_index_cache.get(key)
+    if cached and cached[0] is annotations:
+        offset = _front_offset(cached[1], annotations)
+        if offset is not None:
+            return cached[1], offset
+    index = OcrPageIndex.from_annotations(annotations)
+    if len(_page_index_cache) >= _PAGE_INDEX_CACHE_SIZE:
+        _page_index_cache.pop(next(iter(_page_index_cache)))
+    _page_index_cache[key] = (annotations, index)
+    return index, 0
+
+
+def annotations_anchored_in(annotations, x_min, y_min, x_max, y_max, start=0):
+    """Annotations from `annotations[start:]` whose first vertex lies in the box.
+
+    Results keep list order.
+    """
+    index, offset = get_annotation_index(annotations)
+    return [
+        index.items[position]
+        for position in index.anchored_in(x_min, y_min, x_max, y_max)
+        if position >= offset + start
+    ]
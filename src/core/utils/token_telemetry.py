@@ -0,0 +1,223 @@
+"""Append-only sink for LLM token and cost telemetry.
+
+Records are buffered in memory and written as immutable JSONL partitions::
+
+    {prompt_token_path}/prompt_tokens/run={run_id}/part-{n:05d}.jsonl
+
+so recording a call never waits on storage and concurrent writers never
+overwrite each other. `compact_token_telemetry` folds partitions into a
+single compacted object and `load_prompt_tokens` rebuilds the old
+`prompt_tokens.csv` view.
+
+Configuration (environment variables):
+    BUCKET                          bucket the partitions are written to
+    TOKEN_TELEMETRY_FLUSH_RECORDS   buffered records that trigger a flush
+    TOKEN_TELEMETRY_FLUSH_SECONDS   age of the buffer that triggers a flush
+"""
+
+import asyncio
+import datetime
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from collections import defaultdict
+import pandas as pd
+from py_unified_cloud_adapter.utils.errors import CloudAdapterException  # type: ignore
+from src.utils.log import logger
+from src.utils.s3_download_upload import (
+    load_into_memory,
+    put_csv_in_storage,
+    put_object_in_storage,
+)
+from src.utils.storage_utils import list_objects_in_storage
+
+TOKEN_TELEMETRY_FLUSH_RECORDS = int(os.getenv("TOKEN_TELEMETRY_FLUSH_RECORDS", "50"))
+TOKEN_TELEMETRY_FLUSH_SECONDS = float(os.getenv("TOKEN_TELEMETRY_FLUSH_SECONDS", "30"))
+CSV_COLUMNS = ["Prompt", "Token Count", "Time Stamp"]
+USAGE_FIELDS = ["prompt_tokens", "completion_tokens", "total_tokens", "total_cost"]
+MANIFEST_NAME = "_compacted.json"
+
+_sink = None
+_sink_lock = threading.Lock()
+
+
+def _telemetry_prefix(prompt_token_path):
+    return f"{prompt_token_path}/prompt_tokens"
+
+
+async def _list_paths(bucket, prefix):
+    listing = await list_objects_in_storage(bucket, prefix)
+    if not listing:
+        return []
+    return re.findall(r"path='([^']+)'", str(listing))
+
+
+async def _read_jsonl(bucket, path):
+    data = await load_into_memory(bucket, path)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return [json.loads(line) for line in data.splitlines() if line.strip()]
+
+
+def _to_jsonl(records):
+    return "".join(json.dumps(record, default=str) + "\n" for record in records)
+
+
+class TokenTelemetrySink:
+    """In-memory buffer of token records flushed as append-only partitions."""
+
+    def __init__(
+        self,
+        bucket=None,
+        flush_records=TOKEN_TELEMETRY_FLUSH_RECORDS,
+        flush_seconds=TOKEN_TELEMETRY_FLUSH_SECONDS,
+    ):
+        self.bucket = bucket or os.getenv("BUCKET", "default-bucket-name")
+        self.flush_records = flush_records
+        self.flush_seconds = flush_seconds
+        self.run_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        self._buffers = defaultdict(list)
+        self._parts = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._pending = set()
+
+    def record(self, prompt_token_path, prompt_template_name, cb_response):
+        """Buffer one call's usage; schedules a background flush when due."""
+        entry = {
+            "Prompt": str(prompt_template_name),
+            "Token Count": str(cb_response),
+            "Time Stamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            **{field: getattr(cb_response, field, None) for field in USAGE_FIELDS},
+        }
+        with self._lock:
+            self._buffers[prompt_token_path].append(entry)
+            buffered = sum(len(records) for records in self._buffers.values())
+            due = (
+                buffered >= self.flush_records
+                or time.monotonic() - self._last_flush >= self.flush_seconds
+            )
+        if due:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            task = loop.create_task(self.flush())
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    def _take(self):
+        with self._lock:
+            buffers, self._buffers = self._buffers, defaultdict(list)
+            self._last_flush = time.monotonic()
+            parts = []
+            for prompt_token_path, records in buffers.items():
+                self._parts += 1
+                parts.append((prompt_token_path, self._parts, records))
+        return parts
+
+    async def flush(self):
+        """Write every buffered record as new partition objects."""
+        for prompt_token_path, part, records in self._take():
+            key = (
+                f"{_telemetry_prefix(prompt_token_path)}/run={self.run_id}/"
+                f"part-{part:05d}.jsonl"
+            )
+            try:
+                await put_object_in_storage(self.bucket, key, _to_jsonl(records))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning(f"Token telemetry flush to {key} failed: {e}")
+                with self._lock:
+                    self._buffers[prompt_token_path][:0] = records
+
+    async def aclose(self):
+        """Wait for scheduled flushes, then flush what is left."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        await self.flush()
+
+
+def get_token_telemetry():
+    """Return the process-wide telemetry sink."""
+    global _sink  # pylint: disable=global-statement
+    with _sink_lock:
+        if _sink is None:
+            _sink = TokenTelemetrySink()
+        return _sink
+
+
+async def flush_token_telemetry():
+    """Flush the process-wide sink; call at the end of a run."""
+    await get_token_telemetry().aclose()
+
+
+async def _load_manifest(bucket, prefix):
+    try:
+        data = await load_into_memory(bucket, f"{prefix}/{MANIFEST_NAME}")
+    except CloudAdapterException:
+        return {"compacted": [], "parts": []}
+    return json.loads(data)
+
+
+async def compact_token_telemetry(prompt_token_path, bucket=None):
+    """Fold every not-yet-compacted partition into one compacted object.
+
+    Partitions are never rewritten; a manifest records which ones are covered
+    by compacted objects so readers can skip them.
+    """
+    bucket = bucket or os.getenv("BUCKET", "default-bucket-name")
+    prefix = _telemetry_prefix(prompt_token_path)
+    manifest = await _load_manifest(bucket, prefix)
+    covered = set(manifest["parts"])
+    parts = [
+        path
+        for path in await _list_paths(bucket, f"{prefix}/run=")
+        if path.endswith(".jsonl") and path not in covered
+    ]
+    if not parts:
+        return None
+    records = []
+    for path in sorted(parts):
+        records.extend(await _read_jsonl(bucket, path))
+    records.sort(key=lambda record: record["Time Stamp"])
+    compacted = f"{prefix}/compacted/{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}.jsonl"
+    await put_object_in_storage(bucket, compacted, _to_jsonl(records))
+    manifest["compacted"].append(compacted)
+    manifest["parts"].extend(parts)
+    await put_object_in_storage(
+        bucket, f"{prefix}/{MANIFEST_NAME}", json.dumps(manifest)
+    )
+    logger.info(f"Compacted {len(parts)} token telemetry partitions into {compacted}")
+    return compacted
+
+
+async def load_prompt_tokens(prompt_token_path, bucket=None, write_csv=False):
+    """Return the `Prompt`/`Token Count`/`Time Stamp` view as a DataFrame.
+
+    With `write_csv` the view is also written to the legacy
+    `{prompt_token_path}/prompt_tokens.csv` location.
+    """
+    bucket = bucket or os.getenv("BUCKET", "default-bucket-name")
+    prefix = _telemetry_prefix(prompt_token_path)
+    manifest = await _load_manifest(bucket, prefix)
+    covered = set(manifest["parts"])
+    paths = list(manifest["compacted"]) + [
+        path
+        for path in await _list_paths(bucket, f"{prefix}/run=")
+        if path.endswith(".jsonl") and path not in covered
+    ]
+    records = []
+    for path in paths:
+        records.extend(await _read_jsonl(bucket, path))
+    df = pd.DataFrame(records, columns=CSV_COLUMNS + USAGE_FIELDS)
+    df = df.sort_values("Time Stamp", kind="stable").reset_index(drop=True)
+    if write_csv:
+        await put_csv_in_storage(
+            data_df=df[CSV_COLUMNS],
+            bucket=bucket,
+            destination=f"{prompt_token_path}/prompt_tokens.csv",
+        )
+    return df
@@ -0,0 +1,136 @@
+"""Bounded async executor for fan-out extraction pipelines.
+
+Leaf calls (retrievals, LLM calls) run under a concurrency limit and an
+optional start-rate limit, and identical calls share one execution. Named
+tasks are timed and their results checkpointed to storage so a restarted
+run skips what already finished.
+"""
+
+import asyncio
+import json
+import time
+from py_unified_cloud_adapter.utils.errors import CloudAdapterException  # type: ignore
+from src.utils.log import logger
+from src.utils.s3_download_upload import load_into_memory, put_object_in_storage
+
+
+class RateLimiter:
+    """Spaces call starts at least 1/rate_per_second apart (0 disables it)."""
+
+    def __init__(self, rate_per_second=0):
+        self.interval = 1 / rate_per_second if rate_per_second > 0 else 0
+        self._next_start = 0.0
+
+    async def wait(self):
+        """Reserve the next start slot and sleep until it."""
+        if not self.interval:
+            return
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class StorageCheckpoint:
+    """Task results persisted as one JSON object, saved every few completions.
+
+    A checkpoint marked complete is ignored on load, so only interrupted runs
+    resume.
+    """
+
+    def __init__(self, bucket, path, save_every=10):
+        self.bucket = bucket
+        self.path = path
+        self.save_every = save_every
+        self._results = {}
+        self._unsaved = 0
+        self._lock = asyncio.Lock()
+
+    async def load(self):
+        """Load results of an interrupted run, if any."""
+        try:
+            data = json.loads(await load_into_memory(self.bucket, self.path))
+        except (CloudAdapterException, FileNotFoundError, ValueError):
+            return self
+        if not data.get("complete"):
+            self._results = data.get("results", {})
+            logger.info(f"Resuming from {len(self._results)} checkpointed tasks")
+        return self
+
+    def __contains__(self, task_id):
+        return task_id in self._results
+
+    def get(self, task_id):
+        """Return the checkpointed result of a task."""
+        return self._results[task_id]
+
+    async def set(self, task_id, result):
+        """Record a finished task and save when enough are pending."""
+        self._results[task_id] = result
+        self._unsaved += 1
+        if self._unsaved >= self.save_every:
+            await self.save()
+
+    async def save(self, complete=False):
+        """Write all results to storage."""
+        async with self._lock:
+            self._unsaved = 0
+            payload = json.dumps({"complete": complete, "results": self._results})
+            await put_object_in_storage(self.bucket, self.path, payload)
+
+
+class WorkGraphExecutor:
+    """Runs named tasks whose leaf calls share a bounded, rate-limited pool."""
+
+    def __init__(self, concurrency=8, rate_per_second=0, checkpoint=None):
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._rate_limiter = RateLimiter(rate_per_second)
+        self._shared = {}
+        self.checkpoint = checkpoint
+        self.timings = []
+        self.stats = {"calls": 0, "deduplicated": 0, "resumed": 0}
+
+    async def _limited(self, factory):
+        async with self._semaphore:
+            await self._rate_limiter.wait()
+            self.stats["calls"] += 1
+            return await factory()
+
+    async def call(self, factory, dedupe_key=None):
+        """Await `factory()` inside the pool; equal `dedupe_key`s run once."""
+        if dedupe_key is None:
+            return await self._limited(factory)
+        if dedupe_key in self._shared:
+            self.stats["deduplicated"] += 1
+        else:
+            self._shared[dedupe_key] = asyncio.ensure_future(self._limited(factory))
+        return await asyncio.shield(self._shared[dedupe_key])
+
+    async def run_task(self, task_id, factory):
+        """Run a named task once, reusing its checkpointed result if present."""
+        if self.checkpoint is not None and task_id in self.checkpoint:
+            self.stats["resumed"] += 1
+            self.timings.append((task_id, 0.0, "checkpoint"))
+            return self.checkpoint.get(task_id)
+        started = time.perf_counter()
+        try:
+            result = await factory()
+        except Exception:
+            self.timings.append((task_id, time.perf_counter() - started, "failed"))
+            raise
+        self.timings.append((task_id, time.perf_counter() - started, "done"))
+        if self.checkpoint is not None:
+            await self.checkpoint.set(task_id, result)
+        return result
+
+    def report(self):
+        """Log per-task timings, slowest first, and executor counters."""
+        for task_id, seconds, status in sorted(
+            self.timings, key=lambda timing: timing[1], reverse=True
+        ):
+            logger.info(f"task {task_id}: {seconds:.2f}s ({status})")
+        total = sum(seconds for _, seconds, _ in self.timings)
+        logger.info(
+            f"{len(self.timings)} tasks, {total:.2f}s task time, stats: {self.stats}"
+        )
@@ -0,0 +1,233 @@
+"""Batch scheduling of many documents onto a bounded worker pool."""
+
+import asyncio
+import shutil
+import tempfile
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Protocol
+
+from src.utils.log import logger
+from src.utils.spooled_document import SpooledDocument
+from src.utils.stages import StageLimits, bind_stage_context
+
+
+class DocumentRunner(Protocol):
+    async def run(
+        self, document: SpooledDocument, payload: Dict[str, Any], temp_dir: Path
+    ) -> Dict[str, Any]:
+        """Run one spooled document and return its result."""
+
+
+class BatchQueueFull(RuntimeError):
+    """The scheduler cannot admit more documents right now."""
+
+
+@dataclass
+class BatchDocument:
+    document_id: str
+    filename: str
+    path: Path
+    spooled: Optional[SpooledDocument] = None
+    status: str = "queued"  # queued | running | succeeded | failed
+    stage: Optional[str] = None
+    error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    queued_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+    def progress(self) -> Dict[str, Any]:
+        elapsed = None
+        if self.started_at is not None:
+            elapsed = (self.finished_at or time.time()) - self.started_at
+        return {
+            "document_id": self.document_id,
+            "filename": self.filename,
+            "status": self.status,
+            "stage": self.stage,
+            "error": self.error,
+            "queued_at": self.queued_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "elapsed_seconds": elapsed,
+        }
+
+
+@dataclass
+class BatchJob:
+    job_id: str
+    payload: Dict[str, Any]
+    workdir: Path
+    documents: "OrderedDict[str, BatchDocument]" = field(default_factory=OrderedDict)
+    created_at: float = field(default_factory=time.time)
+
+    def add_document(self, filename: str) -> BatchDocument:
+        """Register a document; its content must be spooled to `.path`."""
+        document_id = f"{len(self.documents) + 1:04d}"
+        document_dir = self.workdir / document_id
+        document_dir.mkdir()
+        document = BatchDocument(document_id, filename, document_dir / "input.pdf")
+        self.documents[document_id] = document
+        return document
+
+    @property
+    def status(self) -> str:
+        statuses = {document.status for document in self.documents.values()}
+        if statuses <= {"succeeded", "failed"}:
+            return "completed"
+        if statuses == {"queued"}:
+            return "queued"
+        return "running"
+
+    def counts(self) -> Dict[str, int]:
+        counts = {"queued": 0, "running": 0, "succeeded": 0, "failed": 0}
+        for document in self.documents.values():
+            counts[document.status] += 1
+        return counts
+
+    def progress(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "counts": self.counts(),
+            "documents": [doc.progress() for doc in self.documents.values()],
+        }
+
+    def results(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "results": [
+                {**doc.progress(), "result": doc.result}
+                for doc in self.documents.values()
+                if doc.done
+            ],
+        }
+
+
+class BatchScheduler:
+    """Runs queued documents through `runner` on `workers` async workers.
+
+    At most `max_queued_documents` documents may be waiting or running at
+    once; `stage_limits` caps how many of them are inside each named stage.
+    The newest `max_jobs` jobs are kept for status queries.
+    """
+
+    def __init__(
+        self,
+        runner: DocumentRunner,
+        workers: int = 4,
+        stage_limits: Optional[Dict[str, int]] = None,
+        max_queued_documents: int = 200,
+        max_jobs: int = 100,
+    ) -> None:
+        self.runner = runner
+        self.workers = max(workers, 1)
+        self.stage_limits = StageLimits(stage_limits)
+        self.max_queued_documents = max_queued_documents
+        self.max_jobs = max_jobs
+        self.jobs: "OrderedDict[str, BatchJob]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._outstanding = 0
+
+    def new_job(self, payload: Dict[str, Any]) -> BatchJob:
+        job_id = uuid.uuid4().hex
+        workdir = Path(tempfile.mkdtemp(prefix=f"batch_{job_id[:8]}_"))
+        return BatchJob(job_id, payload, workdir)
+
+    def discard(self, job: BatchJob) -> None:
+        shutil.rmtree(job.workdir, ignore_errors=True)
+
+    def _start(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._tasks = [
+                asyncio.create_task(self._worker(number))
+                for number in range(self.workers)
+            ]
+        return self._queue
+
+    async def submit(self, job: BatchJob) -> BatchJob:
+        """Queue every document of `job`, or raise `BatchQueueFull`."""
+        if self._outstanding + len(job.documents) > self.max_queued_documents:
+            raise BatchQueueFull(
+                f"{self._outstanding} documents outstanding; a batch of "
+                f"{len(job.documents)} would exceed {self.max_queued_documents}"
+            )
+        queue = self._start()
+        self.jobs[job.job_id] = job
+        self._evict()
+        self._outstanding += len(job.documents)
+        for document in job.documents.values():
+            queue.put_nowait((job, document))
+        logger.info(f"Batch {job.job_id}: queued {len(job.documents)} documents")
+        return job
+
+    def get(self, job_id: str) -> Optional[BatchJob]:
+        return self.jobs.get(job_id)
+
+    def _evict(self) -> None:
+        while len(self.jobs) > self.max_jobs:
+            oldest = next(iter(self.jobs.values()))
+            if oldest.status != "completed":
+                return
+            del self.jobs[oldest.job_id]
+
+    async def _worker(self, number: int) -> None:
+        while True:
+            job, document = await self._queue.get()
+            try:
+                await self._run_document(job, document)
+            finally:
+                self._outstanding -= 1
+                self._queue.task_done()
+            if job.status == "completed":
+                await asyncio.to_thread(self.discard, job)
+                logger.info(f"Batch {job.job_id}: completed {job.counts()}")
+
+    async def _run_document(self, job: BatchJob, document: BatchDocument) -> None:
+        def report(stage_name: str) -> None:
+            document.stage = stage_name
+
+        bind_stage_context(self.stage_limits, report)
+        document.status = "running"
+        document.started_at = time.time()
+        try:
+            spooled = document.spooled
+            if spooled is None:
+                spooled = await asyncio.to_thread(
+                    SpooledDocument.from_path, document.path, document.filename
+                )
+            document.result = await self.runner.run(
+                spooled, dict(job.payload), document.path.parent
+            )
+            document.status = "succeeded"
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error(f"Batch {job.job_id}: {document.filename} failed: {exc}")
+            document.status = "failed"
+            document.error = str(exc)
+        finally:
+            document.finished_at = time.time()
+            document.stage = None
+
+    async def join(self) -> None:
+        """Wait until every queued document has finished."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
@@ -11,11 +11,13 @@ from src.agents.classifier import DocumentClassifierAgent, DocumentClassificatio
 # from src.agents.process_narrative import ProcessNarrativeAgent
 from src.agents.datasheet import DataSheetAgentPipeline
 from src.config.settings import get_settings
+from src.utils.spooled_document import SpooledDocument
+from src.utils.stages import stage
 
 
 @dataclass
 class OrchestratorState:
-    document_bytes: bytes
+    document: SpooledDocument
     payload: Dict[str, Any]
     temp_dir: Path
     classification: Optional[Dict[str, Any]] = None
@@ -60,7 +62,8 @@ class AgentOrchestrator:
         if self.settings.skip_classifier:
             classification = DocumentClassification(doc_type="datasheet", confidence=1.0)
         else:
-            classification = await self.classifier.classify(state.document_bytes)
+            async with stage("classify"):
+                classification = await self.classifier.classify(state.document)
         state.classification = classification.__dict__
         state.logs.append(f"classified as {classification.doc_type} ({classification.confidence:.2f})")
         return state
@@ -77,7 +80,7 @@ class AgentOrchestrator:
 
     async def _handle_datasheet_node(self, state: OrchestratorState) -> OrchestratorState:
         result = await self.datasheet_pipeline.run(
-            document_bytes=state.document_bytes,
+            document=state.document,
             workdir=state.temp_dir,
             asset_type=state.payload.get("asset_type", "generic"),
             database=state.payload.get("database"),
@@ -86,9 +89,9 @@ class AgentOrchestrator:
         state.logs.append("datasheet ADM ingested")
         return state
 
-    async def run(self, document_bytes: bytes, payload: Dict[str, Any], temp_dir: Path) -> Dict[str, Any]:
+    async def run(self, document: SpooledDocument, payload: Dict[str, Any], temp_dir: Path) -> Dict[str, Any]:
         initial_state = OrchestratorState(
-            document_bytes=document_bytes,
+            document=document,
             payload=payload,
             temp_dir=temp_dir,
         )
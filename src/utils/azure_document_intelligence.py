@@ -1,26 +1,28 @@
 """Helper for calling Azure Document Intelligence custom models."""
 
-import base64
 from typing import Any, Dict
 
-import httpx
-
 from src.config.settings import get_settings
+from src.utils.classification_cache import get_classification_cache
+from src.utils.document_intelligence_gateway import (
+    DocumentSource,
+    document_hash,
+    get_document_intelligence_gateway,
+)
 
 settings = get_settings()
 
 
-async def classify_document(document_bytes: bytes) -> Dict[str, Any]:
-    """Invoke the Azure Document Intelligence endpoint for classification."""
-    headers = {
-        "Content-Type": "application/octet-stream",
-        "Ocp-Apim-Subscription-Key": settings.azure_document_intelligence_key,
-    }
-    async with httpx.AsyncClient(timeout=60) as client:
-        response = await client.post(
-            settings.azure_document_intelligence_endpoint,
-            headers=headers,
-            content=document_bytes,
-        )
-        response.raise_for_status()
-        return response.json()
+async def classify_document(document: DocumentSource) -> Dict[str, Any]:
+    """Invoke the Azure Document Intelligence endpoint for classification.
+
+    Results are cached by document hash and endpoint, which identifies the
+    custom model.
+    """
+    endpoint = settings.azure_document_intelligence_endpoint
+    gateway = get_document_intelligence_gateway(
+        endpoint, settings.azure_document_intelligence_key
+    )
+    return await get_classification_cache().get_or_classify(
+        document_hash(document), endpoint, lambda: gateway.post_document(document)
+    )
@@ -0,0 +1,296 @@
+"""Content-addressed cache for document classification results.
+
+Results are keyed by the SHA-256 of the document and the classifier model
+id, so re-submitting or re-processing the same PDF never reaches Azure
+Document Intelligence twice. Entries live in a local SQLite file
+(``CLASSIFICATION_CACHE_PATH``) and, when ``CLASSIFICATION_CACHE_BUCKET`` is
+set, also in object storage where other processes and hosts can find them.
+Deterministic failures (client errors other than throttling, invalid
+input) are cached for ``CLASSIFICATION_CACHE_NEGATIVE_TTL_SECONDS`` so a
+broken document is not retried on every submission; throttling, server
+errors and timeouts are not. Concurrent requests for the same key share a
+single remote call. This is the only cache of classification results; the
+Document Intelligence gateway keeps layout results only.
+"""
+
+import asyncio
+import copy
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import weakref
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol, Tuple
+
+from src.utils.log import logger
+
+CACHE_PATH = os.getenv(
+    "CLASSIFICATION_CACHE_PATH", "outputs/classification_cache.sqlite3"
+)
+CACHE_BUCKET = os.getenv("CLASSIFICATION_CACHE_BUCKET", "")
+CACHE_PREFIX = os.getenv("CLASSIFICATION_CACHE_PREFIX", "classification-cache")
+TTL_SECONDS = float(os.getenv("CLASSIFICATION_CACHE_TTL_SECONDS", "0"))
+NEGATIVE_TTL_SECONDS = float(
+    os.getenv("CLASSIFICATION_CACHE_NEGATIVE_TTL_SECONDS", "60")
+)
+
+CacheKey = Tuple[str, str]  # (document sha256, classifier model id)
+
+
+class CachedClassificationError(RuntimeError):
+    """A recent classification of this document failed; not retried yet."""
+
+
+def is_deterministic_failure(exc: BaseException) -> bool:
+    """Whether retrying the same document would fail the same way.
+
+    True for 4xx responses other than 408 and 429 (from the Azure SDK or
+    httpx) and for validation errors; False for throttling, 5xx responses,
+    timeouts and connection errors.
+    """
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return 400 <= status < 500 and status not in (408, 429)
+    return isinstance(exc, (ValueError, TypeError))
+
+
+@dataclass
+class CacheEntry:
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: float = 0.0
+    expires_at: Optional[float] = None  # None never expires
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and self.expires_at <= time.time()
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        """Return the entry stored under `key`, if any."""
+
+    async def set(self, key: CacheKey, entry: CacheEntry) -> None:
+        """Store `entry` under `key`."""
+
+
+class SQLiteCacheBackend:
+    """Entries in one SQLite table; safe to share between worker processes."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            str(self.path), check_same_thread=False, timeout=30
+        )
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS classification_cache ("
+                " document_sha256 TEXT NOT NULL,"
+                " model_id TEXT NOT NULL,"
+                " result TEXT,"
+                " error TEXT,"
+                " created_at REAL NOT NULL,"
+                " expires_at REAL,"
+                " PRIMARY KEY (document_sha256, model_id))"
+            )
+
+    def _get(self, key: CacheKey) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT result, error, created_at, expires_at"
+                " FROM classification_cache"
+                " WHERE document_sha256 = ? AND model_id = ?",
+                key,
+            ).fetchone()
+        if row is None:
+            return None
+        result, error, created_at, expires_at = row
+        return CacheEntry(
+            json.loads(result) if result is not None else None,
+            error,
+            created_at,
+            expires_at,
+        )
+
+    def _set(self, key: CacheKey, entry: CacheEntry) -> None:
+        result = json.dumps(entry.result) if entry.result is not None else None
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO classification_cache"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, result, entry.error, entry.created_at, entry.expires_at),
+            )
+
+    async def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: CacheKey, entry: CacheEntry) -> None:
+        await asyncio.to_thread(self._set, key, entry)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class StorageCacheBackend:
+    """Entries as JSON objects under `prefix` in a cloud storage bucket."""
+
+    def __init__(self, bucket: str, prefix: str = CACHE_PREFIX) -> None:
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+
+    def _object_path(self, key: CacheKey) -> str:
+        document_sha256, model_id = key
+        model = re.sub(r"[^A-Za-z0-9._-]+", "_", model_id).strip("_")
+        return f"{self.prefix}/{model}/{document_sha256}.json"
+
+    async def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        # Imported here so the SQLite cache works without the cloud adapter.
+        from py_unified_cloud_adapter.utils.errors import CloudAdapterException
+        from src.utils.s3_download_upload import load_json_from_storage
+
+        try:
+            data = await load_json_from_storage(self.bucket, self._object_path(key))
+        except CloudAdapterException as e:
+            if e.code == "404":
+                return None
+            raise
+        return CacheEntry(**data)
+
+    async def set(self, key: CacheKey, entry: CacheEntry) -> None:
+        from src.utils.s3_download_upload import save_json_to_storage
+
+        await save_json_to_storage(self.bucket, self._object_path(key), asdict(entry))
+
+
+class ClassificationCache:
+    """Read-through cache over `backends`, checked in order.
+
+    A hit in a later backend is copied into the earlier ones. Backend errors
+    are logged and treated as misses so the cache never fails a
+    classification. `ttl` (0 for never) bounds how long a result is reused,
+    `negative_ttl` (0 to disable) how long a deterministic failure is.
+    """
+
+    def __init__(
+        self,
+        backends: List[CacheBackend],
+        ttl: float = TTL_SECONDS,
+        negative_ttl: float = NEGATIVE_TTL_SECONDS,
+    ) -> None:
+        self.backends = backends
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._inflight: (
+            "weakref.WeakKeyDictionary[Any, Dict[CacheKey, asyncio.Future]]"
+        ) = weakref.WeakKeyDictionary()
+
+    async def get_or_classify(
+        self,
+        document_sha256: str,
+        model_id: str,
+        classify: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """The cached result for the key, or the result of `classify()`.
+
+        Raises `CachedClassificationError` while a failure is cached; a fresh
+        failure propagates unchanged.
+        """
+        key = (document_sha256, model_id)
+        flights = self._inflight.setdefault(asyncio.get_running_loop(), {})
+        flight = flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(self._resolve(key, classify))
+            flights[key] = flight
+            flight.add_done_callback(lambda _: flights.pop(key, None))
+        else:
+            logger.info(f"Classification of {document_sha256[:12]} already in flight")
+        # Shielded so one caller going away does not cancel the others' call.
+        return copy.deepcopy(await asyncio.shield(flight))
+
+    async def _resolve(
+        self, key: CacheKey, classify: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        entry = await self._lookup(key)
+        if entry is not None:
+            if entry.error is not None:
+                raise CachedClassificationError(entry.error)
+            logger.info(f"Classification of {key[0][:12]} served from cache")
+            return entry.result
+
+        now = time.time()
+        try:
+            result = await classify()
+        except Exception as exc:
+            if self.negative_ttl > 0 and is_deterministic_failure(exc):
+                await self._store(
+                    key,
+                    CacheEntry(
+                        error=f"{type(exc).__name__}: {exc}",
+                        created_at=now,
+                        expires_at=now + self.negative_ttl,
+                    ),
+                )
+            raise
+        await self._store(
+            key,
+            CacheEntry(
+                result=result,
+                created_at=now,
+                expires_at=now + self.ttl if self.ttl > 0 else None,
+            ),
+        )
+        return result
+
+    async def _lookup(self, key: CacheKey) -> Optional[CacheEntry]:
+        for number, backend in enumerate(self.backends):
+            try:
+                entry = await backend.get(key)
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.warning(f"Classification cache read failed: {exc}")
+                continue
+            if entry is None or entry.expired:
+                continue
+            for earlier in self.backends[:number]:
+                await self._store(key, entry, [earlier])
+            return entry
+        return None
+
+    async def _store(
+        self,
+        key: CacheKey,
+        entry: CacheEntry,
+        backends: Optional[List[CacheBackend]] = None,
+    ) -> None:
+        for backend in self.backends if backends is None else backends:
+            try:
+                await backend.set(key, entry)
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.warning(f"Classification cache write failed: {exc}")
+
+
+_cache: Optional[ClassificationCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_classification_cache() -> ClassificationCache:
+    """Process-wide cache configured from the ``CLASSIFICATION_CACHE_*`` env."""
+    global _cache  # pylint: disable=global-statement
+    with _cache_lock:
+        if _cache is None:
+            backends: List[CacheBackend] = []
+            if CACHE_PATH:
+                backends.append(SQLiteCacheBackend(CACHE_PATH))
+            if CACHE_BUCKET:
+                backends.append(StorageCacheBackend(CACHE_BUCKET, CACHE_PREFIX))
+            _cache = ClassificationCache(backends)
+        return _cache
@@ -0,0 +1,240 @@
+"""Shared async access to Azure Document Intelligence.
+
+One `DocumentIntelligenceGateway` per endpoint and key serves custom
+classification, layout and table extraction. Its SDK clients live on the
+gateway's own event loop thread, so every caller's loop shares one set of
+connections that `aclose` releases. Long-running operations are awaited
+with the SDKs' aio pollers, and at most
+``DOCUMENT_INTELLIGENCE_MAX_CONCURRENCY`` operations run at once. Layout
+results can be cached in memory by SHA-256 of the document and model id
+(the last ``DOCUMENT_INTELLIGENCE_CACHE_SIZE`` results); they run to
+megabytes on large PDFs, so the cache is off (0) by default.
+Classification results are cached by `src.utils.classification_cache`.
+
+Layout and table extraction go through the ``azure-ai-formrecognizer``
+client so the stored ``analyzeResult`` keeps its existing shape;
+classification goes through ``azure-ai-documentintelligence``. Results are
+returned as plain dicts that the caller owns. Documents may be given as
+bytes or as a `SpooledDocument`, which is streamed from disk.
+"""
+
+import asyncio
+import copy
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+import httpx
+from azure.ai.documentintelligence.aio import DocumentIntelligenceClient
+from azure.ai.formrecognizer.aio import DocumentAnalysisClient
+from azure.core.credentials import AzureKeyCredential
+
+from src.utils.log import logger
+from src.utils.spooled_document import SpooledDocument
+
+MAX_CONCURRENCY = int(os.getenv("DOCUMENT_INTELLIGENCE_MAX_CONCURRENCY", "8"))
+CACHE_SIZE = int(os.getenv("DOCUMENT_INTELLIGENCE_CACHE_SIZE", "0"))
+POLLING_INTERVAL = float(os.getenv("DOCUMENT_INTELLIGENCE_POLLING_INTERVAL", "1"))
+HTTP_TIMEOUT = 60
+
+DocumentSource = Union[bytes, SpooledDocument]
+
+
+def document_hash(document: DocumentSource) -> str:
+    if isinstance(document, SpooledDocument):
+        return document.sha256
+    return hashlib.sha256(document).hexdigest()
+
+
+@asynccontextmanager
+async def _request_body(document: DocumentSource) -> AsyncIterator[Any]:
+    """The document as an SDK request body: bytes, or an open file handle."""
+    if not isinstance(document, SpooledDocument):
+        yield document
+        return
+    handle = await asyncio.to_thread(document.open)
+    try:
+        yield handle
+    finally:
+        handle.close()
+
+
+class _Clients:
+    """SDK clients and the concurrency cap, bound to the gateway's loop."""
+
+    def __init__(self, endpoint: str, key: str, max_concurrency: int) -> None:
+        credential = AzureKeyCredential(key)
+        self.analysis = DocumentAnalysisClient(endpoint, credential)
+        self.intelligence = DocumentIntelligenceClient(endpoint, credential)
+        self.http = httpx.AsyncClient(
+            headers={"Ocp-Apim-Subscription-Key": key}, timeout=HTTP_TIMEOUT
+        )
+        self.slots = asyncio.Semaphore(max_concurrency)
+
+    async def close(self) -> None:
+        await self.analysis.close()
+        await self.intelligence.close()
+        await self.http.aclose()
+
+
+class DocumentIntelligenceGateway:
+    """Pooled, capped and cached Document Intelligence operations."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        key: str,
+        max_concurrency: int = MAX_CONCURRENCY,
+        cache_size: int = CACHE_SIZE,
+        polling_interval: float = POLLING_INTERVAL,
+    ) -> None:
+        if not endpoint:
+            raise ValueError("document_intelligence_endpoint cannot be empty")
+        if not key:
+            raise ValueError("document_intelligence_api_key cannot be empty")
+        self.endpoint = endpoint
+        self.key = key
+        self.max_concurrency = max(max_concurrency, 1)
+        self.cache_size = cache_size
+        self.polling_interval = polling_interval
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._shared: Optional[_Clients] = None
+        self._cache: "OrderedDict[Tuple[str, str, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _run(self, coroutine: Awaitable[Any]) -> Awaitable[Any]:
+        """Run `coroutine` on the gateway's event loop thread."""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="document-intelligence-gateway",
+                    daemon=True,
+                ).start()
+        return asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        )
+
+    async def _call(
+        self, call: Callable[[_Clients], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        # Runs on the gateway's loop, which owns the clients.
+        if self._shared is None:
+            self._shared = _Clients(self.endpoint, self.key, self.max_concurrency)
+        clients = self._shared
+        async with clients.slots:
+            return await call(clients)
+
+    async def aclose(self) -> None:
+        """Close the shared clients; the next operation opens new ones."""
+        if self._loop is None:
+            return
+
+        async def close() -> None:
+            clients, self._shared = self._shared, None
+            if clients is not None:
+                await clients.close()
+
+        await self._run(close())
+
+    async def _cached(
+        self,
+        operation: str,
+        model_id: str,
+        document: DocumentSource,
+        call: Callable[[_Clients], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        key = (document_hash(document), operation, model_id)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is not None:
+            logger.info(f"Document intelligence {operation} served from cache")
+            return copy.deepcopy(cached)
+
+        result = await self._run(self._call(call))
+        if self.cache_size > 0:
+            with self._lock:
+                self._cache[key] = copy.deepcopy(result)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return result
+
+    async def analyze(
+        self, document: DocumentSource, model_id: str = "prebuilt-layout"
+    ) -> Dict[str, Any]:
+        """Run a layout (or other analysis) model; returns the result dict."""
+
+        async def call(clients: _Clients) -> Dict[str, Any]:
+            async with _request_body(document) as body:
+                poller = await clients.analysis.begin_analyze_document(
+                    model_id, body, polling_interval=self.polling_interval
+                )
+            return (await poller.result()).to_dict()
+
+        return await self._cached("analyze", model_id, document, call)
+
+    async def tables(
+        self, document: DocumentSource, model_id: str = "prebuilt-layout"
+    ) -> list:
+        """Tables found by a layout model; shares the cached analysis."""
+        return (await self.analyze(document, model_id)).get("tables") or []
+
+    async def classify(
+        self, document: DocumentSource, classifier_id: str
+    ) -> Dict[str, Any]:
+        """Run a custom classifier; returns the REST ``analyzeResult`` dict."""
+
+        async def call(clients: _Clients) -> Dict[str, Any]:
+            async with _request_body(document) as body:
+                poller = await clients.intelligence.begin_classify_document(
+                    classifier_id,
+                    body,
+                    content_type="application/octet-stream",
+                    polling_interval=self.polling_interval,
+                )
+            return (await poller.result()).as_dict()
+
+        return await self._run(self._call(call))
+
+    async def post_document(self, document: DocumentSource) -> Dict[str, Any]:
+        """POST the document to the endpoint URL itself (custom model routes)."""
+
+        async def call(clients: _Clients) -> Dict[str, Any]:
+            headers = {"Content-Type": "application/octet-stream"}
+            content = document
+            if isinstance(document, SpooledDocument):
+                headers["Content-Length"] = str(document.size)
+                content = document.iter_chunks()
+            response = await clients.http.post(
+                self.endpoint, headers=headers, content=content
+            )
+            response.raise_for_status()
+            return response.json()
+
+        return await self._run(self._call(call))
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+_gateways: Dict[Tuple[str, str], DocumentIntelligenceGateway] = {}
+_gateways_lock = threading.Lock()
+
+
+def get_document_intelligence_gateway(
+    endpoint: Optional[str], key: Optional[str]
+) -> DocumentIntelligenceGateway:
+    """Process-wide gateway for an endpoint and key."""
+    with _gateways_lock:
+        gateway = _gateways.get((endpoint, key))
+        if gateway is None:
+            gateway = DocumentIntelligenceGateway(endpoint, key)
+            _gateways[(endpoint, key)] = gateway
+        return gateway
@@ -0,0 +1,106 @@
+"""Fingerprint manifests for incremental (diff) graph ingestion.
+
+Each ingestion scope (one data sheet, or the assets of one ADM) keeps a
+manifest in Neo4j: a single ``IngestionFingerprints`` node whose
+``fingerprints`` property maps ``"<label>:<id>"`` to a fingerprint of
+everything the scope wrote for that node. Diff ingestion reads the
+manifest with one query, compares it with the fingerprints of the new
+payload, writes only inserted, updated and deleted nodes (and their
+edges), then stores the new manifest. Node ids are global, so several
+scopes can share a node or edge: each one records the scopes that wrote it
+in ``ingestScopes``, and a scope that drops it only deletes it once no
+other scope still owns it. The manifest is written last, so an
+ingestion that fails part-way is repaired by the next run.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+MANIFEST_LABEL = "IngestionFingerprints"
+
+# Databases whose manifest `scope` constraint already exists.
+_constrained_databases: set = set()
+
+
+def fingerprint(value: Any) -> str:
+    """Stable digest of a JSON-like value (key order does not matter)."""
+    encoded = json.dumps(
+        value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:32]
+
+
+def node_key(label: str, node_id: Any) -> str:
+    return f"{label}:{node_id}"
+
+
+def split_key(key: str) -> Tuple[str, str]:
+    label, _, node_id = key.partition(":")
+    return label, node_id
+
+
+@dataclass
+class GraphDiff:
+    inserted: List[str]
+    updated: List[str]
+    deleted: List[str]
+    unchanged: int
+
+    @classmethod
+    def compute(cls, previous: Dict[str, str], current: Dict[str, str]) -> "GraphDiff":
+        inserted, updated = [], []
+        for key, value in current.items():
+            if key not in previous:
+                inserted.append(key)
+            elif previous[key] != value:
+                updated.append(key)
+        deleted = [key for key in previous if key not in current]
+        unchanged = len(current) - len(inserted) - len(updated)
+        return cls(inserted, updated, deleted, unchanged)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.inserted or self.updated or self.deleted)
+
+    def summary(self, dry_run: bool) -> Dict[str, Any]:
+        return {
+            "dry_run": dry_run,
+            "nodes_inserted": len(self.inserted),
+            "nodes_updated": len(self.updated),
+            "nodes_deleted": len(self.deleted),
+            "nodes_unchanged": self.unchanged,
+        }
+
+
+def ensure_manifest_constraint(session, database: str | None = None) -> None:
+    """Create the manifest `scope` uniqueness constraint once per database."""
+    if database in _constrained_databases:
+        return
+    session.run(
+        f"CREATE CONSTRAINT IF NOT EXISTS FOR (m:{MANIFEST_LABEL}) "
+        "REQUIRE m.scope IS UNIQUE"
+    )
+    _constrained_databases.add(database)
+
+
+def read_fingerprints(session, scope: str) -> Dict[str, str]:
+    """The manifest of `scope`; empty if it was never ingested in diff mode."""
+    record = session.run(
+        f"MATCH (m:{MANIFEST_LABEL} {{scope: $scope}}) "
+        "RETURN m.fingerprints AS fingerprints",
+        scope=scope,
+    ).single()
+    if record is None or not record["fingerprints"]:
+        return {}
+    return json.loads(record["fingerprints"])
+
+
+def write_fingerprints(session, scope: str, fingerprints: Dict[str, str]) -> None:
+    session.run(
+        f"MERGE (m:{MANIFEST_LABEL} {{scope: $scope}}) "
+        "SET m.fingerprints = $fingerprints, m.updatedAt = timestamp()",
+        scope=scope,
+        fingerprints=json.dumps(fingerprints, separators=(",", ":")),
+    )
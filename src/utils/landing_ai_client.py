@@ -0,0 +1,317 @@
+"""Async client for Landing AI Agentic Document Analysis.
+
+Jobs are submitted and polled on the caller's event loop, so one loop can
+keep many documents in flight (bounded by ``max_inflight_jobs``) without a
+thread per document. Polling starts with a short interval that grows
+exponentially, with jitter, up to a ceiling, and gives up after
+``PollPolicy.max_wait`` seconds. PDFs longer than ``chunk_pages`` pages are
+split, the chunks are extracted concurrently and their results are
+stitched back together in page order.
+"""
+
+import asyncio
+import io
+import json
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import fitz  # pymupdf
+import httpx
+
+from src.config.settings import get_settings
+from src.utils.log import logger
+
+BASE_URL = "https://api.va.landing.ai/v1/tools/agentic-document-analysis"
+OUTPUT_DIR = Path("outputs")
+FINAL_STATUSES = ("success", "partial")
+
+
+class LandingAIError(RuntimeError):
+    """The Landing AI request failed or returned no extraction."""
+
+
+@dataclass(frozen=True)
+class PollPolicy:
+    """Delays between status polls of a submitted job."""
+
+    initial_interval: float = 1.0
+    factor: float = 1.5
+    max_interval: float = 10.0
+    jitter: float = 0.1
+    max_wait: float = 900.0
+
+    def delays(self, rng: random.Random = random) -> Iterator[float]:
+        """Yield poll delays until `max_wait` seconds have been spent."""
+        interval = self.initial_interval
+        waited = 0.0
+        while waited < self.max_wait:
+            delay = interval * rng.uniform(1 - self.jitter, 1 + self.jitter)
+            delay = min(delay, self.max_wait - waited)
+            waited += delay
+            yield delay
+            interval = min(interval * self.factor, self.max_interval)
+
+
+@dataclass
+class ExtractionResult:
+    extracted: Dict[str, Any]
+    status: str
+    logs: List[str] = field(default_factory=list)
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def stitch_extractions(parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge the extracted schemas of consecutive page chunks.
+
+    Objects are merged key by key, lists are concatenated in chunk order and
+    scalars keep the first non-empty value.
+    """
+    stitched: Dict[str, Any] = {}
+    for part in parts:
+        for key, value in part.items():
+            current = stitched.get(key)
+            if _is_empty(current):
+                stitched[key] = value
+            elif isinstance(current, dict) and isinstance(value, dict):
+                stitched[key] = stitch_extractions([current, value])
+            elif isinstance(current, list) and isinstance(value, list):
+                stitched[key] = current + value
+    return stitched
+
+
+def split_pdf(pdf: Path | bytes, chunk_pages: int) -> List[Path | bytes]:
+    """Split a PDF into documents of at most `chunk_pages` pages.
+
+    A PDF that is short enough is returned as given, in a one-item list.
+    """
+    if isinstance(pdf, Path):
+        doc = fitz.open(str(pdf))
+    else:
+        doc = fitz.open(stream=pdf, filetype="pdf")
+    with doc:
+        if doc.page_count <= chunk_pages:
+            return [pdf]
+        chunks = []
+        for start in range(0, doc.page_count, chunk_pages):
+            with fitz.open() as chunk:
+                chunk.insert_pdf(doc, from_page=start, to_page=start + chunk_pages - 1)
+                buffer = io.BytesIO()
+                chunk.save(buffer, garbage=3, deflate=True)
+                chunks.append(buffer.getvalue())
+        return chunks
+
+
+class LandingAIClient:
+    """Submits PDFs to Landing AI and polls the jobs without blocking."""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = BASE_URL,
+        poll_policy: Optional[PollPolicy] = None,
+        max_inflight_jobs: int = 8,
+        chunk_pages: int = 0,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 600.0,
+        max_retries: int = 3,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.api_key = api_key
+        self.base_url = base_url
+        self.poll_policy = poll_policy or PollPolicy()
+        self.max_inflight_jobs = max(max_inflight_jobs, 1)
+        self.chunk_pages = chunk_pages
+        self.max_retries = max_retries
+        # `read_timeout` bounds status polls; the synchronous extraction POST
+        # may legitimately run for as long as the document takes.
+        self._timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self._submit_timeout = httpx.Timeout(None, connect=connect_timeout)
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # The httpx client and the semaphore are bound to the loop they were
+        # first used on; a new loop (another asyncio.run) gets fresh ones.
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                headers={"Authorization": f"Basic {self.api_key}"},
+                timeout=self._timeout,
+                transport=self._transport,
+            )
+            self._slots = asyncio.Semaphore(self.max_inflight_jobs)
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    async def __aenter__(self) -> "LandingAIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def extract(
+        self,
+        pdf: Path | bytes,
+        schema: Dict[str, Any],
+        name: Optional[str] = None,
+        chunk_pages: Optional[int] = None,
+    ) -> ExtractionResult:
+        """Extract `schema` from a PDF given as a path or as bytes."""
+        if isinstance(pdf, Path):
+            name = name or pdf.name
+        else:
+            name = name or "document.pdf"
+        chunk_pages = self.chunk_pages if chunk_pages is None else chunk_pages
+        chunks = [pdf]
+        if chunk_pages > 0:
+            chunks = await asyncio.to_thread(split_pdf, pdf, chunk_pages)
+        if len(chunks) == 1:
+            return await self._extract_document(name, pdf, schema)
+
+        logger.info("LandingAI: submitting %s as %d chunks", name, len(chunks))
+        stem = Path(name).stem
+        results = await asyncio.gather(
+            *(
+                self._extract_document(f"{stem}_part{number}.pdf", chunk, schema)
+                for number, chunk in enumerate(chunks, start=1)
+            )
+        )
+        return ExtractionResult(
+            extracted=stitch_extractions([result.extracted for result in results]),
+            status=(
+                "partial"
+                if any(result.status == "partial" for result in results)
+                else "success"
+            ),
+            logs=[line for result in results for line in result.logs],
+        )
+
+    async def _extract_document(
+        self, name: str, content: Path | bytes, schema: Dict[str, Any]
+    ) -> ExtractionResult:
+        client = self._get_client()
+        async with self._slots:
+            logger.info("LandingAI: submitting %s", name)
+            # Files on disk are streamed into the multipart body.
+            handle = None
+            if isinstance(content, Path):
+                handle = await asyncio.to_thread(content.open, "rb")
+            try:
+                resp = await client.post(
+                    self.base_url,
+                    files={"pdf": (name, handle or content, "application/pdf")},
+                    data={"fields_schema": json.dumps(schema)},
+                    timeout=self._submit_timeout,
+                )
+            except httpx.HTTPError as exc:
+                raise LandingAIError(
+                    f"Initial Landing AI request failed for {name}: {exc}"
+                ) from exc
+            finally:
+                if handle is not None:
+                    handle.close()
+
+            if resp.status_code == 202:
+                status_url = resp.headers.get("Location")
+                if not status_url:
+                    raise LandingAIError(
+                        f"{name}: Landing AI accepted the job without a Location header"
+                    )
+                body = await self._poll(name, status_url)
+            elif resp.status_code in (200, 206):
+                body = resp.json()
+            else:
+                raise LandingAIError(
+                    f"{name}: Landing AI error {resp.status_code}: {resp.text[:300]}"
+                )
+            return self._result(name, resp.status_code, body)
+
+    async def _poll(self, name: str, status_url: str) -> Dict[str, Any]:
+        client = self._get_client()
+        retries = 0
+        for delay in self.poll_policy.delays():
+            await asyncio.sleep(delay)
+            try:
+                resp = await client.get(status_url)
+                resp.raise_for_status()
+                body = resp.json()
+            except (httpx.HTTPError, ValueError) as exc:
+                retries += 1
+                if retries > self.max_retries:
+                    raise LandingAIError(
+                        f"{name}: Landing AI polling failed: {exc}"
+                    ) from exc
+                continue
+            if body.get("status") != "processing":
+                return body
+            logger.debug("LandingAI: %s still processing", name)
+        raise LandingAIError(
+            f"{name}: Landing AI job not finished after "
+            f"{self.poll_policy.max_wait:.0f}s"
+        )
+
+    def _result(
+        self, name: str, status_code: int, body: Dict[str, Any]
+    ) -> ExtractionResult:
+        data = body.get("data") or {}
+        if status_code == 206 and "data" in body and "status" not in body:
+            body["status"] = "partial"
+        if "status" not in body and data.get("extracted_schema") is not None:
+            body["status"] = "success"
+
+        if "status" not in body:
+            OUTPUT_DIR.mkdir(exist_ok=True)
+            debug_file = OUTPUT_DIR / f"{Path(name).stem}_error.json"
+            debug_file.write_text(json.dumps(body, indent=2, ensure_ascii=False))
+            err_msg = (body.get("error") or {}).get("message", "<no message>")
+            raise LandingAIError(
+                f"{name}: unexpected Landing AI response ({status_code}) – "
+                f"{err_msg}; saved to {debug_file}"
+            )
+        if body["status"] not in FINAL_STATUSES:
+            raise LandingAIError(f"{name}: Landing AI returned status {body['status']}")
+
+        return ExtractionResult(
+            extracted=data.get("extracted_schema") or {},
+            status=body["status"],
+            logs=list(body.get("logs") or data.get("logs") or []),
+        )
+
+
+_landing_ai_client: Optional[LandingAIClient] = None
+
+
+def get_landing_ai_client() -> LandingAIClient:
+    """Process-wide Landing AI client configured from settings.
+
+    Safe to share across event loops: the HTTP client and the in-flight
+    semaphore are recreated on the first call from a new loop.
+    """
+    global _landing_ai_client  # pylint: disable=global-statement
+    if _landing_ai_client is None:
+        settings = get_settings()
+        _landing_ai_client = LandingAIClient(
+            api_key=settings.landing_ai_api_key or "",
+            base_url=settings.landing_ai_base_url,
+            poll_policy=PollPolicy(
+                initial_interval=settings.landing_ai_poll_initial_seconds,
+                max_interval=settings.landing_ai_poll_max_interval_seconds,
+                max_wait=settings.landing_ai_poll_max_wait_seconds,
+            ),
+            max_inflight_jobs=settings.landing_ai_max_inflight_jobs,
+            chunk_pages=settings.landing_ai_chunk_pages,
+        )
+    return _landing_ai_client
@@ -1,23 +1,37 @@
 """Shared Neo4j connector utilities."""
 
+import time
+from collections import defaultdict
 from contextlib import contextmanager
-from typing import Any, Dict, List
-
-from neo4j import GraphDatabase
+from typing import Any, Dict, Iterable, List, Tuple
 
 from src.config.settings import get_settings
+from src.utils.graph_diff import (
+    GraphDiff,
+    ensure_manifest_constraint,
+    fingerprint,
+    node_key,
+    read_fingerprints,
+    split_key,
+    write_fingerprints,
+)
+from src.utils.log import logger
+from src.utils.neo4j_connector import get_driver
 
 settings = get_settings()
 
-_driver = GraphDatabase.driver(
-    settings.neo4j_uri,
-    auth=(settings.neo4j_user, settings.neo4j_password),
-)
+# (database, label) pairs whose `id` uniqueness constraint already exists.
+_constrained_labels: set[Tuple[str | None, str]] = set()
+
+# (relationship type, start label, end label); labels are None for endpoints
+# outside the payload.
+RelShape = Tuple[str, str | None, str | None]
 
 
 @contextmanager
 def neo4j_session(database: str | None = None):
-    session = _driver.session(database=database)
+    driver = get_driver(settings.neo4j_uri, settings.neo4j_user, settings.neo4j_password)
+    session = driver.session(database=database)
     try:
         yield session
     finally:
@@ -60,20 +74,398 @@ def _merge_relationships(session, rels: List[Dict[str, Any]]):
         )
 
 
-async def ingest_adm(adm: Dict[str, Any], database: str | None = None) -> Dict[str, Any]:
-    """Persist graph payload (nodes + relationships) into Neo4j."""
-    nodes = adm.get("nodes", []) if isinstance(adm, dict) else []
-    rels = adm.get("relationships", []) if isinstance(adm, dict) else []
+def _ensure_id_constraints(session, database: str | None, labels: Iterable[str]) -> None:
+    """Create `id` uniqueness constraints (and their backing index) once per label."""
+    for label in sorted(set(labels)):
+        if (database, label) in _constrained_labels:
+            continue
+        session.run(
+            f"CREATE CONSTRAINT IF NOT EXISTS FOR (n:`{label}`) REQUIRE n.id IS UNIQUE"
+        )
+        _constrained_labels.add((database, label))
+
+
+def _node_pattern(alias: str, label: str | None, key: str) -> str:
+    # Endpoints that are not part of the payload keep the unlabelled lookup.
+    if label:
+        return f"({alias}:`{label}` {{id: row.{key}}})"
+    return f"({alias} {{id: row.{key}}})"
+
+
+def _write_batch(session, query: str, rows: List[Dict[str, Any]], **params) -> float:
+    started = time.perf_counter()
+    with session.begin_transaction() as tx:
+        tx.run(query, rows=rows, **params).consume()
+        tx.commit()
+    return time.perf_counter() - started
+
+
+def _add_scope(alias: str) -> str:
+    return (
+        f"{alias}.ingestScopes = "
+        f"[s IN coalesce({alias}.ingestScopes, []) WHERE s <> $scope] + $scope"
+    )
+
+
+def _drop_scope(alias: str) -> str:
+    return (
+        f"{alias}.ingestScopes = "
+        f"[s IN coalesce({alias}.ingestScopes, []) WHERE s <> $scope]"
+    )
+
+
+class _BulkWriter:
+    """Buffers rows per node label and relationship shape; writes full UNWIND batches.
+
+    Rows may arrive in any number of chunks. A relationship batch whose endpoints
+    are still buffered waits for them (up to `DEFERRED_BATCHES` batches) rather
+    than forcing partial node batches out, and is never written before them.
+    With a diff `scope`, written nodes and relationships are tagged with it.
+    """
+
+    DEFERRED_BATCHES = 8
 
-    def _run_transaction(nodes_payload: List[Dict[str, Any]], rel_payload: List[Dict[str, Any]]):
+    def __init__(
+        self,
+        session,
+        database: str | None,
+        batch_size: int,
+        scope: str | None = None,
+    ) -> None:
+        self.session = session
+        self.scope = scope
+        self.params = {"scope": scope} if scope else {}
+        self.database = database
+        self.batch_size = batch_size
+        self.label_of: Dict[str, str] = {}
+        self.pending: set[str] = set()  # ids of buffered, unwritten nodes
+        self.nodes: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.rels: Dict[RelShape, List[Dict[str, Any]]] = defaultdict(list)
+        self.batches: List[Dict[str, Any]] = []
+        self.nodes_ingested = 0
+        self.relationships_ingested = 0
+
+    def add_nodes(self, nodes: Iterable[Dict[str, Any]]) -> None:
+        for node in nodes:
+            node_id = node.get("id")
+            if not node_id:
+                continue
+            label = _sanitize_label(node.get("label", "Asset"))
+            props = {k: v for k, v in node.items() if k not in {"label"}}
+            self.label_of[node_id] = label
+            self.pending.add(node_id)
+            rows = self.nodes[label]
+            rows.append({"id": node_id, "props": props})
+            if len(rows) >= self.batch_size:
+                self._flush_nodes(label)
+
+    def add_relationships(self, rels: Iterable[Dict[str, Any]]) -> None:
+        for rel in rels:
+            start = rel.get("start")
+            end = rel.get("end")
+            if not start or not end:
+                continue
+            rel_type = _sanitize_label(rel.get("type", "RELATED_TO"))
+            props = {k: v for k, v in rel.items() if k not in {"start", "end", "type"}}
+            shape = (rel_type, self.label_of.get(start), self.label_of.get(end))
+            rows = self.rels[shape]
+            rows.append({"start": start, "end": end, "props": props})
+            if len(rows) % self.batch_size == 0:
+                deferred_batches = len(rows) // self.batch_size
+                self._flush_rels(shape, force=deferred_batches >= self.DEFERRED_BATCHES)
+
+    def _flush_nodes(self, label: str) -> None:
+        rows = self.nodes.pop(label, None)
+        if not rows:
+            return
+        _ensure_id_constraints(self.session, self.database, [label])
+        query = f"UNWIND $rows AS row MERGE (n:`{label}` {{id: row.id}}) SET n += row.props"
+        if self.scope:
+            query += f", {_add_scope('n')}"
+        elapsed = _write_batch(self.session, query, rows, **self.params)
+        self.pending.difference_update(row["id"] for row in rows)
+        self.batches.append({"kind": "nodes", "name": label, "size": len(rows), "seconds": elapsed})
+        self.nodes_ingested += len(rows)
+        logger.info("neo4j bulk: %d %s nodes in %.3fs", len(rows), label, elapsed)
+
+    def _flush_rels(self, shape: RelShape, force: bool = True) -> None:
+        rows = self.rels.get(shape)
+        if not rows:
+            return
+        waiting_on = {
+            self.label_of[node_id]
+            for row in rows
+            for node_id in (row["start"], row["end"])
+            if node_id in self.pending
+        }
+        if waiting_on and not force:
+            return
+        for label in waiting_on:
+            self._flush_nodes(label)
+        del self.rels[shape]
+
+        rel_type, start_label, end_label = shape
+        query = (
+            f"UNWIND $rows AS row "
+            f"MATCH {_node_pattern('s', start_label, 'start')} "
+            f"MATCH {_node_pattern('e', end_label, 'end')} "
+            f"MERGE (s)-[r:`{rel_type}`]->(e) SET r += row.props"
+        )
+        if self.scope:
+            query += f", {_add_scope('r')}"
+        for offset in range(0, len(rows), self.batch_size):
+            chunk = rows[offset : offset + self.batch_size]
+            elapsed = _write_batch(self.session, query, chunk, **self.params)
+            self.batches.append({"kind": "relationships", "name": rel_type, "size": len(chunk), "seconds": elapsed})
+            self.relationships_ingested += len(chunk)
+            logger.info("neo4j bulk: %d %s relationships in %.3fs", len(chunk), rel_type, elapsed)
+
+    def close(self) -> Dict[str, Any]:
+        for label in list(self.nodes):
+            self._flush_nodes(label)
+        for shape in list(self.rels):
+            self._flush_rels(shape)
+        return {
+            "nodes_ingested": self.nodes_ingested,
+            "relationships_ingested": self.relationships_ingested,
+            "batches": self.batches,
+        }
+
+
+async def ingest_graph_batches(
+    batches: Iterable[Dict[str, Any]],
+    database: str | None = None,
+    bulk: bool | None = None,
+    batch_size: int | None = None,
+) -> Dict[str, Any]:
+    """Persist graph payload batches into Neo4j as they are produced.
+
+    `batches` is consumed lazily in the worker thread, so writing starts with the
+    first batch while a generator is still building the rest. Each batch is a
+    ``{"nodes": [...], "relationships": [...]}`` dict whose relationships only
+    reference nodes of the same or an earlier batch.
+
+    With ``bulk`` (default from ``NEO4J_BULK_INGEST``) nodes are grouped by label and
+    relationships by type, then written as ``UNWIND`` batches of ``batch_size`` rows.
+    """
+    bulk = settings.neo4j_bulk_ingest if bulk is None else bulk
+    batch_size = max(1, batch_size or settings.neo4j_batch_size)
+
+    def _run_transaction():
         with neo4j_session(database) as session:
-            _merge_nodes(session, nodes_payload)
-            _merge_relationships(session, rel_payload)
+            if bulk:
+                writer = _BulkWriter(session, database, batch_size)
+                for batch in batches:
+                    writer.add_nodes(batch.get("nodes", []))
+                    writer.add_relationships(batch.get("relationships", []))
+                return writer.close()
+            node_count = rel_count = 0
+            for batch in batches:
+                nodes_payload = batch.get("nodes", [])
+                rel_payload = batch.get("relationships", [])
+                _merge_nodes(session, nodes_payload)
+                _merge_relationships(session, rel_payload)
+                node_count += len(nodes_payload)
+                rel_count += len(rel_payload)
+        return {"nodes_ingested": node_count, "relationships_ingested": rel_count}
+
+    from anyio.to_thread import run_sync
+
+    return await run_sync(_run_transaction)
+
+
+def _run_rows(session, query: str, rows: List[Any], batch_size: int, **params) -> None:
+    for offset in range(0, len(rows), batch_size):
+        _write_batch(session, query, rows[offset : offset + batch_size], **params)
+
+
+class _DiffPayload:
+    """Payload nodes keyed by ``"<label>:<id>"`` and relationships by start id."""
+
+    def __init__(self, batches: Iterable[Dict[str, Any]]) -> None:
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.label_of: Dict[str, str] = {}
+        self.outgoing: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for batch in batches:
+            for node in batch.get("nodes", []):
+                node_id = node.get("id")
+                if not node_id:
+                    continue
+                label = _sanitize_label(node.get("label", "Asset"))
+                self.label_of[node_id] = label
+                self.nodes[node_key(label, node_id)] = node
+            for rel in batch.get("relationships", []):
+                if rel.get("start") and rel.get("end"):
+                    self.outgoing[rel["start"]].append(rel)
+        self.rel_types = sorted(
+            {_rel_type(rel) for rels in self.outgoing.values() for rel in rels}
+        )
+
+    def fingerprints(self) -> Dict[str, str]:
+        """A node's fingerprint covers its properties and its outgoing relationships."""
+
+        def _edge_order(rel: Dict[str, Any]) -> Tuple[str, str]:
+            return str(rel.get("type")), str(rel["end"])
+
         return {
-            "nodes_ingested": len(nodes_payload),
-            "relationships_ingested": len(rel_payload),
+            key: fingerprint(
+                [node, sorted(self.outgoing.get(node["id"], []), key=_edge_order)]
+            )
+            for key, node in self.nodes.items()
         }
 
+    def parents_of(self, node_ids: set) -> set:
+        return {
+            node_key(self.label_of[start], start)
+            for start, rels in self.outgoing.items()
+            if start in self.label_of and any(rel["end"] in node_ids for rel in rels)
+        }
+
+
+def _rel_type(rel: Dict[str, Any]) -> str:
+    return _sanitize_label(rel.get("type", "RELATED_TO"))
+
+
+def _ids_by_label(keys: Iterable[str]) -> Dict[str, List[str]]:
+    by_label: Dict[str, List[str]] = defaultdict(list)
+    for key in keys:
+        label, node_id = split_key(key)
+        by_label[label].append(node_id)
+    return by_label
+
+
+def _diff_release(session, payload, diff, scope: str, batch_size: int) -> None:
+    """Withdraw `scope` from what it no longer writes; delete what nobody owns.
+
+    Node ids are global, so other scopes may share a node or edge. Only
+    entries tagged with no remaining scope are deleted. Untagged entries,
+    written before scopes were recorded, are treated as this scope's own.
+    """
+    owned = "(r.ingestScopes IS NULL OR $scope IN r.ingestScopes)"
+    for label, ids in _ids_by_label(diff.deleted).items():
+        _run_rows(
+            session,
+            f"UNWIND $rows AS id MATCH (n:`{label}` {{id: id}})-[r]->() "
+            f"WHERE type(r) IN $types AND {owned} SET {_drop_scope('r')} "
+            "WITH r WHERE size(r.ingestScopes) = 0 DELETE r",
+            ids,
+            batch_size,
+            scope=scope,
+            types=payload.rel_types,
+        )
+        _run_rows(
+            session,
+            f"UNWIND $rows AS id MATCH (n:`{label}` {{id: id}}) SET {_drop_scope('n')} "
+            "WITH n WHERE size(n.ingestScopes) = 0 DETACH DELETE n",
+            ids,
+            batch_size,
+            scope=scope,
+        )
+
+    # Outgoing payload edges of updated nodes that the new payload no longer has.
+    stale_by_label: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for label, ids in _ids_by_label(diff.updated).items():
+        for node_id in ids:
+            rels = payload.outgoing.get(node_id, [])
+            keep = [[_rel_type(rel), rel["end"]] for rel in rels]
+            stale_by_label[label].append({"id": node_id, "keep": keep})
+    for label, rows in stale_by_label.items():
+        _run_rows(
+            session,
+            f"UNWIND $rows AS row MATCH (s:`{label}` {{id: row.id}})-[r]->(e) "
+            f"WHERE type(r) IN $types AND NOT [type(r), e.id] IN row.keep "
+            f"AND {owned} SET {_drop_scope('r')} "
+            "WITH r WHERE size(r.ingestScopes) = 0 DELETE r",
+            rows,
+            batch_size,
+            scope=scope,
+            types=payload.rel_types,
+        )
+
+
+def _diff_upsert(session, database, payload, diff, scope: str, batch_size: int):
+    """Merge inserted and updated nodes with their outgoing relationships."""
+    changed = set(diff.inserted) | set(diff.updated)
+    # A relabelled node loses its incoming edges, so rewrite its parents.
+    relabelled = {split_key(key)[1] for key in diff.deleted} & payload.label_of.keys()
+    if relabelled:
+        changed |= payload.parents_of(relabelled)
+    writer = _BulkWriter(session, database, batch_size, scope)
+    writer.label_of.update(payload.label_of)
+    writer.add_nodes(payload.nodes[key] for key in changed)
+    writer.add_relationships(
+        rel
+        for key in changed
+        for rel in payload.outgoing.get(payload.nodes[key]["id"], [])
+    )
+    return writer.close()
+
+
+def _diff_ingest(
+    session,
+    database: str | None,
+    batches: Iterable[Dict[str, Any]],
+    scope: str,
+    batch_size: int,
+    dry_run: bool,
+) -> Dict[str, Any]:
+    payload = _DiffPayload(batches)
+    current = payload.fingerprints()
+    ensure_manifest_constraint(session, database)
+    diff = GraphDiff.compute(read_fingerprints(session, scope), current)
+    summary = {**diff.summary(dry_run), "relationships_written": 0}
+    if dry_run or not diff.changed:
+        logger.info("neo4j diff %s: %s", scope, summary)
+        return summary
+
+    _diff_release(session, payload, diff, scope, batch_size)
+    written = _diff_upsert(session, database, payload, diff, scope, batch_size)
+    write_fingerprints(session, scope, current)
+    summary["relationships_written"] = written["relationships_ingested"]
+    summary["batches"] = written["batches"]
+    logger.info(
+        "neo4j diff %s: %s", scope, {k: v for k, v in summary.items() if k != "batches"}
+    )
+    return summary
+
+
+async def ingest_graph_diff(
+    batches: Iterable[Dict[str, Any]],
+    scope: str,
+    database: str | None = None,
+    batch_size: int | None = None,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """Write only what changed since the last diff ingestion of `scope`.
+
+    Fingerprints of the payload's nodes (properties plus outgoing relationships)
+    are compared with the manifest stored for `scope` (see `src.utils.graph_diff`).
+    Inserted and updated nodes are merged with their outgoing relationships as in
+    bulk mode and tagged with `scope`. Nodes and edges the payload no longer has
+    lose the tag and are deleted once no scope owns them, and the new manifest is
+    stored. An unchanged payload costs the single manifest query. With `dry_run`
+    only the summary of what would change is returned.
+    """
+    batch_size = max(1, batch_size or settings.neo4j_batch_size)
+
+    def _run_transaction():
+        with neo4j_session(database) as session:
+            return _diff_ingest(session, database, batches, scope, batch_size, dry_run)
+
     from anyio.to_thread import run_sync
 
-    return await run_sync(_run_transaction, nodes, rels)
+    return await run_sync(_run_transaction)
+
+
+async def ingest_adm(
+    adm: Dict[str, Any],
+    database: str | None = None,
+    bulk: bool | None = None,
+    batch_size: int | None = None,
+) -> Dict[str, Any]:
+    """Persist graph payload (nodes + relationships) into Neo4j.
+
+    See `ingest_graph_batches`; this writes one complete payload.
+    """
+    payload = adm if isinstance(adm, dict) else {}
+    return await ingest_graph_batches([payload], database, bulk, batch_size)
@@ -1,19 +1,45 @@
 """PDF utilities used by datasheet agents."""
 
+import os
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional
 
-import fitz  # pymupdf
+from src.utils.rasterizer import PageRasterizer, get_rasterizer
 
 
-def pdf_to_images(pdf_bytes: bytes, output_dir: Path) -> List[Path]:
+@contextmanager
+def spooled_pdf(pdf_bytes: bytes) -> Iterator[Path]:
+    """Write PDF bytes to a temporary file that rasterizer workers can open."""
+    fd, name = tempfile.mkstemp(suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(pdf_bytes)
+        yield Path(name)
+    finally:
+        os.unlink(name)
+
+
+def iter_pdf_images(
+    pdf_path: Path,
+    output_dir: Path,
+    rasterizer: Optional[PageRasterizer] = None,
+) -> Iterator[Path]:
+    """Render every page to `output_dir`, yielding each image path as it completes."""
+    rasterizer = rasterizer or get_rasterizer()
     output_dir.mkdir(parents=True, exist_ok=True)
-    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-    image_paths = []
-    for page_index in range(doc.page_count):
-        page = doc.load_page(page_index)
-        pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))
-        image_path = output_dir / f"page-{page_index+1}.png"
-        pix.pil_save(image_path)
-        image_paths.append(image_path)
-    return image_paths
+    for page in rasterizer.iter_pages(pdf_path):
+        image_path = output_dir / f"page-{page.index+1}.{page.image_format}"
+        image_path.write_bytes(page.data)
+        yield image_path
+
+
+def pdf_to_images(
+    pdf_bytes: bytes,
+    output_dir: Path,
+    rasterizer: Optional[PageRasterizer] = None,
+) -> List[Path]:
+    with spooled_pdf(pdf_bytes) as pdf_path:
+        image_paths = list(iter_pdf_images(pdf_path, output_dir, rasterizer))
+    return sorted(image_paths, key=lambda path: int(path.stem.split("-")[1]))
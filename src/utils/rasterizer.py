@@ -0,0 +1,199 @@
+"""Multi-process PDF page rasterizer.
+
+Pages are rendered by a process pool whose workers open the PDF from its
+path themselves (and keep it open for the next page), so only page numbers
+and encoded images cross process boundaries. Pages are handed to the caller
+as they complete, and at most ``max_inflight_pages`` pages are being
+rendered or waiting to be consumed at any time.
+"""
+
+import asyncio
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Callable, Iterable, Iterator, Optional, Set
+
+import fitz  # pymupdf
+
+from src.config.settings import get_settings
+
+PDF_POINTS_PER_INCH = 72
+IMAGE_FORMATS = {"png": "PNG", "webp": "WEBP", "jpeg": "JPEG", "jpg": "JPEG"}
+
+
+@dataclass(frozen=True)
+class RasterOptions:
+    """Resolution and encoding of rendered pages."""
+
+    dpi: int = 144
+    image_format: str = "png"
+    quality: int = 85
+
+    def __post_init__(self) -> None:
+        if self.image_format.lower() not in IMAGE_FORMATS:
+            raise ValueError(
+                f"Unsupported image format {self.image_format!r}; "
+                f"expected one of {sorted(IMAGE_FORMATS)}"
+            )
+
+    @property
+    def extension(self) -> str:
+        image_format = self.image_format.lower()
+        return "jpg" if image_format == "jpeg" else image_format
+
+
+@dataclass(frozen=True)
+class RasterizedPage:
+    index: int
+    data: bytes
+    width: int
+    height: int
+    image_format: str
+
+
+# Per worker process: the document opened last, keyed by path and mtime.
+_open_document: tuple = (None, None)
+
+
+def _document(pdf_path: str) -> "fitz.Document":
+    global _open_document  # pylint: disable=global-statement
+    key = (pdf_path, os.stat(pdf_path).st_mtime_ns)
+    cached_key, doc = _open_document
+    if cached_key != key:
+        if doc is not None:
+            doc.close()
+        doc = fitz.open(pdf_path)
+        _open_document = (key, doc)
+    return doc
+
+
+def render_page(pdf_path: str, index: int, options: RasterOptions) -> RasterizedPage:
+    """Render one page (0-based) of the PDF at `pdf_path`."""
+    page = _document(pdf_path).load_page(index)
+    zoom = options.dpi / PDF_POINTS_PER_INCH
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+    image_format = IMAGE_FORMATS[options.image_format.lower()]
+    if image_format == "PNG":
+        data = pix.pil_tobytes(format=image_format)
+    else:
+        data = pix.pil_tobytes(format=image_format, quality=options.quality)
+    return RasterizedPage(index, data, pix.width, pix.height, options.extension)
+
+
+def page_count(pdf_path: Path | str) -> int:
+    with fitz.open(str(pdf_path)) as doc:
+        return doc.page_count
+
+
+class PageRasterizer:
+    """Renders PDF pages on a reusable process pool and streams them back."""
+
+    def __init__(
+        self,
+        workers: int = 4,
+        options: Optional[RasterOptions] = None,
+        max_inflight_pages: int = 16,
+    ) -> None:
+        self.workers = max(workers, 1)
+        self.options = options or RasterOptions()
+        self.max_inflight_pages = max(max_inflight_pages, 1)
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def _indexes(self, pdf_path: str, pages: Optional[Iterable[int]]) -> Iterator[int]:
+        return iter(pages if pages is not None else range(page_count(pdf_path)))
+
+    def _submit(
+        self,
+        pdf_path: str,
+        indexes: Iterator[int],
+        pending: Set,
+        wrap: Callable[[Future], object] = lambda future: future,
+    ) -> None:
+        """Top `pending` up to the in-flight ceiling."""
+        pool = self._get_pool()
+        while len(pending) < self.max_inflight_pages:
+            index = next(indexes, None)
+            if index is None:
+                return
+            pending.add(wrap(pool.submit(render_page, pdf_path, index, self.options)))
+
+    def iter_pages(
+        self, pdf_path: Path | str, pages: Optional[Iterable[int]] = None
+    ) -> Iterator[RasterizedPage]:
+        """Yield rendered pages in completion order."""
+        pdf_path = str(pdf_path)
+        indexes = self._indexes(pdf_path, pages)
+        if self.workers == 1:
+            for index in indexes:
+                yield render_page(pdf_path, index, self.options)
+            return
+        pending: Set[Future] = set()
+        try:
+            self._submit(pdf_path, indexes, pending)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+                self._submit(pdf_path, indexes, pending)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def stream_pages(
+        self, pdf_path: Path | str, pages: Optional[Iterable[int]] = None
+    ) -> AsyncIterator[RasterizedPage]:
+        """Async variant of `iter_pages` that never blocks the event loop."""
+        pdf_path = str(pdf_path)
+        if pages is None:
+            pages = range(await asyncio.to_thread(page_count, pdf_path))
+        indexes = iter(pages)
+        if self.workers == 1:
+            for index in indexes:
+                yield await asyncio.to_thread(
+                    render_page, pdf_path, index, self.options
+                )
+            return
+        pending: Set[asyncio.Future] = set()
+        try:
+            self._submit(pdf_path, indexes, pending, asyncio.wrap_future)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield future.result()
+                self._submit(pdf_path, indexes, pending, asyncio.wrap_future)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+_rasterizer: Optional[PageRasterizer] = None
+
+
+def get_rasterizer() -> PageRasterizer:
+    """Process-wide rasterizer configured from settings."""
+    global _rasterizer  # pylint: disable=global-statement
+    if _rasterizer is None:
+        settings = get_settings()
+        _rasterizer = PageRasterizer(
+            workers=settings.rasterizer_workers,
+            options=RasterOptions(
+                dpi=settings.rasterizer_dpi,
+                image_format=settings.rasterizer_format,
+                quality=settings.rasterizer_quality,
+            ),
+            max_inflight_pages=settings.rasterizer_max_inflight_pages,
+        )
+    return _rasterizer
@@ -0,0 +1,101 @@
+"""Documents spooled to disk and handed between agents by reference.
+
+A `SpooledDocument` is a file on disk plus its size and SHA-256, which are
+computed while the upload is streamed in. Agents open their own lazy views
+(`open`, `iter_chunks`, `open_pdf`) instead of passing the content around
+as bytes, so memory per in-flight document stays at a few chunk buffers
+no matter how large the PDF is.
+"""
+
+import asyncio
+import hashlib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Iterator, Optional
+
+import fitz  # pymupdf
+
+CHUNK_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class SpooledDocument:
+    path: Path
+    filename: str
+    size: int
+    sha256: str
+
+    @classmethod
+    async def from_upload(
+        cls, upload, path: Path, filename: Optional[str] = None
+    ) -> "SpooledDocument":
+        """Stream a FastAPI `UploadFile` (or any async ``read(n)``) to `path`."""
+        filename = filename or getattr(upload, "filename", None) or path.name
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with await asyncio.to_thread(path.open, "wb") as target:
+                while chunk := await upload.read(CHUNK_BYTES):
+                    digest.update(chunk)
+                    size += len(chunk)
+                    await asyncio.to_thread(target.write, chunk)
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+        return cls(path, filename, size, digest.hexdigest())
+
+    @classmethod
+    def from_file(
+        cls, source: BinaryIO, path: Path, filename: str
+    ) -> "SpooledDocument":
+        """Copy a readable binary stream to `path` in chunks."""
+        digest = hashlib.sha256()
+        size = 0
+        with path.open("wb") as target:
+            while chunk := source.read(CHUNK_BYTES):
+                digest.update(chunk)
+                size += len(chunk)
+                target.write(chunk)
+        return cls(path, filename, size, digest.hexdigest())
+
+    @classmethod
+    def from_path(cls, path: Path, filename: Optional[str] = None) -> "SpooledDocument":
+        """Reference a file that is already on disk (hashes it in chunks)."""
+        digest = hashlib.sha256()
+        size = 0
+        with path.open("rb") as source:
+            while chunk := source.read(CHUNK_BYTES):
+                digest.update(chunk)
+                size += len(chunk)
+        return cls(path, filename or path.name, size, digest.hexdigest())
+
+    @classmethod
+    def from_bytes(
+        cls, content: bytes, path: Path, filename: Optional[str] = None
+    ) -> "SpooledDocument":
+        path.write_bytes(content)
+        digest = hashlib.sha256(content).hexdigest()
+        return cls(path, filename or path.name, len(content), digest)
+
+    def open(self) -> BinaryIO:
+        return self.path.open("rb")
+
+    async def iter_chunks(self, chunk_bytes: int = CHUNK_BYTES) -> AsyncIterator[bytes]:
+        """Read the file in chunks without blocking the event loop."""
+        with self.open() as source:
+            while chunk := await asyncio.to_thread(source.read, chunk_bytes):
+                yield chunk
+
+    async def read_bytes(self) -> bytes:
+        """The whole content; only for consumers that cannot stream."""
+        return await asyncio.to_thread(self.path.read_bytes)
+
+    @contextmanager
+    def open_pdf(self) -> Iterator["fitz.Document"]:
+        """Open with PyMuPDF, which reads the file on demand."""
+        doc = fitz.open(str(self.path))
+        try:
+            yield doc
+        finally:
+            doc.close()
@@ -0,0 +1,63 @@
+"""Per-stage concurrency limits and progress for batch-scheduled documents.
+
+Agents wrap each external step in ``async with stage("vision"):``. Outside
+a batch this does nothing. A batch worker calls `bind_stage_context` before
+running a document, after which every stage entered by that document's
+task reports its name to the worker's progress callback and waits for a
+slot in that stage's semaphore, so at most ``limits[name]`` documents of
+the batch are in the stage at once. Stages without a limit are unbounded.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Callable, Dict, Optional
+
+ProgressCallback = Callable[[str], None]
+
+
+class StageLimits:
+    """One semaphore per limited stage, shared by every worker of a pool."""
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None) -> None:
+        self.limits = {name: max(limit, 1) for name, limit in (limits or {}).items()}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def semaphore(self, name: str) -> Optional[asyncio.Semaphore]:
+        if name not in self.limits:
+            return None
+        if name not in self._semaphores:
+            self._semaphores[name] = asyncio.Semaphore(self.limits[name])
+        return self._semaphores[name]
+
+
+_limits: ContextVar[Optional[StageLimits]] = ContextVar("stage_limits", default=None)
+_progress: ContextVar[Optional[ProgressCallback]] = ContextVar(
+    "stage_progress", default=None
+)
+
+
+def bind_stage_context(
+    limits: Optional[StageLimits], progress: Optional[ProgressCallback] = None
+) -> None:
+    """Apply `limits` and `progress` to stages entered by the current task."""
+    _limits.set(limits)
+    _progress.set(progress)
+
+
+@asynccontextmanager
+async def stage(name: str) -> AsyncIterator[None]:
+    progress = _progress.get()
+    limits = _limits.get()
+    semaphore = limits.semaphore(name) if limits is not None else None
+    if semaphore is None:
+        if progress is not None:
+            progress(name)
+        yield
+        return
+    if progress is not None:
+        progress(f"waiting:{name}")
+    async with semaphore:
+        if progress is not None:
+            progress(name)
+        yield